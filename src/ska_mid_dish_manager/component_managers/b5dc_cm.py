@@ -12,6 +12,24 @@ from ska_mid_dish_dcp_lib.device.b5dc_device_mappings import (
 )
 
 from ska_mid_dish_manager.component_managers.tango_device_cm import TangoDeviceComponentManager
+from ska_mid_dish_manager.utils.schedulers import EventPriority
+
+# High-rate RF power and temperature telemetry for which only the latest value matters
+B5DC_COALESCED_ATTRIBUTES = (
+    "clkPhotodiodeCurrent",
+    "rfTemperature",
+    "rfcmPsuPcbTemperature",
+    "hPolRfPowerIn",
+    "hPolRfPowerOut",
+    "vPolRfPowerIn",
+    "vPolRfPowerOut",
+)
+
+# Connection events are processed ahead of queued RF telemetry
+B5DC_EVENT_PRIORITIES = {
+    "connectionState": EventPriority.HIGH,
+    **dict.fromkeys(B5DC_COALESCED_ATTRIBUTES, EventPriority.LOW),
+}
 
 
 class B5DCComponentManager(TangoDeviceComponentManager):
@@ -49,6 +67,9 @@ class B5DCComponentManager(TangoDeviceComponentManager):
             *args,
             communication_state_callback=communication_state_callback,
             component_state_callback=component_state_callback,
+            coalesced_attributes=kwargs.pop("coalesced_attributes", B5DC_COALESCED_ATTRIBUTES),
+            event_priorities=kwargs.pop("event_priorities", B5DC_EVENT_PRIORITIES),
+            track_lrcs=kwargs.pop("track_lrcs", True),
             **kwargs,
         )
         self._communication_state_lock = state_update_lock
@@ -1,13 +1,18 @@
 """A factory for creating and managing tango device proxies."""
 
 import logging
+import time
 from functools import wraps
-from threading import Event
+from threading import Event, Lock
 from typing import Any, Callable, Dict, Optional
 
 import tango
 
-from ska_mid_dish_manager.models.constants import DEVICE_PROXY_TIMEOUT_MS, OPERATOR_TAG
+from ska_mid_dish_manager.models.constants import (
+    DEVICE_LIVENESS_TTL_S,
+    DEVICE_PROXY_TIMEOUT_MS,
+    OPERATOR_TAG,
+)
 
 
 def retry_connection(func: Callable) -> Any:
@@ -80,21 +85,126 @@ def retry_connection(func: Callable) -> Any:
     return _wrapper
 
 
+class DeviceProxyPool:
+    """Device proxies shared by reference count, keyed by TRL, with the liveness of each device.
+
+    Everything in a device server talking to the same device can share one proxy, and so one
+    connection, through the process-wide pool returned by `instance`. A proxy is dropped from
+    the pool when its last user releases it.
+
+    Devices are known to be alive until a TTL after they last responded or sent a valid
+    event, so that their proxies can be used without pinging them first.
+    """
+
+    _instance: Optional["DeviceProxyPool"] = None
+    _instance_lock = Lock()
+
+    def __init__(self, liveness_ttl_s: float = DEVICE_LIVENESS_TTL_S):
+        """:param liveness_ttl_s: How long a device is known to be alive after it responded
+        :type liveness_ttl_s: float
+        """
+        self._liveness_ttl_s = liveness_ttl_s
+        self._lock = Lock()
+        self._proxies: Dict[str, tango.DeviceProxy] = {}
+        self._ref_counts: Dict[str, int] = {}
+        self._alive_until: Dict[str, float] = {}
+
+    @classmethod
+    def instance(cls) -> "DeviceProxyPool":
+        """Return the pool shared by the whole process."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @staticmethod
+    def _key(trl: str) -> str:
+        # TRLs are case insensitive
+        return trl.lower()
+
+    def acquire(
+        self, trl: str, create_proxy: Callable[[str], tango.DeviceProxy]
+    ) -> tango.DeviceProxy:
+        """Return the proxy to the device, creating it if it is not in the pool yet.
+
+        Each acquired proxy has to be released once it is no longer used.
+
+        :param trl: the address to the device
+        :type trl: str
+        :param create_proxy: Creates the proxy to the device at the trl
+        :type create_proxy: Callable[[str], tango.DeviceProxy]
+
+        :returns: the shared device proxy
+        """
+        key = self._key(trl)
+        with self._lock:
+            device_proxy = self._proxies.get(key)
+            if device_proxy is not None:
+                self._ref_counts[key] += 1
+                return device_proxy
+
+        # the proxy is created outside the lock as creating it can be retried for a while
+        device_proxy = create_proxy(trl)
+        with self._lock:
+            # keep the proxy created by another user in the meantime
+            device_proxy = self._proxies.setdefault(key, device_proxy)
+            self._ref_counts[key] = self._ref_counts.get(key, 0) + 1
+            return device_proxy
+
+    def release(self, trl: str) -> None:
+        """Release an acquired proxy, dropping it from the pool if it was the last user.
+
+        :param trl: the address to the device
+        :type trl: str
+        """
+        key = self._key(trl)
+        with self._lock:
+            if key not in self._ref_counts:
+                return
+            self._ref_counts[key] -= 1
+            if self._ref_counts[key] <= 0:
+                del self._ref_counts[key]
+                self._proxies.pop(key, None)
+                self._alive_until.pop(key, None)
+
+    def ref_count(self, trl: str) -> int:
+        """Return the number of users of the proxy to the device."""
+        return self._ref_counts.get(self._key(trl), 0)
+
+    def is_known_alive(self, trl: str) -> bool:
+        """Check if the device has responded recently enough to skip pinging it."""
+        return time.monotonic() < self._alive_until.get(self._key(trl), 0.0)
+
+    def mark_alive(self, trl: str) -> None:
+        """Record that the device responded, it is not pinged again until the TTL expires."""
+        self._alive_until[self._key(trl)] = time.monotonic() + self._liveness_ttl_s
+
+    def mark_unknown(self, trl: str) -> None:
+        """Record that the health of the device is unknown, it is pinged on its next use."""
+        self._alive_until.pop(self._key(trl), None)
+
+
 class DeviceProxyManager:
     """Manage tango.DeviceProxy with a connection to a device.
 
     Too many device proxy objects to the same device is unnecessary and probably
-    risky; i.e. any device proxy thread dying can crash the device server process
+    risky; i.e. any device proxy thread dying can crash the device server process.
+    The proxies are acquired from a DeviceProxyPool, pass the process-wide pool to
+    share them with other users of the same devices.
     """
 
     def __init__(
         self,
         logger: Optional[logging.Logger] = None,
         thread_event: Event | None = None,
+        proxy_pool: Optional[DeviceProxyPool] = None,
     ):
         self._device_proxies: Dict[str, tango.DeviceProxy] = {}
         self.logger = logger or logging.getLogger(__name__)
         self.event_signal = thread_event or Event()
+        # Devices are only pinged before their proxy is returned when the pool does not
+        # know them to be alive. Valid events and successful calls mark them alive.
+        self.proxy_pool = proxy_pool or DeviceProxyPool()
 
     def __del__(self) -> None:
         """Remove all device proxies when the object is deleted."""
@@ -102,27 +212,63 @@ class DeviceProxyManager:
 
     def __call__(self, trl: str) -> tango.DeviceProxy:
         device_proxy = self._device_proxies.get(trl)
+        if device_proxy is not None and self.is_known_alive(trl):
+            return device_proxy
 
         if device_proxy is None:
             self.logger.debug(f"Creating DeviceProxy to device at {trl}")
             try:
-                device_proxy = self._create_tango_device_proxy(trl)
+                device_proxy = self.proxy_pool.acquire(trl, self._create_tango_device_proxy)
             except (tango.DevFailed, RuntimeError):
                 self.logger.warning(
                     "Failed creating DeviceProxy to device at %s", trl, extra=OPERATOR_TAG
                 )
                 raise
             self._device_proxies[trl] = device_proxy
-
-        if not self._is_tango_device_running(device_proxy):
+            # another user of the pooled proxy may have found the device alive
+            if self.is_known_alive(trl):
+                device_proxy.set_timeout_millis(DEVICE_PROXY_TIMEOUT_MS)
+                return device_proxy
+
+        if self._is_tango_device_running(device_proxy):
+            self.mark_alive(trl)
+        else:
             try:
                 self.wait_for_device(device_proxy)
             except (tango.DevFailed, RuntimeError):
                 self.logger.warning("Device at %s is unresponsive.", trl, extra=OPERATOR_TAG)
+            else:
+                self.mark_alive(trl)
 
         device_proxy.set_timeout_millis(DEVICE_PROXY_TIMEOUT_MS)
         return device_proxy
 
+    def is_known_alive(self, trl: str) -> bool:
+        """Check if the device has responded recently enough to skip pinging it.
+
+        :param trl: the address to the device
+        :type trl: str
+
+        :returns: whether the device is known to be alive
+        """
+        return self.proxy_pool.is_known_alive(trl)
+
+    def mark_alive(self, trl: str) -> None:
+        """Record that the device responded, it is not pinged again until the TTL expires.
+
+        :param trl: the address to the device
+        :type trl: str
+        """
+        self.proxy_pool.mark_alive(trl)
+
+    def mark_unknown(self, trl: str) -> None:
+        """Record that the health of the device is unknown, it is pinged on its next use.
+
+        :param trl: the address to the device
+        :type trl: str
+        """
+        self.proxy_pool.mark_unknown(trl)
+
     def _is_tango_device_running(self, tango_device_proxy: tango.DeviceProxy) -> bool:
         """Checks if the TANGO device is running.
 
@@ -179,4 +325,6 @@ class DeviceProxyManager:
 
     def factory_reset(self) -> Any:
         """Remove device proxy references to the devices."""
+        for trl in self._device_proxies:
+            self.proxy_pool.release(trl)
         self._device_proxies.clear()
@@ -6,9 +6,11 @@ import logging
 import os
 import threading
 import time
+from collections import ChainMap
+from contextlib import contextmanager
 from functools import partial
 from threading import Lock
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 import requests
 import tango
@@ -19,9 +21,11 @@ from ska_mid_dish_dcp_lib.device.b5dc_device_mappings import (
 from ska_tango_base.executor import TaskExecutorComponentManager
 
 from ska_mid_dish_manager.component_managers.b5dc_cm import B5DCComponentManager
+from ska_mid_dish_manager.component_managers.device_proxy_factory import DeviceProxyPool
 from ska_mid_dish_manager.component_managers.ds_cm import DSComponentManager
 from ska_mid_dish_manager.component_managers.spf_cm import SPFComponentManager
 from ska_mid_dish_manager.component_managers.spfrx_cm import SPFRxComponentManager
+from ska_mid_dish_manager.component_managers.wms_aggregator import WMSAggregator
 from ska_mid_dish_manager.component_managers.wms_cm import WMSComponentManager
 from ska_mid_dish_manager.models.abort_sequence_command_handler import AbortSequenceCommandHandler
 from ska_mid_dish_manager.models.command_actions import (
@@ -51,9 +55,15 @@ from ska_mid_dish_manager.models.constants import (
     TZ_DATA_URL_ENV_VAR,
     WIND_GUST_THRESHOLD_MPS,
 )
+from ska_mid_dish_manager.models.derived_attributes import (
+    ComponentStates,
+    DerivedAttribute,
+    DerivedAttributeGraph,
+)
 from ska_mid_dish_manager.models.dish_enums import (
     Band,
     CapabilityStates,
+    CircuitBreakerState,
     DishDevice,
     DishMode,
     DscCmdAuthType,
@@ -76,7 +86,9 @@ from ska_mid_dish_manager.models.dish_enums import (
 )
 from ska_mid_dish_manager.models.dish_mode_model import DishModeModel
 from ska_mid_dish_manager.models.dish_state_transition import StateTransition
+from ska_mid_dish_manager.models.resync_coordinator import ResyncCoordinator
 from ska_mid_dish_manager.utils.action_helpers import report_task_progress, update_task_status
+from ska_mid_dish_manager.utils.arrays import values_equal
 from ska_mid_dish_manager.utils.decorators import (
     check_communicating,
     last_command_failure_decorator,
@@ -85,8 +97,9 @@ from ska_mid_dish_manager.utils.input_validation import (
     ConfigureBandValidationError,
     validate_configure_band_input,
 )
-from ska_mid_dish_manager.utils.schedulers import WatchdogTimer
+from ska_mid_dish_manager.utils.schedulers import LatestValueWriter, WatchdogTimer
 from ska_mid_dish_manager.utils.ska_epoch_to_tai import get_current_tai_timestamp_from_unix_time
+from ska_mid_dish_manager.utils.state_updates import StateChangeNotifier
 from ska_mid_dish_manager.utils.tango_helpers import TangoDbAccessor
 
 
@@ -126,6 +139,8 @@ class DishManagerComponentManager(TaskExecutorComponentManager):
         default_wind_gust_threshold = kwargs.pop(
             "default_wind_gust_threshold", WIND_GUST_THRESHOLD_MPS
         )
+        check_state_transition_parity = kwargs.pop("check_state_transition_parity", False)
+        wms_wind_history_path = kwargs.pop("wms_wind_history_path", None)
 
         default_dish_mode = DishMode.UNKNOWN
         # Check tangodb whether maintenance mode is active
@@ -142,6 +157,8 @@ class DishManagerComponentManager(TaskExecutorComponentManager):
         # filter out empty strings from the list
         configured_wms_devices = [instance for instance in configured_wms_devices if instance]
 
+        # Wakes the actions waiting on the dish manager and sub-device component states
+        self.component_state_changes = StateChangeNotifier()
         super().__init__(
             logger,
             *args,
@@ -161,6 +178,9 @@ class DishManagerComponentManager(TaskExecutorComponentManager):
             dsconnectionstate=CommunicationStatus.DISABLED,
             wmsconnectionstate=CommunicationStatus.DISABLED,
             b5dcconnectionstate=CommunicationStatus.DISABLED,
+            spfcircuitbreakerstate=CircuitBreakerState.CLOSED,
+            spfrxcircuitbreakerstate=CircuitBreakerState.CLOSED,
+            dscircuitbreakerstate=CircuitBreakerState.CLOSED,
             band0pointingmodelparams=[],
             band1pointingmodelparams=[],
             band2pointingmodelparams=[],
@@ -244,9 +264,21 @@ class DishManagerComponentManager(TaskExecutorComponentManager):
         self._wind_stow_callback = wind_stow_callback
         self._command_progress_callback = command_progress_callback
         self._dish_mode_model = DishModeModel()
-        self._state_transition = StateTransition()
+        self._state_transition = StateTransition(
+            logger=logger, check_parity=check_state_transition_parity
+        )
+        self._derived_attributes = DerivedAttributeGraph(self._declare_derived_attributes())
+        # Resyncs read all the sub-devices at once and publish the resulting updates together
+        self.resync_coordinator = ResyncCoordinator(logger, batch_update=self._resync_batch)
+        # bandInFocus is written to SPF off the event threads, repeated values are coalesced
+        self._band_in_focus_writer = LatestValueWriter(
+            self._write_spf_band_in_focus, logger=logger, name="band_in_focus_writer"
+        )
+        self._component_state_transaction_local = threading.local()
         self._command_tracker = command_tracker
-        self._state_update_lock = Lock()
+        # Serialises the aggregation of sub-device updates into the dish manager attributes.
+        # Each sub-device component manager publishes its own state under its own lock.
+        self._sub_device_state_lock = threading.RLock()
         self._stop_event = threading.Event()
         self.watchdog_timer = WatchdogTimer(
             callback_on_timeout=self._stow_on_watchdog_expiry,
@@ -258,12 +290,15 @@ class DishManagerComponentManager(TaskExecutorComponentManager):
             "MeanWindSpeedThreshold": default_mean_wind_speed_threshold,
         }
 
+        # The sub-device proxies are shared with everything else in the process using them
+        self._proxy_pool = DeviceProxyPool.instance()
+
         # SPF has to go first
         self.sub_component_managers = {
             "SPF": SPFComponentManager(
                 spf_device_fqdn,
                 logger,
-                self._state_update_lock,
+                Lock(),
                 operatingmode=SPFOperatingMode.UNKNOWN,
                 powerstate=SPFPowerState.UNKNOWN,
                 healthstate=SPFHealthState.UNKNOWN,
@@ -294,12 +329,16 @@ class DishManagerComponentManager(TaskExecutorComponentManager):
                 component_state_callback=partial(
                     self._sub_device_component_state_changed, DishDevice.SPF
                 ),
+                proxy_pool=self._proxy_pool,
+                circuit_breaker_callback=partial(
+                    self._update_circuit_breaker_attribute, DishDevice.SPF
+                ),
                 quality_state_callback=self._quality_state_callback,
             ),
             "DS": DSComponentManager(
                 ds_device_fqdn,
                 logger,
-                self._state_update_lock,
+                Lock(),
                 healthstate=HealthState.UNKNOWN,
                 operatingmode=DSOperatingMode.UNKNOWN,
                 pointingstate=PointingState.UNKNOWN,
@@ -335,12 +374,17 @@ class DishManagerComponentManager(TaskExecutorComponentManager):
                 component_state_callback=partial(
                     self._sub_device_component_state_changed, DishDevice.DS
                 ),
+                proxy_pool=self._proxy_pool,
+                circuit_breaker_callback=partial(
+                    self._update_circuit_breaker_attribute, DishDevice.DS
+                ),
+                lrc_update_callback=self.component_state_changes.notify,
                 quality_state_callback=self._quality_state_callback,
             ),
             "SPFRX": SPFRxComponentManager(
                 spfrx_device_fqdn,
                 logger,
-                self._state_update_lock,
+                Lock(),
                 operatingmode=SPFRxOperatingMode.UNKNOWN,
                 configuredband=Band.NONE,
                 datafibercheck=False,  # Maps to Dish Managers "capturing" attribute
@@ -368,20 +412,28 @@ class DishManagerComponentManager(TaskExecutorComponentManager):
                 component_state_callback=partial(
                     self._sub_device_component_state_changed, DishDevice.SPFRX
                 ),
+                proxy_pool=self._proxy_pool,
+                circuit_breaker_callback=partial(
+                    self._update_circuit_breaker_attribute, DishDevice.SPFRX
+                ),
                 quality_state_callback=self._quality_state_callback,
             ),
         }
 
-        # Enable WMS
+        # Enable WMS, the weather stations are polled once for all the dishes in the process
         if configured_wms_devices:
             self.sub_component_managers["WMS"] = WMSComponentManager(
                 configured_wms_devices,
                 logger=logger,
+                aggregator=WMSAggregator.instance(
+                    configured_wms_devices,
+                    logger=logger,
+                    wind_history_path=wms_wind_history_path,
+                ),
                 component_state_callback=self._evaluate_wind_speed_averages,
                 communication_state_callback=partial(
                     self._update_connection_state_attribute, DishDevice.WMS
                 ),
-                state_update_lock=self._state_update_lock,
                 meanwindspeed=-1,
                 windgust=-1,
             )
@@ -391,7 +443,7 @@ class DishManagerComponentManager(TaskExecutorComponentManager):
             self.sub_component_managers["B5DC"] = B5DCComponentManager(
                 b5dc_device_fqdn,
                 logger=logger,
-                state_update_lock=self._state_update_lock,
+                state_update_lock=Lock(),
                 rfcmHAttenuation=0.0,
                 rfcmVAttenuation=0.0,
                 rfcmPllLock=B5dcPllState.NOT_LOCKED,
@@ -410,6 +462,8 @@ class DishManagerComponentManager(TaskExecutorComponentManager):
                 component_state_callback=partial(
                     self._sub_device_component_state_changed, DishDevice.B5DC
                 ),
+                proxy_pool=self._proxy_pool,
+                lrc_update_callback=self.component_state_changes.notify,
             )
 
         self.direct_mapped_attrs = {
@@ -567,6 +621,88 @@ class DishManagerComponentManager(TaskExecutorComponentManager):
         # there are no commands in statuses_to_check
         return cmd_ids
 
+    def _update_component_state(self, **kwargs) -> None:
+        """Update the component state, deferring the update if a transaction is open."""
+        pending = getattr(self._component_state_transaction_local, "pending", None)
+        if pending is None:
+            self._commit_component_state(**kwargs)
+        else:
+            pending.update(kwargs)
+
+    def _commit_component_state(self, **kwargs) -> None:
+        """Apply the changed values to the component state and push them.
+
+        As the base class update, but values are compared with `values_equal`, so the
+        spectrum values mapped from the sub-devices as arrays are compared by value.
+        """
+        callback_kwargs = {}
+        with self._component_state_lock:
+            for key, value in kwargs.items():
+                if not values_equal(self._component_state[key], value):
+                    self._component_state[key] = value
+                    callback_kwargs[key] = value
+            if callback_kwargs:
+                self._push_component_state_update(**callback_kwargs)
+
+    def _push_component_state_update(self, **kwargs) -> None:
+        """Push the component state update and wake the actions waiting on it."""
+        super()._push_component_state_update(**kwargs)
+        self.component_state_changes.notify()
+
+    @contextmanager
+    def _component_state_transaction(self) -> Iterator[ChainMap]:
+        """Collect the component state updates made on this thread and commit them as one.
+
+        Every `_update_component_state` call made by the current thread inside the context
+        is merged and applied in a single update on exit, so the component state lock is
+        taken once and the component state callback fires once with all the changes.
+        Nested transactions are folded into the outermost one.
+
+        :return: a view of the component state including the pending updates
+        """
+        pending = getattr(self._component_state_transaction_local, "pending", None)
+        if pending is not None:
+            yield ChainMap(pending, self._component_state)
+            return
+
+        pending = {}
+        self._component_state_transaction_local.pending = pending
+        try:
+            yield ChainMap(pending, self._component_state)
+        finally:
+            self._component_state_transaction_local.pending = None
+            if pending:
+                self._commit_component_state(**pending)
+
+    @contextmanager
+    def _resync_batch(self) -> Iterator[None]:
+        """Apply the values read by a resync and recompute every derived attribute once.
+
+        The values read are diffed against the sub-device component states, so only the
+        attributes which changed emit events. The derived attributes are invalidated first:
+        those triggered by a changed value are recomputed as the values are applied and the
+        others are recomputed on exit, e.g. to pick up a device being ignored or no longer
+        ignored. All the resulting dish manager updates are published in one transaction.
+
+        The sub-device state lock is not held while the values are applied: applying them
+        takes the component state lock of each sub-device, which the event threads hold
+        while they wait for the sub-device state lock. The transaction is local to the
+        resync thread and takes no lock, the sub-device state lock is only taken to
+        invalidate and to recompute the derived attributes.
+        """
+        with self._component_state_transaction() as dish_manager_state:
+            with self._sub_device_state_lock:
+                self._derived_attributes.invalidate()
+            yield
+            with self._sub_device_state_lock:
+                component_states = {
+                    device: component_manager.component_state
+                    for device, component_manager in self.sub_component_managers.items()
+                    if device in ("DS", "SPF", "SPFRX", "B5DC")
+                }
+                component_states["DM"] = dish_manager_state
+                self._derived_attributes.recompute_all(component_states)
+
     def is_device_ignored(self, device: str):
         """Check whether the given device is ignored."""
         if device == "SPF":
@@ -925,6 +1061,18 @@ class DishManagerComponentManager(TaskExecutorComponentManager):
         state_name = f"{device.lower()}connectionstate"
         self._update_component_state(**{state_name: connection_state})
 
+    def _update_circuit_breaker_attribute(
+        self, device: DishDevice, circuit_breaker_state: CircuitBreakerState
+    ):
+        self.logger.info(
+            "Circuit breaker of %s device is %s.",
+            device.name,
+            circuit_breaker_state.name,
+            extra=OPERATOR_TAG,
+        )
+        state_name = f"{device.name.lower()}circuitbreakerstate"
+        self._update_component_state(**{state_name: circuit_breaker_state})
+
     def _evaluate_wind_speed_averages(self, **computed_averages):
         """Evaluate wind speed averages and trigger auto stow if necessary."""
         auto_wind_stow_enabled = self.component_state.get("autowindstowenabled")
@@ -971,314 +1119,429 @@ class DishManagerComponentManager(TaskExecutorComponentManager):
             extra=OPERATOR_TAG,
         )
 
-        # report the communication state of the sub device on the connectionState attribute
-        self._update_connection_state_attribute(device.name, communication_state)
-
-        active_sub_component_managers = self.get_active_sub_component_managers()
-        sub_devices_communication_states = [
-            sub_component_manager.communication_state
-            for sub_component_manager in active_sub_component_managers.values()
-        ]
+        with self._sub_device_state_lock:
+            # report the communication state of the sub device on the connectionState attribute
+            self._update_connection_state_attribute(device.name, communication_state)
 
-        if all(
-            communication_state == CommunicationStatus.ESTABLISHED
-            for communication_state in sub_devices_communication_states
-        ):
-            self._update_communication_state(CommunicationStatus.ESTABLISHED)
-        elif any(
-            communication_state == CommunicationStatus.NOT_ESTABLISHED
-            for communication_state in sub_devices_communication_states
-        ):
-            self._update_communication_state(CommunicationStatus.NOT_ESTABLISHED)
-        else:
-            self._update_communication_state(CommunicationStatus.DISABLED)
+            active_sub_component_managers = self.get_active_sub_component_managers()
+            sub_devices_communication_states = [
+                sub_component_manager.communication_state
+                for sub_component_manager in active_sub_component_managers.values()
+            ]
 
-        # Recompute the dish manager healthState following an update to the communication state
-        self._update_dish_health_state_and_info()
+            if all(
+                communication_state == CommunicationStatus.ESTABLISHED
+                for communication_state in sub_devices_communication_states
+            ):
+                self._update_communication_state(CommunicationStatus.ESTABLISHED)
+            elif any(
+                communication_state == CommunicationStatus.NOT_ESTABLISHED
+                for communication_state in sub_devices_communication_states
+            ):
+                self._update_communication_state(CommunicationStatus.NOT_ESTABLISHED)
+            else:
+                self._update_communication_state(CommunicationStatus.DISABLED)
 
-    # pylint: disable=unused-argument, too-many-branches, too-many-locals, too-many-statements
-    def _sub_device_component_state_changed(self, device: DishDevice, *args, **kwargs):
-        """Callback triggered by the component manager of the
-        subservient device for component state changes.
+            # Recompute the dish manager healthState following an update to the communication state
+            self._update_dish_health_state_and_info()
 
-        This aggregates the component values and computes the final value
-        which will be reported for the respective attribute. The computed
-        value is sent to DishManager's component_state callback which pushes
-        a change event on the attribute and updates the internal variable.
+    def _declare_derived_attributes(self) -> List[DerivedAttribute]:
+        """Declare the attributes computed from the sub-device component states.
 
-        Note: This callback is triggered by the component managers of
-        the subservient devices only. DishManager also has its own callback.
+        Each entry lists the component state keys which trigger it and the (device, key)
+        pairs it reads. Order matters: dishMode feeds the capability states. bandInFocus
+        feeds configuredBand once it has been written to SPF.
         """
-        ds_component_state = self.sub_component_managers["DS"].component_state
-        spf_component_state = self.sub_component_managers["SPF"].component_state
-        spfrx_component_state = self.sub_component_managers["SPFRX"].component_state
-
-        if "powerstate" in kwargs:
-            new_power_state = self._state_transition.compute_power_state(
-                ds_component_state,
-                spf_component_state if not self.is_device_ignored("SPF") else None,
-            )
-            if new_power_state != self.component_state["powerstate"]:
-                self.logger.info(
-                    "Updating dish manager powerState to %s.",
-                    new_power_state.name,
-                    extra=OPERATOR_TAG,
-                )
-            self._update_component_state(powerstate=new_power_state)
-
-        if "buildstate" in kwargs:
-            self._build_state_callback(device, kwargs["buildstate"])
-
-        current_dish_mode = self.component_state["dishmode"]
-        # Update dishMode if there are operatingmode, indexerposition or adminmode changes
-        if (
-            "operatingmode" in kwargs
-            or "indexerposition" in kwargs
-            or "adminmode" in kwargs
-            or "powerstate" in kwargs
-        ):
-            # Do not compute dish mode if the dish is in MAINTENANCE mode
-            if current_dish_mode != DishMode.MAINTENANCE:
-                new_dish_mode = self._state_transition.compute_dish_mode(
-                    ds_component_state,
-                    spfrx_component_state if not self.is_device_ignored("SPFRX") else None,
-                    spf_component_state if not self.is_device_ignored("SPF") else None,
+        ignored_devices = (("DM", "ignorespf"), ("DM", "ignorespfrx"))
+        derived_attributes = [
+            DerivedAttribute(
+                name="powerstate",
+                triggers=frozenset({"powerstate"}),
+                inputs=(("DS", "powerstate"), ("SPF", "powerstate"), ("DM", "ignorespf")),
+                update=self._update_power_state,
+            ),
+            DerivedAttribute(
+                name="dishmode",
+                triggers=frozenset(
+                    {"operatingmode", "indexerposition", "adminmode", "powerstate"}
+                ),
+                inputs=(
+                    ("DM", "dishmode"),
+                    ("DS", "operatingmode"),
+                    ("DS", "indexerposition"),
+                    ("DS", "powerstate"),
+                    ("SPF", "operatingmode"),
+                    ("SPFRX", "operatingmode"),
+                    *ignored_devices,
+                ),
+                update=self._update_dish_mode,
+            ),
+            DerivedAttribute(
+                name="healthstate",
+                triggers=frozenset({"healthstate", "healthinfo", "connectionstate"}),
+                inputs=(
+                    ("DS", "healthstate"),
+                    ("DS", "healthinfo"),
+                    ("DS", "connectionstate"),
+                    ("SPF", "healthstate"),
+                    ("SPFRX", "healthstate"),
+                    ("B5DC", "healthstate"),
+                    ("B5DC", "connectionstate"),
+                    ("DM", "dsconnectionstate"),
+                    ("DM", "spfconnectionstate"),
+                    ("DM", "spfrxconnectionstate"),
+                    ("DM", "b5dcconnectionstate"),
+                    ("DM", "ignoreb5dc"),
+                    *ignored_devices,
+                ),
+                update=self._update_health_state,
+            ),
+            DerivedAttribute(
+                name="bandinfocus",
+                triggers=frozenset({"indexerposition", "configuredband"}),
+                inputs=(
+                    ("DS", "indexerposition"),
+                    ("SPFRX", "configuredband"),
+                    *ignored_devices,
+                ),
+                update=self._update_spf_band_in_focus,
+            ),
+            DerivedAttribute(
+                name="configuredband",
+                triggers=frozenset({"indexerposition", "bandinfocus", "configuredband"}),
+                inputs=(
+                    ("DS", "indexerposition"),
+                    ("SPF", "bandinfocus"),
+                    ("SPFRX", "configuredband"),
+                    *ignored_devices,
+                ),
+                update=self._update_configured_band,
+            ),
+        ]
+        # Added in `powerstate` and `adminmode` so that if the dishmode changes earlier then
+        # the capability states are recalculated as well
+        for band in ["b1", "b2", "b3", "b4", "b5a", "b5b"]:
+            cap_state_name = f"{band}capabilitystate"
+            derived_attributes.append(
+                DerivedAttribute(
+                    name=cap_state_name,
+                    triggers=frozenset(
+                        {
+                            "indexerposition",
+                            "operatingmode",
+                            "powerstate",
+                            "adminmode",
+                            cap_state_name,
+                        }
+                    ),
+                    inputs=(
+                        ("DM", "dishmode"),
+                        ("DS", "indexerposition"),
+                        ("DS", "operatingmode"),
+                        ("SPF", cap_state_name),
+                        ("SPFRX", cap_state_name),
+                        *ignored_devices,
+                    ),
+                    update=partial(self._update_capability_state, band),
                 )
+            )
+        return derived_attributes
 
-                # If the dish is transitioning out of STOW mode, reenable the watchdog timer if
-                # the watchdog timeout is set
-                if current_dish_mode == DishMode.STOW and new_dish_mode != DishMode.STOW:
-                    self._reenable_watchdog_timer()
-
-                if new_dish_mode != current_dish_mode:
-                    self.logger.info(
-                        (
-                            "Updating dish manager dishMode to %s. "
-                            "Sub-components operatingMode: DS [%s], SPF [%s], SPFRX [%s]."
-                        ),
-                        new_dish_mode.name,
-                        ds_component_state["operatingmode"].name,
-                        spf_component_state["operatingmode"].name,
-                        spfrx_component_state["operatingmode"].name,
-                        extra=OPERATOR_TAG,
-                    )
-                self._update_component_state(dishmode=new_dish_mode)
-
-        if "healthstate" in kwargs or "healthinfo" in kwargs:
-            self._update_dish_health_state_and_info()
+    def _update_power_state(self, component_states: ComponentStates) -> None:
+        """Compute and update the dish manager powerState."""
+        new_power_state = self._state_transition.compute_power_state(
+            component_states["DS"],
+            component_states["SPF"] if not self.is_device_ignored("SPF") else None,
+        )
+        if new_power_state != component_states["DM"]["powerstate"]:
+            self.logger.info(
+                "Updating dish manager powerState to %s.",
+                new_power_state.name,
+                extra=OPERATOR_TAG,
+            )
+        self._update_component_state(powerstate=new_power_state)
 
-        if "pointingstate" in kwargs:
-            pointing_state = ds_component_state["pointingstate"]
-            if pointing_state != self.component_state["pointingstate"]:
-                self.logger.info(
-                    "Updating dish manager pointingState to %s.",
-                    pointing_state.name,
-                    extra=OPERATOR_TAG,
-                )
-            self._update_component_state(pointingstate=ds_component_state["pointingstate"])
+    def _update_dish_mode(self, component_states: ComponentStates) -> None:
+        """Compute and update the dish manager dishMode."""
+        current_dish_mode = component_states["DM"]["dishmode"]
+        # Do not compute dish mode if the dish is in MAINTENANCE mode
+        if current_dish_mode == DishMode.MAINTENANCE:
+            return
 
-        if "dscpowerlimitkw" in kwargs:
-            dsc_power_limit = ds_component_state["dscpowerlimitkw"]
-            self.logger.debug(
-                ("Updating dish manager dscPowerLimitKw with: [%s]."),
-                dsc_power_limit,
-            )
-            self._update_component_state(dscpowerlimitkw=ds_component_state["dscpowerlimitkw"])
+        ds_component_state = component_states["DS"]
+        spf_component_state = component_states["SPF"]
+        spfrx_component_state = component_states["SPFRX"]
+        new_dish_mode = self._state_transition.compute_dish_mode(
+            ds_component_state,
+            spfrx_component_state if not self.is_device_ignored("SPFRX") else None,
+            spf_component_state if not self.is_device_ignored("SPF") else None,
+        )
 
-        if "dscctrlstate" in kwargs:
-            dsc_ctrl_state = ds_component_state["dscctrlstate"]
-            self.logger.debug(
-                ("Updating dish manager dscCtrlState with: [%s]."),
-                dsc_ctrl_state,
-            )
-            self._update_component_state(dscctrlstate=ds_component_state["dscctrlstate"])
-
-        # spf bandInFocus
-        if not self.is_device_ignored("SPF") and (
-            "indexerposition" in kwargs or "configuredband" in kwargs
-        ):
-            band_in_focus = self._state_transition.compute_spf_band_in_focus(
-                ds_component_state,
-                spfrx_component_state if not self.is_device_ignored("SPFRX") else None,
-            )
-            self.logger.debug("Setting bandInFocus to %s on SPF", band_in_focus)
-            # update the bandInFocus of SPF before configuredBand
-            spf_component_manager = self.sub_component_managers["SPF"]
-            try:
-                spf_component_manager.write_attribute_value("bandInFocus", band_in_focus)
-            except (tango.DevFailed, ConnectionError):
-                # this will impact configuredBand calculation on dish manager
-                pass
-            else:
-                spf_component_state["bandinfocus"] = band_in_focus
+        # If the dish is transitioning out of STOW mode, reenable the watchdog timer if
+        # the watchdog timeout is set
+        if current_dish_mode == DishMode.STOW and new_dish_mode != DishMode.STOW:
+            self._reenable_watchdog_timer()
 
-        # kvalue
-        if "kvalue" in kwargs:
-            k_value = spfrx_component_state["kvalue"]
-            self.logger.debug(
-                ("Updating dish manager kvalue with: SPFRX kValue [%s]"),
-                k_value,
-            )
-            self._update_component_state(kvalue=k_value)
-
-        # configuredBand
-        if "indexerposition" in kwargs or "bandinfocus" in kwargs or "configuredband" in kwargs:
-            configured_band = self._state_transition.compute_configured_band(
-                ds_component_state,
-                spfrx_component_state if not self.is_device_ignored("SPFRX") else None,
-                spf_component_state if not self.is_device_ignored("SPF") else None,
-            )
-            self.logger.debug(
+        if new_dish_mode != current_dish_mode:
+            self.logger.info(
                 (
-                    "Updating dish manager configuredBand with: [%s]. "
-                    "Sub-component bands DS [%s] SPF [%s] SPFRX [%s]"
+                    "Updating dish manager dishMode to %s. "
+                    "Sub-components operatingMode: DS [%s], SPF [%s], SPFRX [%s]."
                 ),
-                configured_band,
-                ds_component_state["indexerposition"],
-                spf_component_state["bandinfocus"],
-                spfrx_component_state["configuredband"],
+                new_dish_mode.name,
+                ds_component_state["operatingmode"].name,
+                spf_component_state["operatingmode"].name,
+                spfrx_component_state["operatingmode"].name,
+                extra=OPERATOR_TAG,
             )
-            self._update_component_state(configuredband=configured_band)
+        self._update_component_state(dishmode=new_dish_mode)
 
-        # update capturing attribute when SPFRx captures data
-        if "datafibercheck" in kwargs:
-            data_fiber_check = spfrx_component_state["datafibercheck"]
-            self.logger.debug(
-                ("Updating dish manager capturing with: SPFRx [%s]"),
-                data_fiber_check,
-            )
-            self._update_component_state(capturing=data_fiber_check)
-
-        # CapabilityStates
-        # Update all CapabilityStates when indexerposition, dish_mode or operatingmode changes
-        if (
-            "indexerposition" in kwargs
-            or "operatingmode" in kwargs
-            # Added in `powerstate` and `adminmode` so that if the dishmode changes earlier then
-            # the capability states are recalculated as well
-            or "powerstate" in kwargs
-            or "adminmode" in kwargs
-        ):
-            cap_state_updates = {}
-            for band in ["b1", "b2", "b3", "b4", "b5a", "b5b"]:
-                cap_state_name = f"{band}capabilitystate"
-                new_state = self._state_transition.compute_capability_state(
-                    band,
-                    ds_component_state,
-                    self.component_state,
-                    spfrx_component_state if not self.is_device_ignored("SPFRX") else None,
-                    spf_component_state if not self.is_device_ignored("SPF") else None,
-                )
-                cap_state_updates[cap_state_name] = new_state
-            self.logger.debug(
-                "Updating dish manager capability states for %s with: [%s]",
-                list(cap_state_updates.keys()),
-                cap_state_updates,
-            )
-            self._update_component_state(**cap_state_updates)
+    def _update_health_state(self, component_states: ComponentStates) -> None:
+        """Compute and update the dish manager healthState and healthInfo."""
+        self._update_dish_health_state_and_info()
 
-        # Update individual CapabilityStates if it changes
-        # b5 for SPF
-        for band in ["b1", "b2", "b3", "b4", "b5a", "b5b"]:
-            cap_state_name = f"{band}capabilitystate"
-            if cap_state_name in kwargs:
-                new_state = self._state_transition.compute_capability_state(
-                    band,
-                    ds_component_state,
-                    self.component_state,
-                    spfrx_component_state if not self.is_device_ignored("SPFRX") else None,
-                    spf_component_state if not self.is_device_ignored("SPF") else None,
-                )
-                self.logger.debug(
-                    "Updating dish manager %s with: [%s]",
-                    cap_state_name,
-                    new_state,
-                )
-                self._update_component_state(**{cap_state_name: new_state})
-        # Update the pointing model params if they change
-        for band in ["0", "1", "2", "3", "4", "5a", "5b"]:
-            pointing_param_name = f"band{band}pointingmodelparams"
+    def _update_spf_band_in_focus(self, component_states: ComponentStates) -> None:
+        """Compute bandInFocus and queue it to be written to SPF.
 
-            if pointing_param_name in kwargs:
-                self.logger.debug(
-                    ("Updating dish manager %s with: DS %s [%s]"),
-                    pointing_param_name,
-                    pointing_param_name,
-                    ds_component_state[pointing_param_name],
-                )
-                self._update_component_state(
-                    **{pointing_param_name: ds_component_state[pointing_param_name]}
-                )
+        The write is made on the band in focus writer thread so that the event thread is not
+        blocked on SPF. configuredBand is recomputed once the written value is fed back.
+        """
+        if self.is_device_ignored("SPF"):
+            return
 
-        # Update attributes that are mapped directly from subservient devices
-        attrs = self.direct_mapped_attrs[device]
-        cm_state = self.sub_component_managers[device.value].component_state
+        band_in_focus = self._state_transition.compute_spf_band_in_focus(
+            component_states["DS"],
+            component_states["SPFRX"] if not self.is_device_ignored("SPFRX") else None,
+        )
+        self._band_in_focus_writer.submit(band_in_focus)
 
-        pointing_related_attrs = {
-            "desiredpointingaz",
-            "desiredpointingel",
-            "achievedpointing",
-            "tracktablecurrentindex",
-            "tracktableendindex",
-        }
+    def _write_spf_band_in_focus(self, band_in_focus: SPFBandInFocus) -> None:
+        """Write bandInFocus to SPF unless SPF already reports it."""
+        spf_component_manager = self.sub_component_managers["SPF"]
+        if spf_component_manager.component_state["bandinfocus"] == band_in_focus:
+            return
 
-        b5dc_related_attrs = {
-            "rfcmplllock",
-            "clkphotodiodecurrent",
-            "rftemperature",
-            "rfcmpsupcbtemperature",
-            "hpolrfpowerin",
-            "hpolrfpowerout",
-            "vpolrfpowerin",
-            "vpolrfpowerout",
-        }
+        self.logger.debug("Setting bandInFocus to %s on SPF", band_in_focus)
+        try:
+            spf_component_manager.write_attribute_value("bandInFocus", band_in_focus)
+        except (tango.DevFailed, ConnectionError):
+            # this will impact configuredBand calculation on dish manager,
+            # try again on the next trigger
+            self._derived_attributes.invalidate("bandinfocus")
+            return
+        # feed the written value back to recompute configuredBand without waiting for SPF
+        spf_component_manager._update_component_state(bandinfocus=band_in_focus)
+
+    def _update_configured_band(self, component_states: ComponentStates) -> None:
+        """Compute and update the dish manager configuredBand."""
+        ds_component_state = component_states["DS"]
+        spf_component_state = component_states["SPF"]
+        spfrx_component_state = component_states["SPFRX"]
+        configured_band = self._state_transition.compute_configured_band(
+            ds_component_state,
+            spfrx_component_state if not self.is_device_ignored("SPFRX") else None,
+            spf_component_state if not self.is_device_ignored("SPF") else None,
+        )
+        self.logger.debug(
+            (
+                "Updating dish manager configuredBand with: [%s]. "
+                "Sub-component bands DS [%s] SPF [%s] SPFRX [%s]"
+            ),
+            configured_band,
+            ds_component_state["indexerposition"],
+            spf_component_state["bandinfocus"],
+            spfrx_component_state["configuredband"],
+        )
+        self._update_component_state(configuredband=configured_band)
+
+    def _update_capability_state(self, band: str, component_states: ComponentStates) -> None:
+        """Compute and update the dish manager capabilityState of a band."""
+        cap_state_name = f"{band}capabilitystate"
+        new_state = self._state_transition.compute_capability_state(
+            band,
+            component_states["DS"],
+            {"dishmode": component_states["DM"]["dishmode"]},
+            component_states["SPFRX"] if not self.is_device_ignored("SPFRX") else None,
+            component_states["SPF"] if not self.is_device_ignored("SPF") else None,
+        )
+        self.logger.debug(
+            "Updating dish manager %s with: [%s]",
+            cap_state_name,
+            new_state,
+        )
+        self._update_component_state(**{cap_state_name: new_state})
 
-        enum_attr_mapping = {
-            "trackInterpolationMode": TrackInterpolationMode,
-            "noiseDiodeMode": NoiseDiodeMode,
-        }
-        for attr in attrs:
-            attr_lower = attr.lower()
-
-            if attr_lower in kwargs:
-                new_value = None
-                new_value = cm_state[attr_lower]
-                mapped_enum = enum_attr_mapping.get(attr)
-                new_value = mapped_enum(new_value) if mapped_enum is not None else new_value
-                if (
-                    attr_lower not in pointing_related_attrs
-                    and attr_lower not in b5dc_related_attrs
-                ):
+    # pylint: disable=unused-argument, too-many-branches, too-many-locals, too-many-statements
+    def _sub_device_component_state_changed(self, device: DishDevice, *args, **kwargs):
+        """Callback triggered by the component manager of the
+        subservient device for component state changes.
+
+        This aggregates the component values and computes the final value
+        which will be reported for the respective attribute. The computed
+        value is sent to DishManager's component_state callback which pushes
+        a change event on the attribute and updates the internal variable.
+
+        Note: This callback is triggered by the component managers of
+        the subservient devices only. DishManager also has its own callback.
+        """
+        # Read the sub-device states under the lock so the last update aggregated sees
+        # the latest published state of every device
+        with self._sub_device_state_lock:
+            ds_component_state = self.sub_component_managers["DS"].component_state
+            spf_component_state = self.sub_component_managers["SPF"].component_state
+            spfrx_component_state = self.sub_component_managers["SPFRX"].component_state
+
+            if "buildstate" in kwargs:
+                self._build_state_callback(device, kwargs["buildstate"])
+
+            # Publish all the updates derived from this event together
+            with self._component_state_transaction() as dish_manager_state:
+                # Recompute the derived attributes (dishMode, powerState, configuredBand, etc.)
+                # whose inputs were changed by this update
+                component_states = {
+                    "DS": ds_component_state,
+                    "SPF": spf_component_state,
+                    "SPFRX": spfrx_component_state,
+                    "DM": dish_manager_state,
+                }
+                if "B5DC" in self.sub_component_managers:
+                    component_states["B5DC"] = self.sub_component_managers["B5DC"].component_state
+                self._derived_attributes.recompute(kwargs.keys(), component_states)
+
+                if "pointingstate" in kwargs:
+                    pointing_state = ds_component_state["pointingstate"]
+                    if pointing_state != dish_manager_state["pointingstate"]:
+                        self.logger.info(
+                            "Updating dish manager pointingState to %s.",
+                            pointing_state.name,
+                            extra=OPERATOR_TAG,
+                        )
+                    self._update_component_state(pointingstate=ds_component_state["pointingstate"])
+
+                if "dscpowerlimitkw" in kwargs:
+                    dsc_power_limit = ds_component_state["dscpowerlimitkw"]
                     self.logger.debug(
-                        ("Updating dish manager %s with: %s %s [%s]"),
-                        attr,
-                        device,
-                        attr,
-                        new_value,
+                        ("Updating dish manager dscPowerLimitKw with: [%s]."),
+                        dsc_power_limit,
+                    )
+                    self._update_component_state(
+                        dscpowerlimitkw=ds_component_state["dscpowerlimitkw"]
                     )
 
-                self._update_component_state(**{attr_lower: new_value})
+                if "dscctrlstate" in kwargs:
+                    dsc_ctrl_state = ds_component_state["dscctrlstate"]
+                    self.logger.debug(
+                        ("Updating dish manager dscCtrlState with: [%s]."),
+                        dsc_ctrl_state,
+                    )
+                    self._update_component_state(dscctrlstate=ds_component_state["dscctrlstate"])
 
-        # DS connectionState attribute
-        if device == DishDevice.DS and "connectionstate" in kwargs:
-            dscconnectionstate = kwargs["connectionstate"]
-            self.logger.debug(
-                "Updating dscconnectionstate with state: %s",
-                dscconnectionstate,
-            )
-            self._update_component_state(dscconnectionstate=dscconnectionstate)
+                # kvalue
+                if "kvalue" in kwargs:
+                    k_value = spfrx_component_state["kvalue"]
+                    self.logger.debug(
+                        ("Updating dish manager kvalue with: SPFRX kValue [%s]"),
+                        k_value,
+                    )
+                    self._update_component_state(kvalue=k_value)
 
-        # B5dcServerConnectionState attribute
-        if device == DishDevice.B5DC and "connectionstate" in kwargs:
-            b5dcserverconnectionstate = kwargs["connectionstate"]
-            self.logger.debug(
-                "Updating b5dcServerConnectionState with state: %s",
-                b5dcserverconnectionstate,
-            )
-            self._update_component_state(b5dcserverconnectionstate=b5dcserverconnectionstate)
+                # update capturing attribute when SPFRx captures data
+                if "datafibercheck" in kwargs:
+                    data_fiber_check = spfrx_component_state["datafibercheck"]
+                    self.logger.debug(
+                        ("Updating dish manager capturing with: SPFRx [%s]"),
+                        data_fiber_check,
+                    )
+                    self._update_component_state(capturing=data_fiber_check)
+
+                # Update the pointing model params if they change
+                for band in ["0", "1", "2", "3", "4", "5a", "5b"]:
+                    pointing_param_name = f"band{band}pointingmodelparams"
+
+                    if pointing_param_name in kwargs:
+                        self.logger.debug(
+                            ("Updating dish manager %s with: DS %s [%s]"),
+                            pointing_param_name,
+                            pointing_param_name,
+                            ds_component_state[pointing_param_name],
+                        )
+                        self._update_component_state(
+                            **{pointing_param_name: ds_component_state[pointing_param_name]}
+                        )
+
+                # Update attributes that are mapped directly from subservient devices
+                attrs = self.direct_mapped_attrs[device]
+                cm_state = self.sub_component_managers[device.value].component_state
+
+                pointing_related_attrs = {
+                    "desiredpointingaz",
+                    "desiredpointingel",
+                    "achievedpointing",
+                    "tracktablecurrentindex",
+                    "tracktableendindex",
+                }
+
+                b5dc_related_attrs = {
+                    "rfcmplllock",
+                    "clkphotodiodecurrent",
+                    "rftemperature",
+                    "rfcmpsupcbtemperature",
+                    "hpolrfpowerin",
+                    "hpolrfpowerout",
+                    "vpolrfpowerin",
+                    "vpolrfpowerout",
+                }
+
+                enum_attr_mapping = {
+                    "trackInterpolationMode": TrackInterpolationMode,
+                    "noiseDiodeMode": NoiseDiodeMode,
+                }
+                for attr in attrs:
+                    attr_lower = attr.lower()
+
+                    if attr_lower in kwargs:
+                        new_value = None
+                        new_value = cm_state[attr_lower]
+                        mapped_enum = enum_attr_mapping.get(attr)
+                        new_value = (
+                            mapped_enum(new_value) if mapped_enum is not None else new_value
+                        )
+                        if (
+                            attr_lower not in pointing_related_attrs
+                            and attr_lower not in b5dc_related_attrs
+                        ):
+                            self.logger.debug(
+                                ("Updating dish manager %s with: %s %s [%s]"),
+                                attr,
+                                device,
+                                attr,
+                                new_value,
+                            )
+
+                        self._update_component_state(**{attr_lower: new_value})
+
+                # DS connectionState attribute
+                if device == DishDevice.DS and "connectionstate" in kwargs:
+                    dscconnectionstate = kwargs["connectionstate"]
+                    self.logger.debug(
+                        "Updating dscconnectionstate with state: %s",
+                        dscconnectionstate,
+                    )
+                    self._update_component_state(dscconnectionstate=dscconnectionstate)
 
-        if "connectionstate" in kwargs:
-            self._update_dish_health_state_and_info()
+                # B5dcServerConnectionState attribute
+                if device == DishDevice.B5DC and "connectionstate" in kwargs:
+                    b5dcserverconnectionstate = kwargs["connectionstate"]
+                    self.logger.debug(
+                        "Updating b5dcServerConnectionState with state: %s",
+                        b5dcserverconnectionstate,
+                    )
+                    self._update_component_state(
+                        b5dcserverconnectionstate=b5dcserverconnectionstate
+                    )
+
+            # Wake the actions waiting on the sub-device component states
+            self.component_state_changes.notify()
 
     def stow_to_maintenance_transition_callback(self, start: bool) -> None:
         """Handle the transition from STOW to MAINTENANCE mode.
@@ -1432,16 +1695,18 @@ class DishManagerComponentManager(TaskExecutorComponentManager):
     def sync_component_states(self):
         """Sync monitored attributes on component managers with their respective sub devices.
 
-        Clear the monitored attributes of all subservient device component managers,
-        then re-read all the monitored attributes from their respective tango device
-        to force dishManager to recalculate its attributes.
+        Re-read all the monitored attributes from their respective tango device. Only the
+        values which differ from the component states are updated, and every attribute
+        dishManager derives from them is recalculated once.
         """
         self.logger.debug("Syncing component states")
         if self.sub_component_managers:
-            for device, component_manager in self.sub_component_managers.items():
-                if not self.is_device_ignored(device) and device != "WMS":
-                    component_manager.clear_monitored_attributes()
-                    component_manager.update_state_from_monitored_attributes()
+            component_managers = [
+                component_manager
+                for device, component_manager in self.sub_component_managers.items()
+                if not self.is_device_ignored(device) and device != "WMS"
+            ]
+            self.resync_coordinator.resync(component_managers)
 
     def update_pointing_model_params(self, attr: str, values: list[float]) -> None:
         """Update band pointing model parameters for the given attribute."""
@@ -2251,6 +2516,12 @@ class DishManagerComponentManager(TaskExecutorComponentManager):
 
         return (ResultCode.OK, "Successfully updated pseudoRandomNoiseDiodePars on SPFRx")
 
+    def abort_tasks(self, *args, **kwargs) -> Tuple[TaskStatus, str]:
+        """Abort the tasks and wake the actions waiting on component state changes."""
+        result = super().abort_tasks(*args, **kwargs)
+        self.component_state_changes.notify()
+        return result
+
     @check_communicating
     def abort_commands(self, task_callback: Optional[Callable] = None) -> Tuple[TaskStatus, str]:
         """Override the abort_commands method to ensure that custom
@@ -13,6 +13,42 @@ from ska_mid_dish_manager.models.dish_enums import (
     IndexerPosition,
     PointingState,
 )
+from ska_mid_dish_manager.utils.schedulers import EventPriority
+
+# High-rate pointing attributes are processed on their own threads so that they do not
+# delay mode, health and safety events. All other attributes stay in order on one thread.
+DS_EVENT_GROUPS = {
+    "achievedPointing": "achievedpointing",
+    "desiredPointingAz": "desiredpointing",
+    "desiredPointingEl": "desiredpointing",
+    "trackTableCurrentIndex": "tracktable",
+    "trackTableEndIndex": "tracktable",
+}
+
+# High-rate telemetry for which only the latest value matters
+DS_COALESCED_ATTRIBUTES = (
+    "achievedPointing",
+    "desiredPointingAz",
+    "desiredPointingEl",
+    "trackTableCurrentIndex",
+)
+
+# Mode, health and safety events are processed ahead of queued telemetry
+DS_EVENT_PRIORITIES = {
+    "operatingMode": EventPriority.HIGH,
+    "powerState": EventPriority.HIGH,
+    "indexerPosition": EventPriority.HIGH,
+    "healthState": EventPriority.HIGH,
+    "dscCtrlState": EventPriority.HIGH,
+    "dscSafetyStatus": EventPriority.HIGH,
+    "dscErrorStatus": EventPriority.HIGH,
+    "connectionState": EventPriority.HIGH,
+    "achievedPointing": EventPriority.LOW,
+    "desiredPointingAz": EventPriority.LOW,
+    "desiredPointingEl": EventPriority.LOW,
+    "trackTableCurrentIndex": EventPriority.LOW,
+    "trackTableEndIndex": EventPriority.LOW,
+}
 
 
 class DSComponentManager(TangoDeviceComponentManager):
@@ -69,6 +105,10 @@ class DSComponentManager(TangoDeviceComponentManager):
             *args,
             communication_state_callback=communication_state_callback,
             component_state_callback=component_state_callback,
+            event_groups=kwargs.pop("event_groups", DS_EVENT_GROUPS),
+            coalesced_attributes=kwargs.pop("coalesced_attributes", DS_COALESCED_ATTRIBUTES),
+            event_priorities=kwargs.pop("event_priorities", DS_EVENT_PRIORITIES),
+            track_lrcs=kwargs.pop("track_lrcs", True),
             **kwargs,
         )
         self._communication_state_lock = state_update_lock
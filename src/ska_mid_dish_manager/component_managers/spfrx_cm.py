@@ -7,6 +7,7 @@ from typing import Any, Callable, Optional
 import tango
 from ska_control_model import AdminMode, HealthState
 
+from ska_mid_dish_manager.component_managers.device_proxy_factory import DeviceProxyPool
 from ska_mid_dish_manager.component_managers.tango_device_cm import TangoDeviceComponentManager
 from ska_mid_dish_manager.models.dish_enums import Band, SPFRxCapabilityStates, SPFRxOperatingMode
 
@@ -22,6 +23,7 @@ class MonitorPing(threading.Thread):
         interval: float,
         stop_event: threading.Event,
         device_fqdn: str,
+        proxy_pool: Optional[DeviceProxyPool] = None,
     ):
         """Initialize the MonitorPing thread.
 
@@ -29,6 +31,7 @@ class MonitorPing(threading.Thread):
         :param interval: Time interval in seconds between function calls.
         :param stop_event: Event to signal when the thread should stop.
         :param device_fqdn: FQDN of the SPFRx device.
+        :param proxy_pool: Pool to share the SPFRx device proxy with the component manager.
         """
         super().__init__(name="MonitorPingThread")
         self._logger = logger
@@ -37,19 +40,25 @@ class MonitorPing(threading.Thread):
         self._spfrx_trl = device_fqdn
         self._log_counter = 0
         self._device_proxy = None
+        self._proxy_pool = proxy_pool or DeviceProxyPool()
 
     def run(self) -> None:
         """Execute the function at regular intervals until the stop event is set."""
-        while not self._stop_event.is_set():
-            self._execute_monitor_ping()
-            # Wait for the next interval or until stopped
-            self._stop_event.wait(self._interval)
+        try:
+            while not self._stop_event.is_set():
+                self._execute_monitor_ping()
+                # Wait for the next interval or until stopped
+                self._stop_event.wait(self._interval)
+        finally:
+            if self._device_proxy is not None:
+                self._proxy_pool.release(self._spfrx_trl)
+                self._device_proxy = None
 
     def _create_device_proxy(self) -> None:
-        """Create the Tango DeviceProxy if not already created."""
+        """Acquire the Tango DeviceProxy from the proxy pool if not already acquired."""
         if self._device_proxy is None:
             try:
-                self._device_proxy = tango.DeviceProxy(self._spfrx_trl)
+                self._device_proxy = self._proxy_pool.acquire(self._spfrx_trl, tango.DeviceProxy)
             except tango.DevFailed:
                 pass
 
@@ -66,6 +75,7 @@ class MonitorPing(threading.Thread):
             self._create_device_proxy()
             try:
                 self._device_proxy.command_inout("MonitorPing", None)  # type: ignore
+                self._proxy_pool.mark_alive(self._spfrx_trl)
             except Exception:
                 if self._log_counter < self.PING_ERROR_LOG_REPEAT:
                     if self._device_proxy is None:
@@ -158,6 +168,7 @@ class SPFRxComponentManager(TangoDeviceComponentManager):
             self._MONITOR_PING_INTERVAL,
             self._ping_thread_stop_event,
             self._tango_device_fqdn,
+            proxy_pool=self._proxy_pool,
         )
         self._monitor_ping_thread.start()
 
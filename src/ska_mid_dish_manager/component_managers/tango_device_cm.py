@@ -1,8 +1,9 @@
 """Generic component manager for a subservient tango device."""
 
 import logging
-from threading import Event, Thread
-from typing import Any, Tuple
+from concurrent.futures import Future
+from threading import Event, Lock, Thread, local
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
 import numpy as np
 import tango
@@ -11,9 +12,24 @@ from ska_tango_base import type_hints
 from ska_tango_base.base import BaseComponentManager
 from ska_tango_base.callback_scheduler import CallbackScheduler
 
-from ska_mid_dish_manager.component_managers.device_proxy_factory import DeviceProxyManager
-from ska_mid_dish_manager.models.constants import LOGGED_ARG_MAX_LENGTH, OPERATOR_TAG
-from ska_mid_dish_manager.utils.decorators import check_communicating
+from ska_mid_dish_manager.component_managers.device_proxy_factory import (
+    DeviceProxyManager,
+    DeviceProxyPool,
+)
+from ska_mid_dish_manager.models.constants import (
+    LOGGED_ARG_MAX_LENGTH,
+    OPERATOR_TAG,
+    UNREACHABLE_DEVICE_ERROR_REASONS,
+)
+from ska_mid_dish_manager.utils.arrays import read_only_array, values_equal
+from ska_mid_dish_manager.utils.circuit_breaker import CircuitBreaker
+from ska_mid_dish_manager.utils.decorators import check_circuit_breaker, check_communicating
+from ska_mid_dish_manager.utils.lrc_tracker import LRC_ATTRIBUTES, LrcTracker
+from ska_mid_dish_manager.utils.schedulers import EventPriority, ShardedDispatcher
+from ska_mid_dish_manager.utils.state_updates import discard_unchanged
+
+# Event group of the monitored attributes which are not assigned one
+DEFAULT_EVENT_GROUP = "default"
 
 
 class TangoDeviceComponentManager(BaseComponentManager):
@@ -29,6 +45,13 @@ class TangoDeviceComponentManager(BaseComponentManager):
         component_state_callback: Any = None,
         quality_state_callback: Any = None,
         quality_monitored_attributes: Tuple[str, ...] = (),
+        event_groups: Optional[Dict[str, str]] = None,
+        coalesced_attributes: Tuple[str, ...] = (),
+        event_priorities: Optional[Dict[str, EventPriority]] = None,
+        track_lrcs: bool = False,
+        lrc_update_callback: Optional[Callable] = None,
+        proxy_pool: Optional[DeviceProxyPool] = None,
+        circuit_breaker_callback: Optional[Callable] = None,
         **kwargs: Any,
     ):
         self._quality_state_callback = quality_state_callback
@@ -38,10 +61,44 @@ class TangoDeviceComponentManager(BaseComponentManager):
             attr.lower() for attr in quality_monitored_attributes
         )
         self._active_attr_event_subscriptions: set[str] = set()
+        self._subscriptions_lock = Lock()
+        # Events are processed in order within an event group and concurrently across
+        # groups. Attributes not listed share the default group. Without event groups
+        # all events are processed in order on a single thread.
+        self._event_groups = {attr.lower(): group for attr, group in (event_groups or {}).items()}
+        self._event_dispatcher: ShardedDispatcher | None = None
+        # Events of coalesced attributes are delivered latest value wins: an event which is
+        # still waiting to be processed when a newer one arrives is dropped and counted
+        self._coalesced_attributes = frozenset(attr.lower() for attr in coalesced_attributes)
+        self._latest_events: Dict[str, tango.EventData] = {}
+        self._dropped_events = dict.fromkeys(self._coalesced_attributes, 0)
+        self._coalesce_lock = Lock()
+        # Queued events of higher priority attributes are processed ahead of lower priority
+        # ones in the same event group, attributes not listed have NORMAL priority
+        self._event_priorities = {
+            attr.lower(): priority for attr, priority in (event_priorities or {}).items()
+        }
+        # Number of updates per attribute discarded as unchanged before taking the lock,
+        # approximate as it is counted without a lock by the event threads
+        self._skipped_updates: Dict[str, int] = {}
+        # Set on the thread applying resync values, which are only compared under the lock
+        self._resync_update = local()
         self.logger = logger
+        # The long running commands on the device are tracked from the LRC attribute events
+        # so that fanned out commands do not read the attributes to follow their progress
+        self.lrc_tracker: LrcTracker | None = (
+            LrcTracker(logger, update_callback=lrc_update_callback) if track_lrcs else None
+        )
         self._dp_factory_signal: Event = Event()
 
-        self._device_proxy_factory = DeviceProxyManager(self.logger, self._dp_factory_signal)
+        # Proxies and the device liveness are shared with the other users of the device
+        # through the proxy pool
+        self._proxy_pool = proxy_pool or DeviceProxyPool()
+        self._device_proxy_factory = DeviceProxyManager(
+            self.logger, self._dp_factory_signal, proxy_pool=self._proxy_pool
+        )
+        # Calls to the device fail fast while it cannot be reached
+        self.circuit_breaker = CircuitBreaker(state_callback=circuit_breaker_callback)
         self._connection_thread: Thread | None = None
         self._events_monitor: CallbackScheduler | None = None
 
@@ -62,6 +119,47 @@ class TangoDeviceComponentManager(BaseComponentManager):
             **kwargs,
         )
 
+    @property
+    def component_state(self) -> Dict[str, Any]:
+        """Return a copy of the latest published component state.
+
+        Published component states are never modified, updates publish a new dict, so the
+        copy is consistent without taking the component state lock.
+        """
+        return dict(self._component_state)
+
+    def _update_component_state(self, **kwargs: Any) -> None:
+        """Publish a new component state holding the changed values.
+
+        Unchanged values of events are discarded before taking the lock, as resubscriptions
+        and periodic or archive events mostly report values already held. The values
+        applied by a resync are only compared under the lock, see `discard_unchanged`.
+        """
+        if getattr(self._resync_update, "active", False):
+            changed = kwargs
+        else:
+            changed = discard_unchanged(self._component_state, kwargs, self._skipped_updates)
+            if not changed:
+                return
+        with self._component_state_lock:
+            component_state = self._component_state
+            callback_kwargs = {
+                key: value
+                for key, value in changed.items()
+                if not values_equal(component_state[key], value)
+            }
+            if callback_kwargs:
+                self._component_state = {**component_state, **callback_kwargs}
+                self._push_component_state_update(**callback_kwargs)
+
+    @property
+    def skipped_update_counts(self) -> Dict[str, int]:
+        """Number of updates of each attribute discarded because the value was unchanged.
+
+        The counts are approximate: they are incremented without a lock by the event threads.
+        """
+        return dict(self._skipped_updates)
+
     # ---------
     # Callbacks
     # ---------
@@ -86,7 +184,7 @@ class TangoDeviceComponentManager(BaseComponentManager):
             try:
                 value = event_data.attr_value.value
                 if isinstance(value, np.ndarray):
-                    value = list(value)
+                    value = read_only_array(value)
                 self._update_component_state(**{attr_name: value})
             # Catch any errors and log it otherwise it remains hidden
             except Exception:  # pylint:disable=broad-except
@@ -125,11 +223,10 @@ class TangoDeviceComponentManager(BaseComponentManager):
         # be further actioned after logging.
         dev_error = errors[0]
         if dev_error.reason == "API_EventTimeout":
+            self._proxy_pool.mark_unknown(self._tango_device_fqdn)
             device_proxy = self._device_proxy_factory.get_cached_proxy(self._tango_device_fqdn)
-            try:
-                self._active_attr_event_subscriptions.remove(attr_name)
-            except KeyError:
-                pass
+            with self._subscriptions_lock:
+                self._active_attr_event_subscriptions.discard(attr_name)
 
             if device_proxy is None:
                 device_available = False
@@ -141,7 +238,10 @@ class TangoDeviceComponentManager(BaseComponentManager):
                 else:
                     device_available = True
 
-            if not device_available:
+            if device_available:
+                self.circuit_breaker.record_success()
+            else:
+                self.circuit_breaker.trip()
                 self.logger.debug(
                     "Device at %s is unavailable. Communication status is being "
                     "set to NOT_ESTABLISHED.",
@@ -150,6 +250,25 @@ class TangoDeviceComponentManager(BaseComponentManager):
                 )
                 self._update_communication_state(CommunicationStatus.NOT_ESTABLISHED)
 
+    def _dispatch_lrc_event(self, event: type_hints.EventDataType) -> None:
+        """Update the tracked long running commands from an LRC attribute event.
+
+        :param event: Tango event received from the callback scheduler.
+        """
+        if not isinstance(event, tango.EventData) or self.lrc_tracker is None:
+            return
+
+        attr_name = event.attr_name.split("/")[-1].lower()
+        if event.err or event.attr_value is None:
+            # read the attribute until events come through again
+            self.lrc_tracker.forget(attr_name)
+            return
+        self._device_responded()
+        try:
+            self.lrc_tracker.update(attr_name, event.attr_value.value)
+        except Exception:  # pylint:disable=broad-except
+            self.logger.exception("Error occurred updating the tracked long running commands")
+
     def dispatch_event(self, event: type_hints.EventDataType) -> None:
         """Route a Tango event to the appropriate event handler.
 
@@ -183,6 +302,7 @@ class TangoDeviceComponentManager(BaseComponentManager):
         if error:
             self._handle_error_event(event)
         else:
+            self._device_responded()
             self._update_state_from_event(event)
 
     # --------------
@@ -218,14 +338,11 @@ class TangoDeviceComponentManager(BaseComponentManager):
 
     def sync_communication_to_valid_event(self, event_attr_name: str) -> None:
         """Sync communication state with valid events from monitored attributes."""
-        monitored_attrs = set(self._monitored_attributes)
-        previous_subscriptions = set(self._active_attr_event_subscriptions)
-        current_subscriptions = self._active_attr_event_subscriptions
-        current_subscriptions.add(event_attr_name)
+        with self._subscriptions_lock:
+            newly_valid = event_attr_name not in self._active_attr_event_subscriptions
+            self._active_attr_event_subscriptions.add(event_attr_name)
 
-        if event_attr_name in monitored_attrs and len(current_subscriptions) > len(
-            previous_subscriptions
-        ):
+        if newly_valid and event_attr_name in self._monitored_attributes:
             self.logger.info(
                 "Attribute name [%s] is now valid, communication with [%s] is established",
                 event_attr_name,
@@ -235,25 +352,6 @@ class TangoDeviceComponentManager(BaseComponentManager):
                 self._update_communication_state(CommunicationStatus.ESTABLISHED)
                 self._fetch_build_state_information()
 
-    def clear_monitored_attributes(self) -> None:
-        """Sets all the monitored attribute values to 0.
-
-        This is a helper method that can be called before
-        update_state_from_monitored_attributes
-        to ensure that dishManager's CM will update its attributes.
-
-        DishManager will only update its attributes when a tango device CM
-        pushes a change event, by setting all the monitored attributes to 0
-        before calling update_state_from_monitored_attributes we can ensure that there will
-        be a change and that dishManager will update its attributes.
-        """
-        for monitored_attribute in self._monitored_attributes:
-            # Update it in the component state if it is there
-            _monitored_attribute = monitored_attribute.lower()
-
-            if _monitored_attribute in self._component_state:
-                self._component_state[_monitored_attribute] = 0
-
     def update_state_from_monitored_attributes(
         self, monitored_attributes: Tuple[str, ...] | None = None
     ) -> None:
@@ -266,6 +364,12 @@ class TangoDeviceComponentManager(BaseComponentManager):
         This is a convenience method that can be called to sync up the
         monitored attributes on the device and the component state.
         """
+        if not self.circuit_breaker.allow_request():
+            self.logger.debug(
+                "Not reading the monitored attributes of unreachable device %s",
+                self._tango_device_fqdn,
+            )
+            return
         device_proxy = self._device_proxy_factory(self._tango_device_fqdn)
 
         # fallback to defaults if not provided
@@ -274,30 +378,163 @@ class TangoDeviceComponentManager(BaseComponentManager):
         with tango.EnsureOmniThread():
             try:
                 attribute_values = device_proxy.read_attributes(monitored_attributes)
-            except tango.DevFailed:
-                self.logger.error(
-                    "Encountered an error retrieving the current values of %s from %s",
-                    monitored_attributes,
-                    self._tango_device_fqdn,
-                )
+            except tango.DevFailed as err:
+                self._monitored_attributes_read_failed(monitored_attributes, err.args)
                 return
 
+        self._device_responded()
+        self.apply_monitored_attribute_values(self._monitored_attribute_values(attribute_values))
+
+    def read_monitored_attributes_async(
+        self, monitored_attributes: Tuple[str, ...] | None = None
+    ) -> "Future[Dict[str, Any]]":
+        """Read the monitored attributes without waiting for the reply.
+
+        The attributes are read with a single asynchronous request whose reply is pushed to
+        a callback on a Tango thread, so several devices can be read at once. The values are
+        not applied to the component state, see `apply_monitored_attribute_values`.
+
+        :param monitored_attributes: The attributes to read, all monitored ones by default
+        :type monitored_attributes: Tuple[str, ...] | None
+        :return: a future of the values by lowercase attribute name, which are empty if the
+            attributes could not be read
+        :rtype: Future[Dict[str, Any]]
+        """
+        future: "Future[Dict[str, Any]]" = Future()
+        if not self.circuit_breaker.allow_request():
+            self.logger.debug(
+                "Not reading the monitored attributes of unreachable device %s",
+                self._tango_device_fqdn,
+            )
+            future.set_result({})
+            return future
+        device_proxy = self._device_proxy_factory(self._tango_device_fqdn)
+
+        # fallback to defaults if not provided
+        monitored_attributes = monitored_attributes or self._monitored_attributes
+
+        def _read_done(event: tango.AttrReadEvent) -> None:
+            try:
+                if event.err:
+                    self._monitored_attributes_read_failed(monitored_attributes, event.errors)
+                    future.set_result({})
+                else:
+                    self._device_responded()
+                    future.set_result(self._monitored_attribute_values(event.argout))
+            except Exception as err:  # pylint:disable=broad-except
+                future.set_exception(err)
+
+        with tango.EnsureOmniThread():
+            self._use_push_callback_model()
+            try:
+                device_proxy.read_attributes_asynch(list(monitored_attributes), _read_done)
+            except tango.DevFailed as err:
+                self._monitored_attributes_read_failed(monitored_attributes, err.args)
+                future.set_result({})
+
+        return future
+
+    def apply_monitored_attribute_values(self, monitored_attribute_values: Dict[str, Any]) -> None:
+        """Update the component state with values read from the device.
+
+        :param monitored_attribute_values: The values by lowercase attribute name
+        :type monitored_attribute_values: Dict[str, Any]
+        """
+        if monitored_attribute_values:
+            self._resync_update.active = True
+            try:
+                self._update_component_state(**monitored_attribute_values)
+            finally:
+                self._resync_update.active = False
+
+    def _monitored_attribute_values(
+        self, attribute_values: Sequence[tango.DeviceAttribute]
+    ) -> Dict[str, Any]:
+        """Return the values read from the device by lowercase attribute name."""
         monitored_attribute_values = {}
         for attr_value in attribute_values:
             attr_name = attr_value.name.lower()
             value = attr_value.value
             if isinstance(value, np.ndarray):
-                value = list(value)
+                value = read_only_array(value)
             monitored_attribute_values[attr_name] = value
+        return monitored_attribute_values
+
+    def _monitored_attributes_read_failed(
+        self, monitored_attributes: Tuple[str, ...], errors: Sequence[Any]
+    ) -> None:
+        """Record and log a failed read of the monitored attributes."""
+        self._device_call_failed(errors)
+        self.logger.error(
+            "Encountered an error retrieving the current values of %s from %s",
+            monitored_attributes,
+            self._tango_device_fqdn,
+        )
 
-        self._update_component_state(**monitored_attribute_values)
+    @staticmethod
+    def _use_push_callback_model() -> None:
+        """Have the replies of asynchronous calls pushed to their callbacks."""
+        api_util = tango.ApiUtil.instance()
+        if api_util.get_asynch_cb_sub_model() != tango.cb_sub_model.PUSH_CALLBACK:
+            api_util.set_asynch_cb_sub_model(tango.cb_sub_model.PUSH_CALLBACK)
+
+    def _device_responded(self) -> None:
+        """Record that the device responded to a call or sent a valid event."""
+        self._proxy_pool.mark_alive(self._tango_device_fqdn)
+        self.circuit_breaker.record_success()
+
+    def _device_call_failed(self, errors: Sequence[Any]) -> None:
+        """Record a failed call, counting it against the circuit breaker if the device
+        could not be reached.
+        """
+        self._proxy_pool.mark_unknown(self._tango_device_fqdn)
+        if any(
+            getattr(error, "reason", None) in UNREACHABLE_DEVICE_ERROR_REASONS for error in errors
+        ):
+            self.circuit_breaker.record_failure()
+        else:
+            # the device handled the call and reported an error
+            self.circuit_breaker.record_success()
 
     def _interpret_command_reply(self, command_name: str, reply: Any) -> Tuple[TaskStatus, Any]:
         """Default interpretation: return IN_PROGRESS and the reply."""
         reply = reply or f"{command_name} successfully executed"
         return TaskStatus.IN_PROGRESS, reply
 
+    def _command_arg_preview(self, command_arg: Any, truncate_arg_in_logs: bool) -> Any:
+        """Return the command argument as it should be logged."""
+        if not truncate_arg_in_logs:
+            return command_arg
+        arg_preview = str(command_arg)
+        if len(arg_preview) > LOGGED_ARG_MAX_LENGTH:
+            arg_preview = f"{arg_preview[:LOGGED_ARG_MAX_LENGTH]}..."
+        return arg_preview
+
+    def _command_failed(
+        self, command_name: str, arg_preview: Any, errors: Sequence[Any]
+    ) -> Tuple[TaskStatus, Any]:
+        """Log the errors of a failed command and return the FAILED status and description."""
+        self._device_call_failed(errors)
+        err_description = "".join([str(error.desc) for error in errors])
+        self.logger.error(
+            "Encountered an error executing [%s] with arg [%s] on [%s]: %s",
+            command_name,
+            arg_preview,
+            self._tango_device_fqdn,
+            err_description,
+        )
+        return TaskStatus.FAILED, err_description
+
+    def _command_status(self, command_name: str, reply: Any) -> Tuple[TaskStatus, Any]:
+        """Return the status and message of a command from its reply."""
+        self._device_responded()
+        if not isinstance(reply, (list, tuple)):
+            reply = reply or f"{command_name} successfully executed"
+            return TaskStatus.IN_PROGRESS, reply
+        return self._interpret_command_reply(command_name, reply)
+
     @check_communicating
+    @check_circuit_breaker
     def execute_command(
         self, command_name: str, command_arg: Any, truncate_arg_in_logs: bool = False
     ) -> Tuple[TaskStatus, Any]:
@@ -305,11 +542,7 @@ class TangoDeviceComponentManager(BaseComponentManager):
 
         Set `truncate_arg_in_logs` for commands whose argument is too large to log in full.
         """
-        arg_preview = command_arg
-        if truncate_arg_in_logs:
-            arg_preview = str(command_arg)
-            if len(arg_preview) > LOGGED_ARG_MAX_LENGTH:
-                arg_preview = f"{arg_preview[:LOGGED_ARG_MAX_LENGTH]}..."
+        arg_preview = self._command_arg_preview(command_arg, truncate_arg_in_logs)
         self.logger.debug(
             "About to execute command [%s] on device [%s] with param [%s]",
             command_name,
@@ -323,22 +556,56 @@ class TangoDeviceComponentManager(BaseComponentManager):
             try:
                 reply = device_proxy.command_inout(command_name, command_arg)
             except tango.DevFailed as err:
-                err_description = "".join([str(arg.desc) for arg in err.args])
-                self.logger.error(
-                    "Encountered an error executing [%s] with arg [%s] on [%s]: %s",
-                    command_name,
-                    arg_preview,
-                    self._tango_device_fqdn,
-                    err_description,
-                )
-                return TaskStatus.FAILED, err_description
+                return self._command_failed(command_name, arg_preview, err.args)
 
-        if not isinstance(reply, (list, tuple)):
-            reply = reply or f"{command_name} successfully executed"
-            return TaskStatus.IN_PROGRESS, reply
-        return self._interpret_command_reply(command_name, reply)
+        return self._command_status(command_name, reply)
 
     @check_communicating
+    @check_circuit_breaker
+    def execute_command_async(
+        self, command_name: str, command_arg: Any, truncate_arg_in_logs: bool = False
+    ) -> "Future[Tuple[TaskStatus, Any]]":
+        """Check the connection and execute the command without waiting for the reply.
+
+        The command is invoked asynchronously and the reply is pushed to a callback on a
+        Tango thread, so the caller can have commands in flight on several devices at once
+        without a thread per device. The returned future resolves to the same status and
+        message `execute_command` returns.
+
+        Set `truncate_arg_in_logs` for commands whose argument is too large to log in full.
+        """
+        arg_preview = self._command_arg_preview(command_arg, truncate_arg_in_logs)
+        self.logger.debug(
+            "About to execute command [%s] asynchronously on device [%s] with param [%s]",
+            command_name,
+            self._tango_device_fqdn,
+            arg_preview,
+        )
+        future: "Future[Tuple[TaskStatus, Any]]" = Future()
+        device_proxy = self._device_proxy_factory(self._tango_device_fqdn)
+
+        def _command_done(event: tango.CmdDoneEvent) -> None:
+            try:
+                if event.err:
+                    future.set_result(
+                        self._command_failed(command_name, arg_preview, event.errors)
+                    )
+                else:
+                    future.set_result(self._command_status(command_name, event.argout))
+            except Exception as err:  # pylint:disable=broad-except
+                future.set_exception(err)
+
+        with tango.EnsureOmniThread():
+            self._use_push_callback_model()
+            try:
+                device_proxy.command_inout_asynch(command_name, command_arg, _command_done)
+            except tango.DevFailed as err:
+                future.set_result(self._command_failed(command_name, arg_preview, err.args))
+
+        return future
+
+    @check_communicating
+    @check_circuit_breaker
     def read_attribute_value(self, attribute_name: str, log_read: bool = True) -> Any:
         """Check the connection and read an attribute."""
         if log_read:
@@ -351,13 +618,15 @@ class TangoDeviceComponentManager(BaseComponentManager):
         with tango.EnsureOmniThread():
             try:
                 result = device_proxy.read_attribute(attribute_name).value
-            except tango.DevFailed:
+            except tango.DevFailed as err:
+                self._device_call_failed(err.args)
                 self.logger.exception(
                     "Could not read attribute [%s] on [%s]",
                     attribute_name,
                     self._tango_device_fqdn,
                 )
                 raise
+            self._device_responded()
             if log_read:
                 self.logger.debug(
                     "Result of reading [%s] on [%s] is [%s]",
@@ -368,6 +637,7 @@ class TangoDeviceComponentManager(BaseComponentManager):
             return result
 
     @check_communicating
+    @check_circuit_breaker
     def write_attribute_value(self, attribute_name: str, attribute_value: Any) -> None:
         """Check the connection and write an attribute."""
         self.logger.debug(
@@ -380,7 +650,8 @@ class TangoDeviceComponentManager(BaseComponentManager):
             result = None
             try:
                 result = device_proxy.write_attribute(attribute_name, attribute_value)
-            except tango.DevFailed:
+            except tango.DevFailed as err:
+                self._device_call_failed(err.args)
                 self.logger.exception(
                     "Could not write to attribute [%s] with [%s] on [%s]",
                     attribute_name,
@@ -388,6 +659,7 @@ class TangoDeviceComponentManager(BaseComponentManager):
                     self._tango_device_fqdn,
                 )
                 raise
+            self._device_responded()
             self.logger.debug(
                 "Result of writing [%s] on [%s] is [%s]",
                 attribute_name,
@@ -396,30 +668,82 @@ class TangoDeviceComponentManager(BaseComponentManager):
             )
             return result
 
+    def _route_event(self, event: type_hints.EventDataType) -> None:
+        """Hand the event over to the thread processing its attribute's event group."""
+        attr_name = str(getattr(event, "attr_name", "")).split("/")[-1].lower()
+        group = self._event_groups.get(attr_name, DEFAULT_EVENT_GROUP)
+        priority = self._event_priorities.get(attr_name, EventPriority.NORMAL)
+        event_dispatcher = self._event_dispatcher
+        if event_dispatcher is None:
+            return
+
+        if attr_name in self._coalesced_attributes:
+            with self._coalesce_lock:
+                delivery_pending = attr_name in self._latest_events
+                self._latest_events[attr_name] = event
+                if delivery_pending:
+                    self._dropped_events[attr_name] += 1
+                    return
+            event_dispatcher.submit(
+                group, self._dispatch_latest_event, attr_name, priority=priority
+            )
+        else:
+            event_dispatcher.submit(group, self.dispatch_event, event, priority=priority)
+
+    def _dispatch_latest_event(self, attr_name: str) -> None:
+        """Dispatch the newest event received for a coalesced attribute."""
+        with self._coalesce_lock:
+            event = self._latest_events.pop(attr_name, None)
+        if event is not None:
+            self.dispatch_event(event)
+
+    @property
+    def dropped_event_counts(self) -> Dict[str, int]:
+        """Number of events of each coalesced attribute superseded before being processed."""
+        with self._coalesce_lock:
+            return dict(self._dropped_events)
+
     def _initialize_events_monitor(self) -> None:
         """Initialize the events monitor and queue."""
         # NOTE:
-        # Keep thread_count=1 so that Tango events, component-state updates, and
-        # communication-state transitions are processed sequentially. This preserves
-        # the behaviour of the original TangoDeviceComponentManager and avoids
-        # concurrent access to shared component-manager state.
-        #
-        # Increasing thread_count would allow callbacks from different event streams
-        # to execute concurrently, which may improve responsiveness for high-rate
-        # attributes.
+        # The callback scheduler keeps thread_count=1 so that Tango events are received
+        # in order. Without event groups they are also processed on that thread, which
+        # preserves strict ordering of all component-state updates and
+        # communication-state transitions.
         #
-        # TODO: Evaluate increasing thread_count
+        # With event groups, the events are handed to a sharded dispatcher with a thread
+        # per group, so that high-rate attributes (e.g. achievedPointing) do not delay
+        # mode and health events queued behind them. Ordering is kept within a group.
+        # Coalesced attributes also go through the dispatcher so that superseded events
+        # can be dropped before they are processed, and prioritised attributes so that
+        # their events overtake queued lower priority events.
         self._events_monitor = CallbackScheduler(
             thread_count=1, logger=self.logger, name="events_monitor"
         )
+        event_callback = self.dispatch_event
+        if self._event_groups or self._coalesced_attributes or self._event_priorities:
+            self._event_dispatcher = ShardedDispatcher(
+                len(set(self._event_groups.values()) | {DEFAULT_EVENT_GROUP}),
+                logger=self.logger,
+                name="events_dispatcher",
+            )
+            event_callback = self._route_event
         # set up change events subscriptions for all monitored attributes
         for attr in self._monitored_attributes:
             self._events_monitor.register_event_callback(
                 self._tango_device_fqdn,
                 attr,
                 tango.EventType.CHANGE_EVENT,
-                self.dispatch_event,
+                event_callback,
             )
+        if self.lrc_tracker is not None:
+            for attr in LRC_ATTRIBUTES:
+                self._events_monitor.register_event_callback(
+                    self._tango_device_fqdn,
+                    attr,
+                    tango.EventType.CHANGE_EVENT,
+                    self._dispatch_lrc_event,
+                )
 
     def _start_monitoring_when_proxy_available(self) -> None:
         """Create and cache the device proxy, then start event monitoring.
@@ -472,9 +796,17 @@ class TangoDeviceComponentManager(BaseComponentManager):
         """Shut down the events monitor and clear subscription tracking."""
         if self._events_monitor is not None:
             self._events_monitor.shutdown()
+        if self._event_dispatcher is not None:
+            self._event_dispatcher.shutdown()
 
         self._events_monitor = None
-        self._active_attr_event_subscriptions.clear()
+        self._event_dispatcher = None
+        with self._coalesce_lock:
+            self._latest_events.clear()
+        with self._subscriptions_lock:
+            self._active_attr_event_subscriptions.clear()
+        if self.lrc_tracker is not None:
+            self.lrc_tracker.reset()
 
     def start_communicating(self) -> None:
         """Establish communication with the device."""
@@ -513,4 +845,5 @@ class TangoDeviceComponentManager(BaseComponentManager):
 
         self._stop_event_monitoring()
         self._device_proxy_factory.factory_reset()
+        self.circuit_breaker.reset()
         self._update_communication_state(CommunicationStatus.DISABLED)
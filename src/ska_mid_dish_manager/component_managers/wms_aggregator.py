@@ -0,0 +1,232 @@
+"""Process-wide aggregation of the weather station wind speeds."""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+
+from ska_control_model import CommunicationStatus
+
+from ska_mid_dish_manager.component_managers.wms_cm import (
+    WMSComponentManager,
+    max_wind_speed_reading,
+    wind_speed_buffer_lengths,
+)
+from ska_mid_dish_manager.utils.window_statistics import RunningMean, WindowedMax
+
+# The (mean wind speed, wind gust) periods in seconds the windows are computed over
+WindProfile = Tuple[float, float]
+
+
+@dataclass
+class _ProfileWindows:
+    """The wind speed windows of a profile and the component managers subscribed to it."""
+
+    wind_speeds: RunningMean
+    wind_gusts: WindowedMax
+    subscribers: List[WMSComponentManager] = field(default_factory=list)
+
+
+class WMSAggregator:
+    """Polls a set of weather stations once for all the dishes of the process.
+
+    The WMS component managers of the dish managers subscribe to the aggregator of their
+    weather stations. It polls the stations with a single WMS component manager, computes
+    the mean wind speed and wind gust once per profile (the periods they are computed
+    over) and publishes them to the component managers subscribed with that profile, so
+    the station reads and the window computations do not grow with the number of dishes.
+
+    Polling starts with the first subscription and stops when the last one is removed,
+    which also closes the wind history file until polling starts again.
+    """
+
+    _instances: ClassVar[Dict[Tuple[str, ...], "WMSAggregator"]] = {}
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        wms_device_names: List[str],
+        logger: logging.Logger,
+        wms_polling_period: float = 1.0,
+        wind_history_path: Optional[str] = None,
+    ):
+        """:param wms_device_names: TRLs of the WMS devices to poll
+        :type wms_device_names: List[str]
+        :param logger: Logger instance
+        :type logger: logging.Logger
+        :param wms_polling_period: Polling period (in seconds) of the wind speeds
+        :type wms_polling_period: float
+        :param wind_history_path: Optional path of the file the polled wind speeds are
+            kept in, the windows of a new profile are filled from it
+        :type wind_history_path: Optional[str]
+        """
+        self.logger = logger
+        self._wms_device_names = list(wms_device_names)
+        self._wms_polling_period = wms_polling_period
+        self._wind_history_path = wind_history_path
+        self._profiles: Dict[WindProfile, _ProfileWindows] = {}
+        self._lock = threading.Lock()
+        # Serialises starting and stopping the poller, which must not hold the lock as
+        # the polling thread takes it to publish
+        self._lifecycle_lock = threading.Lock()
+        self._communication_state = CommunicationStatus.DISABLED
+        self._poller = WMSComponentManager(
+            self._wms_device_names,
+            logger=logger,
+            communication_state_callback=self._poller_communication_state_changed,
+            wms_polling_period=wms_polling_period,
+            wind_speed_data_callback=self._publish,
+            wind_history_path=wind_history_path,
+        )
+
+    @classmethod
+    def instance(
+        cls,
+        wms_device_names: List[str],
+        logger: Optional[logging.Logger] = None,
+        wms_polling_period: float = 1.0,
+        wind_history_path: Optional[str] = None,
+    ) -> "WMSAggregator":
+        """Return the aggregator of the weather stations shared by the whole process.
+
+        The polling period and wind history file are set by the first call for a set of
+        stations, a warning is logged if a later call asks for different ones.
+
+        :param wms_device_names: TRLs of the WMS devices to poll
+        :type wms_device_names: List[str]
+        :param logger: Logger instance
+        :type logger: Optional[logging.Logger]
+        :param wms_polling_period: Polling period (in seconds) of the wind speeds
+        :type wms_polling_period: float
+        :param wind_history_path: Optional path of the file the polled wind speeds are
+            kept in
+        :type wind_history_path: Optional[str]
+        :return: the aggregator of the stations
+        :rtype: WMSAggregator
+        """
+        key = tuple(sorted(name.lower() for name in wms_device_names))
+        with cls._instances_lock:
+            aggregator = cls._instances.get(key)
+            if aggregator is None:
+                aggregator = cls(
+                    list(wms_device_names),
+                    logger or logging.getLogger(__name__),
+                    wms_polling_period,
+                    wind_history_path,
+                )
+                cls._instances[key] = aggregator
+            elif wms_polling_period != aggregator._wms_polling_period or (
+                wind_history_path or None
+            ) != (aggregator._wind_history_path or None):
+                aggregator.logger.warning(
+                    "The WMS aggregator of %s polls every %ss with wind history file [%s], "
+                    "ignoring the requested polling period of %ss and wind history file [%s]",
+                    wms_device_names,
+                    aggregator._wms_polling_period,
+                    aggregator._wind_history_path,
+                    wms_polling_period,
+                    wind_history_path,
+                )
+            return aggregator
+
+    @property
+    def subscriber_count(self) -> int:
+        """The number of component managers subscribed."""
+        return sum(len(windows.subscribers) for windows in self._profiles.values())
+
+    def subscribe(self, subscriber: WMSComponentManager) -> None:
+        """Publish the wind speeds of the stations to a WMS component manager.
+
+        :param subscriber: The component manager, its periods select its profile
+        :type subscriber: WMSComponentManager
+        """
+        profile = (subscriber._wind_speed_moving_average_period, subscriber._wind_gust_period)
+        with self._lifecycle_lock:
+            # Start polling before filling the windows, starting opens the wind history
+            if not self._profiles:
+                self._poller.start_communicating()
+            with self._lock:
+                windows = self._profiles.get(profile)
+                if windows is None:
+                    wind_speed_length, wind_gust_length = wind_speed_buffer_lengths(
+                        len(self._wms_device_names), self._wms_polling_period, *profile
+                    )
+                    windows = _ProfileWindows(
+                        RunningMean(profile[0], wind_speed_length),
+                        WindowedMax(profile[1], wind_gust_length),
+                    )
+                    # Start from the readings polled before a restart
+                    current_time = time.time()
+                    windows.wind_speeds.extend(
+                        self._poller.wind_history_readings(profile[0], current_time)
+                    )
+                    windows.wind_speeds.prune(current_time)
+                    self._profiles[profile] = windows
+                if subscriber not in windows.subscribers:
+                    windows.subscribers.append(subscriber)
+                communication_state = self._communication_state
+
+            subscriber._update_communication_state(communication_state)
+
+    def unsubscribe(self, subscriber: WMSComponentManager) -> None:
+        """Stop publishing the wind speeds to a WMS component manager.
+
+        :param subscriber: The component manager
+        :type subscriber: WMSComponentManager
+        """
+        with self._lifecycle_lock:
+            with self._lock:
+                subscribed = False
+                for profile, windows in list(self._profiles.items()):
+                    if subscriber in windows.subscribers:
+                        subscribed = True
+                        windows.subscribers.remove(subscriber)
+                    if not windows.subscribers:
+                        del self._profiles[profile]
+                last_subscriber = subscribed and not self._profiles
+
+            if last_subscriber:
+                self._poller.stop_communicating()
+
+    def _poller_communication_state_changed(
+        self, communication_state: CommunicationStatus
+    ) -> None:
+        """Report the communication state of the stations to every subscriber."""
+        with self._lock:
+            self._communication_state = communication_state
+            subscribers = [
+                subscriber
+                for windows in self._profiles.values()
+                for subscriber in windows.subscribers
+            ]
+        for subscriber in subscribers:
+            subscriber._update_communication_state(communication_state)
+
+    def _publish(self, wind_speed_data_list: List[List[Any]], current_time: float) -> None:
+        """Update the windows of every profile and publish them to its subscribers.
+
+        :param wind_speed_data_list: The [timestamp, windspeed] readings of the cycle
+        :type wind_speed_data_list: List[List[Any]]
+        :param current_time: The current timestamp used for pruning stale readings
+        :type current_time: float
+        """
+        max_reading = max_wind_speed_reading(wind_speed_data_list)
+        updates = []
+        with self._lock:
+            for windows in self._profiles.values():
+                windows.wind_speeds.extend(wind_speed_data_list)
+                windows.wind_speeds.prune(current_time)
+                windows.wind_gusts.append(max_reading)
+                windows.wind_gusts.prune(current_time)
+                averages = {
+                    "meanwindspeed": windows.wind_speeds.value,
+                    "windgust": windows.wind_gusts.value,
+                }
+                updates.extend((subscriber, averages) for subscriber in windows.subscribers)
+
+        for subscriber, averages in updates:
+            try:
+                subscriber._update_component_state(**averages)
+            except Exception:  # pylint:disable=broad-except
+                self.logger.exception("Failed to publish the wind speeds to a WMS subscriber")
@@ -3,15 +3,59 @@
 import logging
 import threading
 import time
-from collections import deque
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import tango
 from ska_control_model import AdminMode, CommunicationStatus
 from ska_tango_base.base import BaseComponentManager
 
+from ska_mid_dish_manager.utils.state_updates import discard_unchanged
+from ska_mid_dish_manager.utils.wind_history import WindHistoryFile
+from ska_mid_dish_manager.utils.window_statistics import RunningMean, WindowedMax
+
 GROUP_REQUEST_TIMEOUT_MS = 3000
+# Consecutive polls a station may not reply in time before communication is reported lost
+MAX_CONSECUTIVE_MISSED_REPLIES = 3
+# Reasons of the group reply errors raised when a device has not replied in time
+REPLY_TIMEOUT_REASONS = frozenset({"API_AsynReplyNotArrived", "API_DeviceTimedOut"})
+
+
+def wind_speed_buffer_lengths(
+    wms_devices_count: int,
+    wms_polling_period: float,
+    wind_speed_moving_average_period: float,
+    wind_gust_period: float,
+) -> Tuple[int, int]:
+    """Return the max lengths of the mean wind speed and wind gust buffers.
+
+    Once the buffer is full we will have enough data points to determine the mean wind
+    speed and wind gust values. The additions of device count and 1 to the buffer lengths
+    ensure the wind speed readings of the first polling cycle are accounted for.
+
+    :return: the mean wind speed and wind gust buffer lengths
+    :rtype: Tuple[int, int]
+    """
+    wind_speed_buffer_length = (
+        int(wms_devices_count * (wind_speed_moving_average_period / wms_polling_period))
+        + wms_devices_count
+    )
+    wind_gust_buffer_length = int(wind_gust_period / wms_polling_period) + 1
+    return wind_speed_buffer_length, wind_gust_buffer_length
+
+
+def max_wind_speed_reading(wind_speed_data_list: list[list[float, float]]) -> list:
+    """Return the [timestamp, windspeed] reading of a polling cycle with the max windspeed.
+
+    :param wind_speed_data_list: The [timestamp, instantaneous wind speed] readings
+    :type wind_speed_data_list: list[list[float, float]]
+    :return: the reading with the highest windspeed, the first one if none has a value
+    :rtype: list
+    """
+    valid_wind_speeds = [ws for ws in wind_speed_data_list if ws[1] is not None]
+    if valid_wind_speeds:
+        return max(valid_wind_speeds, key=lambda ws: ws[1])
+    return wind_speed_data_list[0]
 
 
 class WMSComponentManager(BaseComponentManager):
@@ -41,6 +85,16 @@ class WMSComponentManager(BaseComponentManager):
     :param wind_gust_period: Time window (in seconds) over which the wind gust
         is calculated.
     :type wind_gust_period: Optional[float]
+    :param wind_speed_data_callback: Optional callback handed the wind speed data of
+        every polling cycle, along with the current time, instead of this component
+        manager computing its own mean wind speed and wind gust.
+    :type wind_speed_data_callback: Optional[Callable]
+    :param aggregator: Optional shared WMS aggregator polling the weather stations. When
+        given, the component manager subscribes to it instead of polling the stations.
+    :type aggregator: Optional[WMSAggregator]
+    :param wind_history_path: Optional path of the file the polled wind speeds are kept
+        in, so that the mean wind speed window is refilled from it on start.
+    :type wind_history_path: Optional[str]
     :param kwargs: Additional keyword arguments passed to the base component manager.
     :type kwargs: Any
     """
@@ -56,6 +110,9 @@ class WMSComponentManager(BaseComponentManager):
         wms_polling_period: Optional[float] = 1.0,
         wind_speed_moving_average_period: Optional[float] = 600.0,
         wind_gust_period: Optional[float] = 3.0,
+        wind_speed_data_callback: Optional[Callable] = None,
+        aggregator: Optional[Any] = None,
+        wind_history_path: Optional[str] = None,
         **kwargs: Any,
     ):
         self.logger = logger
@@ -64,28 +121,47 @@ class WMSComponentManager(BaseComponentManager):
         self._wms_polling_period = wms_polling_period
         self._wind_speed_moving_average_period = wind_speed_moving_average_period
         self._wind_gust_period = wind_gust_period
+        self._wind_speed_data_callback = wind_speed_data_callback
+        self._aggregator = aggregator
 
-        self._wms_device_group = tango.Group("wms_devices")
+        # Subscribers of an aggregator do not poll the stations themselves
+        self._wms_device_group = tango.Group("wms_devices") if aggregator is None else None
 
-        # Determine the max buffer length. Once the buffer is full we will have enough data
-        # points to determine the mean wind speed and wind gust values. The additions of
-        # device count and 1 to the buffer lengths ensure the wind speed readings
-        # of the first polling cycle are accounted for
-        self._wind_speed_buffer_length = (
-            int(
-                self._wms_devices_count
-                * (self._wind_speed_moving_average_period / self._wms_polling_period)
-            )
-            + self._wms_devices_count
+        self._wind_speed_buffer_length, self._wind_gust_buffer_length = wind_speed_buffer_lengths(
+            self._wms_devices_count,
+            self._wms_polling_period,
+            self._wind_speed_moving_average_period,
+            self._wind_gust_period,
         )
-        self._wind_gust_buffer_length = int(self._wind_gust_period / self._wms_polling_period) + 1
 
-        self._wind_speed_buffer = deque(maxlen=self._wind_speed_buffer_length)
-        self._wind_gust_buffer = deque(maxlen=self._wind_gust_buffer_length)
+        # The mean and maximum are updated as samples enter and leave the time windows,
+        # so the cost of a poll does not grow with the number of samples buffered
+        self._wind_speed_buffer = RunningMean(
+            self._wind_speed_moving_average_period, self._wind_speed_buffer_length
+        )
+        self._wind_gust_buffer = WindowedMax(self._wind_gust_period, self._wind_gust_buffer_length)
+        # The wind speeds polled are kept on disk for a warm start of the mean wind speed
+        self._wind_history_path = wind_history_path
+        self._wind_history = self._open_wind_history(wind_history_path)
+
+        # Each device reply of a group read is waited for in turn, share the polling period
+        # between them so that a read never takes longer than a polling cycle
+        self._wms_group_reply_timeout_ms = max(
+            1,
+            min(
+                GROUP_REQUEST_TIMEOUT_MS,
+                int(self._wms_polling_period * 1000 / max(1, self._wms_devices_count)),
+            ),
+        )
+        # The source timestamp of the last value read from each device
+        self._last_reply_timestamps: Dict[str, float] = {}
+        # The number of polls in a row each device has not replied in time
+        self._missed_reply_counts: Dict[str, int] = {}
 
-        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.executor = ThreadPoolExecutor(max_workers=1) if aggregator is None else None
 
         self._stop_monitoring_flag = threading.Event()
+        self._skipped_updates: Dict[str, int] = {}
 
         super().__init__(
             logger,
@@ -101,6 +177,10 @@ class WMSComponentManager(BaseComponentManager):
         """Add WMS device(s) to group and initiate WMS attr polling."""
         self.stop_communicating()
 
+        if self._aggregator is not None:
+            self._aggregator.subscribe(self)
+            return
+
         if not self._wms_device_names:
             self.logger.warning(
                 "WMS component manager instantiated without any WMS device names provided. "
@@ -111,6 +191,15 @@ class WMSComponentManager(BaseComponentManager):
 
         self._stop_monitoring_flag.clear()
 
+        if self._wind_history is None:
+            self._wind_history = self._open_wind_history(self._wind_history_path)
+        # Refill the mean wind speed window with the readings polled before the restart
+        current_time = time.time()
+        self._wind_speed_buffer.extend(
+            self.wind_history_readings(self._wind_speed_moving_average_period, current_time)
+        )
+        self._wind_speed_buffer.prune(current_time)
+
         self._wms_device_group.add(self._wms_device_names, timeout_ms=GROUP_REQUEST_TIMEOUT_MS)
 
         _wms_monitoring_started_future = self.executor.submit(self._start_monitoring)
@@ -130,6 +219,11 @@ class WMSComponentManager(BaseComponentManager):
 
     def stop_communicating(self) -> None:
         """Stop WMS attr polling and clean up windspeed data buffers."""
+        if self._aggregator is not None:
+            self._aggregator.unsubscribe(self)
+            self._update_communication_state(CommunicationStatus.DISABLED)
+            return
+
         self._stop_monitoring_flag.set()
 
         self.executor.shutdown(wait=True, cancel_futures=True)
@@ -137,6 +231,9 @@ class WMSComponentManager(BaseComponentManager):
 
         self._wind_speed_buffer.clear()
         self._wind_gust_buffer.clear()
+        self._last_reply_timestamps.clear()
+        self._missed_reply_counts.clear()
+        self._close_wind_history()
 
         try:
             self.write_wms_group_attribute_value("adminMode", AdminMode.OFFLINE)
@@ -149,33 +246,94 @@ class WMSComponentManager(BaseComponentManager):
         self._update_communication_state(CommunicationStatus.DISABLED)
 
     def _run_wms_group_polling(self, *args):
-        """Periodically fetch WMS windspeeds and publish avg wind speed and gust."""
+        """Periodically fetch WMS windspeeds and publish avg wind speed and gust.
+
+        The cycles start one polling period apart however long the group read takes, a
+        station replying late only misses the cycles it is late for.
+        """
+        next_poll_time = time.monotonic()
         while not self._stop_monitoring_flag.is_set():
+            next_poll_time += self._wms_polling_period
             try:
-                wind_speed_data_list = self.read_wms_group_attribute_value("windSpeed")
-                # The returned data is a list of lists, where the index 0 is the
-                # timestamp and index 1 is the polled windspeed
-                # eg: [[timestamp, windspeed_wms_1], [timestamp, windspeed_wms_2],...]
-
-                _current_time = wind_speed_data_list[0][0]
-
-                mws = self._compute_mean_wind_speed(
-                    wind_speed_data_list,
-                    _current_time,
+                wind_speed_data_list = self.read_wms_group_attribute_value(
+                    "windSpeed", timeout_ms=self._wms_group_reply_timeout_ms
                 )
+                # The returned data is a list of lists, where the index 0 is the
+                # source timestamp and index 1 is the polled windspeed
+                # eg: [[timestamp_wms_1, windspeed_wms_1], [timestamp_wms_2, windspeed_wms_2],...]
+                self._record_wind_history(wind_speed_data_list)
+                if wind_speed_data_list and self._wind_speed_data_callback is not None:
+                    self._wind_speed_data_callback(wind_speed_data_list, time.time())
+                elif wind_speed_data_list:
+                    _current_time = time.time()
+
+                    mws = self._compute_mean_wind_speed(
+                        wind_speed_data_list,
+                        _current_time,
+                    )
 
-                wg = self._process_wind_gust(
-                    wind_speed_data_list,
-                    _current_time,
-                )
+                    wg = self._process_wind_gust(
+                        wind_speed_data_list,
+                        _current_time,
+                    )
 
-                self._update_component_state(
-                    meanwindspeed=mws,
-                    windgust=wg,
-                )
+                    self._update_component_state(
+                        meanwindspeed=mws,
+                        windgust=wg,
+                    )
             except Exception:
                 self.logger.exception("Unexpected exception during WMS group polling")
-            self._stop_monitoring_flag.wait(timeout=self._wms_polling_period)
+            # Skip the cycles already missed rather than polling back to back
+            now = time.monotonic()
+            next_poll_time = max(next_poll_time, now)
+            self._stop_monitoring_flag.wait(timeout=next_poll_time - now)
+
+    def _open_wind_history(self, wind_history_path: Optional[str]) -> Optional[WindHistoryFile]:
+        """Open the wind history file, None if it is not configured or cannot be opened."""
+        if not wind_history_path:
+            return None
+        try:
+            return WindHistoryFile(wind_history_path, self._wind_speed_buffer_length)
+        except (OSError, ValueError):
+            self.logger.exception(
+                "Failed to open the wind history file [%s], the wind speeds will not be kept",
+                wind_history_path,
+            )
+            return None
+
+    def _close_wind_history(self) -> None:
+        """Write the wind history back to disk and close it, it is reopened on start."""
+        wind_history, self._wind_history = self._wind_history, None
+        if wind_history is not None:
+            wind_history.close()
+
+    def _record_wind_history(self, wind_speed_data_list: list[list[float, float]]) -> None:
+        """Append the wind speeds of a polling cycle to the wind history file."""
+        if self._wind_history is None or not wind_speed_data_list:
+            return
+        try:
+            self._wind_history.append(wind_speed_data_list)
+        except (OSError, ValueError):
+            self.logger.exception("Failed to write the wind speeds to the wind history file")
+            self._wind_history = None
+
+    def wind_history_readings(
+        self, period: float, current_time: Optional[float] = None
+    ) -> list[list[float, float]]:
+        """Return the wind speeds kept in the wind history file over the last period.
+
+        :param period: The time (in seconds) before the current time to return readings for
+        :type period: float
+        :param current_time: The current timestamp, the time now if not given
+        :type current_time: Optional[float]
+        :return: the [timestamp, windspeed] readings, oldest first
+        :rtype: list[list[float, float]]
+        """
+        if self._wind_history is None:
+            return []
+        if current_time is None:
+            current_time = time.time()
+        return self._wind_history.readings(since=current_time - period)
 
     def _compute_mean_wind_speed(
         self,
@@ -187,7 +345,7 @@ class WMSComponentManager(BaseComponentManager):
         This method extends the internal wind speed buffer with new wind speed data
         from the provided list of wind speeds fetched in the current polling cycle,
         prunes stale entries based on the current time and moving average period,
-        and computes the mean wind speed from the remaining buffer data.
+        and returns the mean wind speed kept up to date by the buffer.
 
         :param wind_speed_data_list: A list of lists, where each inner list contains
             [timestamp, instantaneous wind speed] values.
@@ -199,20 +357,8 @@ class WMSComponentManager(BaseComponentManager):
         :rtype: float
         """
         self._wind_speed_buffer.extend(wind_speed_data)
-
-        self._prune_stale_windspeed_data(
-            current_time,
-            self._wind_speed_moving_average_period,
-            self._wind_speed_buffer,
-        )
-
-        valid_wind_speeds = [ws[1] for ws in self._wind_speed_buffer if ws[1] is not None]
-        try:
-            _mean_wind_speed = sum(valid_wind_speeds) / len(valid_wind_speeds)
-        except ZeroDivisionError:
-            _mean_wind_speed = 0.0
-
-        return _mean_wind_speed
+        self._wind_speed_buffer.prune(current_time)
+        return self._wind_speed_buffer.value
 
     def _process_wind_gust(
         self,
@@ -236,72 +382,56 @@ class WMSComponentManager(BaseComponentManager):
         :returns: The maximum instantaneous wind speed (wind gust) in the buffer.
         :rtype: float
         """
-        # Traverse windspeed list, getting the index of the maximum
-        # instantaneous windspeed value to pass for wind gust processing
-        if len(wind_speed_data_list) > 1:
-            inst_ws = []
-            for ws in wind_speed_data_list:
-                inst_ws.append(ws[1])
-            max_inst_ws_index = inst_ws.index(max(inst_ws))
-            self._wind_gust_buffer.append(wind_speed_data_list[max_inst_ws_index])
-        else:
-            self._wind_gust_buffer.append(wind_speed_data_list[0])
-
-        self._prune_stale_windspeed_data(
-            current_time,
-            self._wind_gust_period,
-            self._wind_gust_buffer,
-        )
-        _wind_gust = max(ws[1] for ws in self._wind_gust_buffer)
+        # Only the maximum instantaneous windspeed of the polling cycle is passed
+        # for wind gust processing
+        self._wind_gust_buffer.append(max_wind_speed_reading(wind_speed_data_list))
 
-        return _wind_gust
+        self._wind_gust_buffer.prune(current_time)
+        return self._wind_gust_buffer.value
 
-    def _prune_stale_windspeed_data(
-        self,
-        current_time: float,
-        computation_window_period: float,
-        wind_speed_buffer: deque,
-    ) -> None:
-        """Removes stale windspeed data points from the provided wind speed data buffer.
-
-        This method prunes the `wind_speed_buffer` by removing data points whose timestamps
-        are older than the expiry time, which is calculated as
-        `current_time - computation_window_period`.
-
-        :param current_time: The current timestamp
-        :type current_time: float
-        :param computation_window_period: The time window period over which the mean wind speed
-            or the wind gust is being calculated
-        :type computation_window_period: float
-        :param wind_speed_buffer: The circular buffer containing windspeed data points
-        :type wind_speed_buffer: collections.deque
-        :return: None
-        """
-        _data_point_expiry_time = current_time - computation_window_period
-        # wind_speed_buffer[0][0] represents the timestamp of the oldest buffer datapoint
-        while wind_speed_buffer and (wind_speed_buffer[0][0] < _data_point_expiry_time):
-            wind_speed_buffer.popleft()
-
-    def read_wms_group_attribute_value(self, attribute_name: str) -> Any:
+    def read_wms_group_attribute_value(
+        self, attribute_name: str, timeout_ms: int = GROUP_REQUEST_TIMEOUT_MS
+    ) -> Any:
         """Reads the specified attribute from all devices in the WMS device group.
 
-        Attempts to read the given attribute from each device in the group, collecting
-        the value and timestamping it for each successful read. Communication state
-        is updated based on the success or failure of the operation.
+        The read is sent to every device of the group at once and each reply is waited
+        for at most `timeout_ms`, so a slow device does not hold up the others. Each
+        value read is stamped with the time the device read it. A device whose value is
+        not newer than the last one it returned is left out of this read.
+
+        A device which has not replied in time is skipped for this read: its late reply
+        is dropped rather than used in the next read, which reads a newer value anyway.
+        Communication state is reported as not established on a failed read, or once a
+        device has missed `MAX_CONSECUTIVE_MISSED_REPLIES` replies in a row, and as
+        established otherwise.
 
         :param attribute_name: The name of the attribute to read from each device
             in the group.
         :type attribute_name : str
+        :param timeout_ms: The time to wait for each device to reply, in milliseconds.
+        :type timeout_ms : int
         :return list of list: A list of lists, where each inner list contains the
             timestamp (float) and the attribute value read from a device.
         """
         reply_values = []
         read_error_raised = False
         try:
-            grp_reply = self._wms_device_group.read_attribute(attribute_name)
-            reply_timestamp = time.time()
+            request_id = self._wms_device_group.read_attribute_asynch(attribute_name)
+            grp_reply = self._wms_device_group.read_attribute_reply(request_id, timeout_ms)
             for reply in grp_reply:
+                device_name = reply.dev_name().lower()
                 if reply.has_failed():
+                    if self._is_reply_timeout(reply):
+                        missed_replies = self._missed_reply_counts.get(device_name, 0) + 1
+                        self._missed_reply_counts[device_name] = missed_replies
+                        if missed_replies < MAX_CONSECUTIVE_MISSED_REPLIES:
+                            self.logger.warning(
+                                "Skipping [%s] of [%s], it did not reply within %s ms",
+                                attribute_name,
+                                device_name,
+                                timeout_ms,
+                            )
+                            continue
                     self._update_communication_state(CommunicationStatus.NOT_ESTABLISHED)
                     err_msg = (
                         f"Failed to read attribute [{attribute_name}] "
@@ -310,11 +440,24 @@ class WMSComponentManager(BaseComponentManager):
                     )
                     self.logger.error(err_msg)
                     read_error_raised = True
+                    continue
+
+                self._missed_reply_counts.pop(device_name, None)
+                attribute = reply.get_data()
+                reply_timestamp = attribute.time.totime()
+                last_timestamp = self._last_reply_timestamps.get(device_name)
+                if last_timestamp is not None and reply_timestamp <= last_timestamp:
+                    self.logger.debug(
+                        "Discarding [%s] of [%s], it was not updated since the last read",
+                        attribute_name,
+                        device_name,
+                    )
                 else:
-                    reply_values.append([reply_timestamp, reply.get_data().value])
-                    # Only report comm state established if there were no read errors
-                    if not read_error_raised:
-                        self._update_communication_state(CommunicationStatus.ESTABLISHED)
+                    self._last_reply_timestamps[device_name] = reply_timestamp
+                    reply_values.append([reply_timestamp, attribute.value])
+                # Only report comm state established if there were no read errors
+                if not read_error_raised:
+                    self._update_communication_state(CommunicationStatus.ESTABLISHED)
         except tango.DevFailed as err:
             self._update_communication_state(CommunicationStatus.NOT_ESTABLISHED)
             self.logger.error(
@@ -322,8 +465,15 @@ class WMSComponentManager(BaseComponentManager):
                 f"read attribute [{attribute_name}] "
                 f"of group [{self._wms_device_group.get_name()}]: {err}",
             )
+        # Keep the samples of a read in time order for the window buffers
+        reply_values.sort(key=lambda reply_value: reply_value[0])
         return reply_values
 
+    @staticmethod
+    def _is_reply_timeout(reply: Any) -> bool:
+        """Return True if a failed group reply failed as the device did not reply in time."""
+        return any(error.reason in REPLY_TIMEOUT_REASONS for error in reply.get_err_stack())
+
     def write_wms_group_attribute_value(self, attribute_name: str, attribute_value: Any) -> None:
         """Writes the specified attribute value to all devices in the WMS Tango device group.
 
@@ -360,4 +510,9 @@ class WMSComponentManager(BaseComponentManager):
             for wind_param, average in component_state.items()
             if average is not None
         }
-        super()._update_component_state(**new_component_state)
+        # discard unchanged values before taking the lock shared with the other devices
+        new_component_state = discard_unchanged(
+            self._component_state, new_component_state, self._skipped_updates
+        )
+        if new_component_state:
+            super()._update_component_state(**new_component_state)
@@ -58,6 +58,7 @@ from ska_mid_dish_manager.models.constants import (
 from ska_mid_dish_manager.models.dish_enums import (
     Band,
     CapabilityStates,
+    CircuitBreakerState,
     DishDevice,
     DishMode,
     DscCmdAuthType,
@@ -111,6 +112,15 @@ class DishManager(SKAController):
     DefaultWatchdogTimeout = device_property(dtype=float, default_value=DEFAULT_WATCHDOG_TIMEOUT)
     # wms device names (e.g. ska-mid/weather-monitoring/1) to connect to
     WMSDeviceNames = device_property(dtype=DevVarStringArray, default_value=[])
+    WMSWindHistoryPath = device_property(
+        dtype=str,
+        doc=(
+            "Path of the file on local disk the polled wind speeds are kept in, to refill the"
+            " mean wind speed window on restart. The wind speeds are not kept if empty."
+            " The file is locked while in use, each device server process needs its own path."
+        ),
+        default_value="",
+    )
     MeanWindSpeedThreshold = device_property(
         dtype=float,
         doc="Threshold value for mean wind speed (in m/s) used to trigger stow.",
@@ -153,6 +163,7 @@ class DishManager(SKAController):
             default_watchdog_timeout=self.DefaultWatchdogTimeout,
             default_mean_wind_speed_threshold=self.MeanWindSpeedThreshold,
             default_wind_gust_threshold=self.WindGustThreshold,
+            wms_wind_history_path=self.WMSWindHistoryPath,
         )
 
     def init_command_objects(self) -> None:
@@ -486,6 +497,9 @@ class DishManager(SKAController):
             "b5dcconnectionstate": "b5dcConnectionState",
             "dscconnectionstate": "dscConnectionState",
             "b5dcserverconnectionstate": "b5dcServerConnectionState",
+            "spfcircuitbreakerstate": "spfCircuitBreakerState",
+            "spfrxcircuitbreakerstate": "spfrxCircuitBreakerState",
+            "dscircuitbreakerstate": "dsCircuitBreakerState",
             "noisediodemode": "noiseDiodeMode",
             "periodicnoisediodepars": "periodicNoiseDiodePars",
             "pseudorandomnoisediodepars": "pseudoRandomNoiseDiodePars",
@@ -735,6 +749,39 @@ class DishManager(SKAController):
             "b5dcserverconnectionstate", CommunicationStatus.NOT_ESTABLISHED
         )
 
+    @attribute(
+        dtype=CircuitBreakerState,
+        access=AttrWriteType.READ,
+        doc="Displays the circuit breaker state of the SPF device, calls fail fast while OPEN",
+    )
+    def spfCircuitBreakerState(self) -> CircuitBreakerState:
+        """Returns the spf circuit breaker state."""
+        return self.component_manager.component_state.get(
+            "spfcircuitbreakerstate", CircuitBreakerState.CLOSED
+        )
+
+    @attribute(
+        dtype=CircuitBreakerState,
+        access=AttrWriteType.READ,
+        doc="Displays the circuit breaker state of the SPFRx device, calls fail fast while OPEN",
+    )
+    def spfrxCircuitBreakerState(self) -> CircuitBreakerState:
+        """Returns the spfrx circuit breaker state."""
+        return self.component_manager.component_state.get(
+            "spfrxcircuitbreakerstate", CircuitBreakerState.CLOSED
+        )
+
+    @attribute(
+        dtype=CircuitBreakerState,
+        access=AttrWriteType.READ,
+        doc="Displays the circuit breaker state of the DS device, calls fail fast while OPEN",
+    )
+    def dsCircuitBreakerState(self) -> CircuitBreakerState:
+        """Returns the ds circuit breaker state."""
+        return self.component_manager.component_state.get(
+            "dscircuitbreakerstate", CircuitBreakerState.CLOSED
+        )
+
     @attribute(
         max_dim_x=3,
         dtype=(float,),
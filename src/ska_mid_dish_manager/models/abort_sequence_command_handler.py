@@ -70,8 +70,7 @@ class AbortSequenceCommandHandler:
         self.logger.debug("abort-sequence: transitioning to StandbyFP dish mode")
 
         sub_component_mgrs = self._component_manager.get_active_sub_component_managers()
-        for component_manager in sub_component_mgrs.values():
-            component_manager.update_state_from_monitored_attributes()
+        self._component_manager.resync_coordinator.resync(sub_component_mgrs.values())
 
         # only force the transition if the dish is not in FP already
         current_dish_mode = self._component_manager.component_state.get("dishmode")
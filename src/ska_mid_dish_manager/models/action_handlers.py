@@ -3,7 +3,8 @@
 import logging
 import time
 from abc import ABC
-from typing import Any, Callable, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ska_control_model import ResultCode, TaskStatus
 
@@ -14,12 +15,14 @@ from ska_mid_dish_manager.models.constants import (
 from ska_mid_dish_manager.models.fanned_out_command import (
     FannedOutCommand,
 )
+from ska_mid_dish_manager.models.resync_coordinator import ResyncCoordinator
 from ska_mid_dish_manager.utils.action_helpers import (
     check_component_state_matches_awaited,
     report_awaited_attributes,
     report_task_progress,
     update_task_status,
 )
+from ska_mid_dish_manager.utils.state_updates import StateChangeNotifier
 
 
 class Action(ABC):
@@ -65,6 +68,7 @@ class Action(ABC):
         self.timeout_s = timeout_s
         self._handler: Optional["ActionHandler"] = None
         self._progress_callback = dish_manager_cm._command_progress_callback
+        self.state_changes: Optional[StateChangeNotifier] = dish_manager_cm.component_state_changes
 
     @property
     def handler(self) -> "ActionHandler":
@@ -110,6 +114,9 @@ class ActionHandler:
         waiting_callback: Optional[Callable] = None,
         progress_callback: Optional[Callable] = None,
         timeout_s: float = DEFAULT_ACTION_TIMEOUT_S,
+        state_changes: Optional[StateChangeNotifier] = None,
+        concurrent_fan_out: bool = False,
+        asynchronous_fan_out: bool = False,
     ):
         """:param logger: Logger instance
         :type logger: Logger
@@ -134,6 +141,15 @@ class ActionHandler:
         :type progress_callback: Callable
         :param timeout_s: Timeout (in seconds) for the action to complete.
         :type timeout_s: float
+        :param state_changes: Optional notifier of component state changes. The handler wakes
+            up as soon as a change is notified instead of re-checking the commands every second.
+        :type state_changes: Optional[StateChangeNotifier]
+        :param concurrent_fan_out: Toggle to fan out the commands to different devices
+            concurrently. Commands to the same device are still fanned out in the order listed.
+        :type concurrent_fan_out: bool
+        :param asynchronous_fan_out: Toggle to fan out the commands to different devices
+            concurrently by sending them asynchronously, instead of with a thread per device.
+        :type asynchronous_fan_out: bool
         """
         self.logger = logger
         self.action_name = action_name
@@ -145,6 +161,9 @@ class ActionHandler:
         self.waiting_callback = waiting_callback
         self.progress_callback = progress_callback
         self.timeout_s = timeout_s or self._compute_timeout()
+        self.state_changes = state_changes
+        self.concurrent_fan_out = concurrent_fan_out
+        self.asynchronous_fan_out = asynchronous_fan_out
 
     def _compute_timeout(self) -> float:
         """Compute the timeout for the action based on the fanned out command timeouts.
@@ -155,6 +174,103 @@ class ActionHandler:
         max_timeout = max((c.timeout_s for c in self.fanned_out_commands), default=0)
         return max_timeout + 5 if max_timeout > 0 else 0
 
+    def _state_generation(self) -> int:
+        """:return: the generation of the component state changes, to pass to the wait."""
+        return self.state_changes.generation if self.state_changes is not None else 0
+
+    def _wait_for_state_change(self, task_abort_event: Any, generation: int, deadline: float):
+        """Wait for a component state change, an abort or at most a second.
+
+        Without a notifier the commands are re-checked every second. With one the wait still
+        times out after a second, as a fallback for command statuses which are not notified.
+
+        :param task_abort_event: Event or flag used to signal task abortion.
+        :type task_abort_event: Any
+        :param generation: The generation noted before the commands were last checked
+        :type generation: int
+        :param deadline: The time by which the awaited commands must complete
+        :type deadline: float
+        """
+        if self.state_changes is None:
+            task_abort_event.wait(timeout=1)
+            return
+        self.state_changes.wait(generation, timeout=max(0.0, min(1.0, deadline - time.time())))
+
+    def _fan_out(self, task_callback: Callable) -> Optional[FannedOutCommand]:
+        """Dispatch the fanned-out commands.
+
+        Commands are dispatched in the order listed, stopping at the first failure. With
+        concurrent fan out each device gets its own thread, so the fan out takes as long as
+        the slowest device rather than all of them together. With asynchronous fan out the
+        commands to each device are sent as the previous one is replied to, without threads.
+
+        :param task_callback: Callback function used for reporting.
+        :type task_callback: Callable
+        :return: The first fanned-out command which failed, None if none failed.
+        :rtype: Optional[FannedOutCommand]
+        """
+        device_commands: Dict[str, List[FannedOutCommand]] = {}
+        for cmd in self.fanned_out_commands:
+            device_commands.setdefault(cmd.device, []).append(cmd)
+
+        def _dispatch(commands: List[FannedOutCommand]) -> Optional[FannedOutCommand]:
+            for cmd in commands:
+                cmd.execute(task_callback)
+                if cmd.failed:
+                    return cmd
+            return None
+
+        if self.asynchronous_fan_out:
+            futures = [
+                self._dispatch_async(cmds, task_callback) for cmds in device_commands.values()
+            ]
+            failed_commands = [future.result() for future in futures]
+        elif not self.concurrent_fan_out or len(device_commands) < 2:
+            return _dispatch(self.fanned_out_commands)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=len(device_commands),
+                thread_name_prefix=f"{self.action_name}.fan_out",
+            ) as executor:
+                futures = [executor.submit(_dispatch, cmds) for cmds in device_commands.values()]
+                failed_commands = [future.result() for future in futures]
+        return next(
+            (cmd for cmd in self.fanned_out_commands if cmd in failed_commands),
+            None,
+        )
+
+    @staticmethod
+    def _dispatch_async(commands: List[FannedOutCommand], task_callback: Callable) -> Future:
+        """Send the commands in order, each once the previous one has been replied to.
+
+        :param commands: The fanned-out commands to one device
+        :type commands: List[FannedOutCommand]
+        :param task_callback: Callback function used for reporting.
+        :type task_callback: Callable
+        :return: A future resolving to the command which failed, None if none failed.
+        :rtype: Future
+        """
+        dispatched: Future = Future()
+
+        def _send(index: int) -> None:
+            if index == len(commands):
+                dispatched.set_result(None)
+                return
+            commands[index].execute_async(task_callback).add_done_callback(
+                lambda sent: _on_sent(index, sent)
+            )
+
+        def _on_sent(index: int, sent: Future) -> None:
+            if sent.exception() is not None:
+                dispatched.set_exception(sent.exception())
+            elif commands[index].failed:
+                dispatched.set_result(commands[index])
+            else:
+                _send(index + 1)
+
+        _send(0)
+        return dispatched
+
     def _trigger_failure(
         self,
         task_callback,
@@ -258,15 +374,14 @@ class ActionHandler:
         )
 
         # Fan-out: Dispatch all fanned-out commands
-        for cmd in self.fanned_out_commands:
-            cmd.execute(task_callback)
-            if cmd.failed:
-                self._trigger_failure(
-                    task_callback,
-                    task_abort_event,
-                    f"{self.action_name} failed {cmd.executed_cmd_response}",
-                )
-                return
+        failed_cmd = self._fan_out(task_callback)
+        if failed_cmd is not None:
+            self._trigger_failure(
+                task_callback,
+                task_abort_event,
+                f"{self.action_name} failed {failed_cmd.executed_cmd_response}",
+            )
+            return
 
         report_task_progress(
             f"Fanned out commands: {fanned_out_commands_str}", self.progress_callback
@@ -286,6 +401,7 @@ class ActionHandler:
 
         deadline = time.time() + self.timeout_s
         while deadline > time.time():
+            generation = self._state_generation()
             # Handle abort
             if task_abort_event.is_set():
                 self.logger.warning(f"Action '{self.action_name}' aborted.", extra=OPERATOR_TAG)
@@ -324,17 +440,21 @@ class ActionHandler:
             if self.waiting_callback:
                 self.waiting_callback()
 
-            task_abort_event.wait(timeout=1)
+            self._wait_for_state_change(task_abort_event, generation, deadline)
 
         # update the component state from an attribute read before giving up
         # this is a fallback in case the change event subscriptions missed updates
+        awaited_attributes: Dict[Any, Tuple[str, ...]] = {}
         for cmd in self.fanned_out_commands:
             if not cmd.finished:
                 if hasattr(cmd, "device_component_manager"):
                     device_component_manager = getattr(cmd, "device_component_manager")
-                    device_component_manager.update_state_from_monitored_attributes(
-                        tuple(cmd.awaited_component_state.keys())
+                    awaited_attributes[device_component_manager] = (
+                        *awaited_attributes.get(device_component_manager, ()),
+                        *cmd.awaited_component_state.keys(),
                     )
+        if awaited_attributes:
+            ResyncCoordinator(self.logger).resync(awaited_attributes, awaited_attributes)
         if all([cmd.successful for cmd in self.fanned_out_commands]):
             if self.awaited_component_state is None or check_component_state_matches_awaited(
                 self.component_state, self.awaited_component_state
@@ -423,6 +543,7 @@ class SequentialActionHandler(ActionHandler):
 
             deadline = time.time() + cmd.timeout_s
             while deadline > time.time():
+                generation = self._state_generation()
                 # Handle abort
                 if task_abort_event.is_set():
                     self.logger.warning(
@@ -440,7 +561,7 @@ class SequentialActionHandler(ActionHandler):
 
                 if cmd.failed or cmd.successful:
                     break
-                task_abort_event.wait(timeout=1)
+                self._wait_for_state_change(task_abort_event, generation, deadline)
 
             if cmd.failed:
                 message = (
@@ -110,6 +110,7 @@ class SetStandbyLPModeAction(Action):
             action_on_failure=self.action_on_failure,
             waiting_callback=self.waiting_callback,
             progress_callback=self._progress_callback,
+            state_changes=self.state_changes,
             timeout_s=self.timeout_s,
         )
 
@@ -196,6 +197,8 @@ class SetStandbyFPModeAction(Action):
             action_on_failure=self.action_on_failure,
             waiting_callback=self.waiting_callback,
             progress_callback=self._progress_callback,
+            state_changes=self.state_changes,
+            concurrent_fan_out=True,
             timeout_s=self.timeout_s,
         )
 
@@ -254,6 +257,8 @@ class SetOperateModeAction(Action):
             action_on_failure=self.action_on_failure,
             waiting_callback=self.waiting_callback,
             progress_callback=self._progress_callback,
+            state_changes=self.state_changes,
+            concurrent_fan_out=True,
             timeout_s=self.timeout_s,
         )
 
@@ -333,6 +338,7 @@ class SetMaintenanceModeAction(Action):
             action_on_failure=self.action_on_failure,
             waiting_callback=self.waiting_callback,
             progress_callback=self._progress_callback,
+            state_changes=self.state_changes,
             timeout_s=timeout_s,
         )
 
@@ -394,6 +400,7 @@ class TrackAction(Action):
             action_on_failure=self.action_on_failure,
             waiting_callback=self.waiting_callback,
             progress_callback=self._progress_callback,
+            state_changes=self.state_changes,
         )
         self.completed_message = (
             "Track command has been executed on DS. "
@@ -448,6 +455,7 @@ class TrackStopAction(Action):
             action_on_failure=self.action_on_failure,
             waiting_callback=self.waiting_callback,
             progress_callback=self._progress_callback,
+            state_changes=self.state_changes,
             timeout_s=timeout_s,
         )
 
@@ -475,7 +483,7 @@ def apply_pointing_model(
     try:
         values = dish_manager_cm.component_state[band_param_name]
 
-        if values:
+        if len(values):
             dish_manager_cm.update_pointing_model_params(band_param_name, values)
             logger.info(
                 f"Pointing model for band {band_name} applied successfully", extra=OPERATOR_TAG
@@ -659,6 +667,7 @@ class ConfigureBandAction(Action):
             action_on_failure=action_on_failure,
             waiting_callback=self.waiting_callback,
             progress_callback=self._progress_callback,
+            state_changes=self.state_changes,
             timeout_s=timeout_s,
         )
 
@@ -826,6 +835,7 @@ class ConfigureBand6Action(Action):
             action_on_failure=action_on_failure,
             waiting_callback=self.waiting_callback,
             progress_callback=self._progress_callback,
+            state_changes=self.state_changes,
             timeout_s=timeout_s,
         )
 
@@ -886,6 +896,7 @@ class SlewAction(Action):
             action_on_failure=action_on_failure,
             waiting_callback=self.waiting_callback,
             progress_callback=self._progress_callback,
+            state_changes=self.state_changes,
         )
         self.completed_message = (
             f"The DS has been commanded to Slew to {target}. "
@@ -947,6 +958,7 @@ class TrackLoadStaticOffAction(Action):
             action_on_failure=action_on_failure,
             waiting_callback=self.waiting_callback,
             progress_callback=self._progress_callback,
+            state_changes=self.state_changes,
             timeout_s=timeout_s,
         )
 
@@ -1011,6 +1023,7 @@ class AbortScanSequence(Action):
             action_on_failure=action_on_failure,
             waiting_callback=waiting_callback,
             progress_callback=self._progress_callback,
+            state_changes=self.state_changes,
             timeout_s=timeout_s,
         )
 
@@ -1057,5 +1070,6 @@ class InterlockAckAction(Action):
             action_on_failure=self.action_on_failure,
             waiting_callback=self.waiting_callback,
             progress_callback=self._progress_callback,
+            state_changes=self.state_changes,
             timeout_s=timeout_s,
         )
@@ -17,6 +17,29 @@ MEAN_WIND_SPEED_THRESHOLD_MPS = 11.1
 WIND_GUST_THRESHOLD_MPS = 16.9
 # TODO make configurable helm parameter on device property
 DEVICE_PROXY_TIMEOUT_MS = 5000
+# How long a device which responded or sent a valid event is trusted to be alive without
+# pinging it again before using its proxy
+DEVICE_LIVENESS_TTL_S = 5.0
+# Consecutive failures to reach a sub-device after which calls to it fail fast, and how long
+# they fail fast before a single trial call is let through to check if the device is back
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 3
+CIRCUIT_BREAKER_RESET_TIMEOUT_S = 10.0
+# Reasons of the errors raised when a device could not be reached, as opposed to errors
+# reported by a device which handled the call
+UNREACHABLE_DEVICE_ERROR_REASONS = frozenset(
+    {
+        "API_CantConnectToDevice",
+        "API_CommunicationFailed",
+        "API_ConnectionFailed",
+        "API_CorbaException",
+        "API_DeviceNotExported",
+        "API_DeviceTimedOut",
+        "API_ServerNotRunning",
+    }
+)
+# How long a resync waits for the sub-devices to reply to the reads of their monitored
+# attributes, the reads themselves time out after DEVICE_PROXY_TIMEOUT_MS
+RESYNC_TIMEOUT_S = 10.0
 STOW_ELEVATION_DEGREES = 90.2
 ELEVATION_SPEED_DEGREES_PER_SECOND = 1.0
 DEFAULT_ACTION_TIMEOUT_S = 120
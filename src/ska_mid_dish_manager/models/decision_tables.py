@@ -0,0 +1,173 @@
+"""Compile the transition rule sets into precomputed enum decision tables.
+
+The rules in ``models/transition_rules`` are ``rule_engine`` expressions over
+stringified component states. Every field they read is an enum, so the outcome
+of a rule set can be tabulated up front for every combination of the enum values
+it depends on. Evaluating a rule set then becomes a single dict lookup keyed by a
+tuple of enum values instead of running each expression over freshly stringified
+component states.
+"""
+
+import enum
+import itertools
+import re
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import rule_engine
+from ska_control_model import HealthState
+
+from ska_mid_dish_manager.models.dish_enums import (
+    Band,
+    DishMode,
+    DSOperatingMode,
+    DSPowerState,
+    IndexerPosition,
+    SPFBandInFocus,
+    SPFCapabilityStates,
+    SPFHealthState,
+    SPFOperatingMode,
+    SPFPowerState,
+    SPFRxCapabilityStates,
+    SPFRxOperatingMode,
+)
+
+# The enum each field referenced by the transition rules is reported as
+FIELD_ENUMS: Dict[Tuple[str, str], type] = {
+    ("DS", "operatingmode"): DSOperatingMode,
+    ("DS", "powerstate"): DSPowerState,
+    ("DS", "indexerposition"): IndexerPosition,
+    ("DS", "healthstate"): HealthState,
+    ("SPF", "operatingmode"): SPFOperatingMode,
+    ("SPF", "powerstate"): SPFPowerState,
+    ("SPF", "healthstate"): SPFHealthState,
+    ("SPF", "bandinfocus"): SPFBandInFocus,
+    ("SPF", "capabilitystate"): SPFCapabilityStates,
+    ("SPFRX", "operatingmode"): SPFRxOperatingMode,
+    ("SPFRX", "healthstate"): HealthState,
+    ("SPFRX", "configuredband"): Band,
+    ("SPFRX", "capabilitystate"): SPFRxCapabilityStates,
+    ("DM", "dishmode"): DishMode,
+}
+
+_FIELD_REFERENCE = re.compile(r"\b(DS|SPFRX|SPF|DM)\.(\w+)")
+
+
+def enum_label(value: enum.Enum) -> str:
+    """Render an enum as ``<EnumClass>.<NAME>``, the form used by the health state rules."""
+    return f"{type(value).__name__}.{value.name}"
+
+
+class DecisionTable:
+    """A rule set compiled into a lookup table keyed by the enum values it reads.
+
+    The table is built lazily on first use by evaluating the rule set once for every
+    combination of the enum values of the fields it references. Component states holding
+    values outside those enums (e.g. ``None`` or raw ints) are not tabulated; callers
+    fall back to evaluating the rules directly in that case.
+    """
+
+    def __init__(
+        self,
+        rules: Dict[str, rule_engine.Rule],
+        stringify: Callable[[Any], str] = str,
+    ):
+        """:param rules: An ordered mapping of outcome name to rule, first match wins
+        :type rules: Dict[str, rule_engine.Rule]
+        :param stringify: Converts an enum value to the string form the rules compare against
+        :type stringify: Callable[[Any], str]
+        """
+        self.rules = rules
+        self._stringify = stringify
+        self._rules_text = " ".join(rule.text for rule in rules.values())
+        referenced_fields = set(_FIELD_REFERENCE.findall(self._rules_text))
+        self.fields: Tuple[Tuple[str, str], ...] = tuple(sorted(referenced_fields))
+        self._field_enums = tuple(FIELD_ENUMS[field] for field in self.fields)
+        self._table: Optional[Dict[Tuple[enum.IntEnum, ...], Optional[str]]] = None
+        self._compile_lock = threading.Lock()
+
+    @property
+    def table(self) -> Dict[Tuple[enum.IntEnum, ...], Optional[str]]:
+        """The compiled table, built on first access."""
+        if self._table is None:
+            with self._compile_lock:
+                if self._table is None:
+                    self._table = self._compile()
+        return self._table
+
+    def _compile(self) -> Dict[Tuple[enum.IntEnum, ...], Optional[str]]:
+        """Tabulate the rule set for every combination of the referenced enum values.
+
+        The rules only compare fields against string literals, so every enum value which
+        does not appear as a literal in the rule set behaves the same way. The rules are
+        evaluated once per combination of the mentioned values plus a single representative
+        of the unmentioned ones, and the outcome is then fanned out over all enum values.
+        """
+        representatives = []
+        for enum_class in self._field_enums:
+            representative = {}
+            unmentioned = None
+            for value in enum_class:
+                if f"'{self._stringify(value)}'" in self._rules_text:
+                    representative[value] = value
+                else:
+                    unmentioned = unmentioned if unmentioned is not None else value
+                    representative[value] = unmentioned
+            representatives.append(representative)
+
+        outcomes = {}
+        for key in itertools.product(*(set(rep.values()) for rep in representatives)):
+            states: Dict[str, Dict[str, str]] = {}
+            for (device, attr), value in zip(self.fields, key):
+                states.setdefault(device, {})[attr] = self._stringify(value)
+            outcomes[key] = self.evaluate(states)
+
+        return {
+            key: outcomes[tuple(rep[value] for rep, value in zip(representatives, key))]
+            for key in itertools.product(*self._field_enums)
+        }
+
+    def key(self, component_states: Dict[str, Optional[dict]]) -> Tuple[enum.IntEnum, ...]:
+        """Build the lookup key from the raw component states.
+
+        :param component_states: Component state dicts keyed by device (DS, SPF, SPFRX, DM)
+        :type component_states: Dict[str, Optional[dict]]
+        :raises KeyError: If a referenced value is missing or is not of the expected enum
+        :return: the tuple of enum values the rule set depends on
+        """
+        key = []
+        for (device, attr), enum_class in zip(self.fields, self._field_enums):
+            value = (component_states.get(device) or {})[attr]
+            if not isinstance(value, enum_class):
+                raise KeyError((device, attr))
+            key.append(value)
+        return tuple(key)
+
+    def lookup(self, component_states: Dict[str, Optional[dict]]) -> Optional[str]:
+        """Return the name of the first matching rule, or None if no rule matches.
+
+        :raises KeyError: If the component states cannot be tabulated
+        """
+        return self.table[self.key(component_states)]
+
+    def evaluate(self, dish_manager_states: dict) -> Optional[str]:
+        """Evaluate the rules directly against collapsed (stringified) states."""
+        for name, rule in self.rules.items():
+            if rule.matches(dish_manager_states):
+                return name
+        return None
+
+
+_decision_tables: Dict[int, DecisionTable] = {}
+_decision_tables_lock = threading.Lock()
+
+
+def decision_table_for(
+    rules: Dict[str, rule_engine.Rule], stringify: Callable[[Any], str] = str
+) -> DecisionTable:
+    """Return the shared decision table for a rule set, creating it if needed."""
+    table = _decision_tables.get(id(rules))
+    if table is None:
+        with _decision_tables_lock:
+            table = _decision_tables.setdefault(id(rules), DecisionTable(rules, stringify))
+    return table
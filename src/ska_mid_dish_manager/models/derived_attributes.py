@@ -0,0 +1,118 @@
+"""Dependency graph of the attributes dish manager derives from sub-device component states.
+
+Each derived attribute declares the component state keys which trigger a recompute and the
+(device, key) pairs it reads. An event only recomputes the attributes it triggers, and only
+if the values those attributes read have changed since they were last computed.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# Component states keyed by device name (DS, SPF, SPFRX, B5DC and DM for dish manager)
+ComponentStates = Dict[str, dict]
+
+
+@dataclass(frozen=True)
+class DerivedAttribute:
+    """An attribute computed from the component states of the sub devices.
+
+    :param name: Name of the derived attribute
+    :param triggers: Component state keys which cause the attribute to be recomputed
+    :param inputs: The (device, key) pairs the computation reads
+    :param update: Computes and publishes the attribute from the component states. It may
+        return False if the attribute could not be published, to retry on the next trigger.
+    """
+
+    name: str
+    triggers: FrozenSet[str]
+    inputs: Tuple[Tuple[str, str], ...]
+    update: Callable[[ComponentStates], Optional[bool]]
+
+    def read_inputs(self, component_states: ComponentStates) -> Tuple[Tuple[type, Any], ...]:
+        """Return the current input values.
+
+        The type is kept next to each value so that a raw int is not mistaken for the
+        IntEnum member with the same value (e.g. a raw value read from a device).
+        """
+        values = []
+        for device, key in self.inputs:
+            value = component_states.get(device, {}).get(key)
+            values.append((type(value), value))
+        return tuple(values)
+
+
+class DerivedAttributeGraph:
+    """Recomputes derived attributes whose inputs changed.
+
+    The attributes are evaluated in declaration order, so an attribute which reads another
+    derived attribute (e.g. capability states reading dishMode) must be declared after it.
+    """
+
+    def __init__(self, derived_attributes: Iterable[DerivedAttribute]):
+        """:param derived_attributes: The derived attributes in evaluation order
+        :type derived_attributes: Iterable[DerivedAttribute]
+        """
+        self._derived_attributes = list(derived_attributes)
+        self._by_trigger: Dict[str, List[int]] = {}
+        for index, derived_attribute in enumerate(self._derived_attributes):
+            for trigger in derived_attribute.triggers:
+                self._by_trigger.setdefault(trigger, []).append(index)
+        self._last_inputs: Dict[str, Tuple] = {}
+        self._lock = threading.RLock()
+
+    def affected_by(self, keys: Iterable[str]) -> List[DerivedAttribute]:
+        """Return the derived attributes triggered by any of the keys, in evaluation order."""
+        indexes = set()
+        for key in keys:
+            indexes.update(self._by_trigger.get(key, ()))
+        return [self._derived_attributes[index] for index in sorted(indexes)]
+
+    def recompute(self, keys: Iterable[str], component_states: ComponentStates) -> List[str]:
+        """Recompute the attributes triggered by the keys whose inputs changed.
+
+        :param keys: The component state keys reported by the event
+        :type keys: Iterable[str]
+        :param component_states: The component states to compute from
+        :type component_states: ComponentStates
+        :return: the names of the attributes which were recomputed
+        :rtype: List[str]
+        """
+        recomputed = []
+        with self._lock:
+            for derived_attribute in self.affected_by(keys):
+                inputs = derived_attribute.read_inputs(component_states)
+                if self._last_inputs.get(derived_attribute.name) == inputs:
+                    continue
+                if derived_attribute.update(component_states) is False:
+                    # Not published, try again on the next trigger
+                    self._last_inputs.pop(derived_attribute.name, None)
+                else:
+                    self._last_inputs[derived_attribute.name] = inputs
+                recomputed.append(derived_attribute.name)
+        return recomputed
+
+    def recompute_all(self, component_states: ComponentStates) -> List[str]:
+        """Recompute every attribute whose inputs changed, whatever triggers it.
+
+        After `invalidate` this recomputes each attribute not recomputed since, so following
+        a batch of events with it recomputes every derived attribute exactly once.
+
+        :param component_states: The component states to compute from
+        :type component_states: ComponentStates
+        :return: the names of the attributes which were recomputed
+        :rtype: List[str]
+        """
+        return self.recompute(self._by_trigger, component_states)
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Forget the memoised inputs so the next trigger always recomputes.
+
+        :param name: The attribute to invalidate, all attributes if not given
+        :type name: Optional[str]
+        """
+        with self._lock:
+            if name is None:
+                self._last_inputs.clear()
+            else:
+                self._last_inputs.pop(name, None)
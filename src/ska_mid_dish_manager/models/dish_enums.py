@@ -195,6 +195,14 @@ class DscCtrlState(enum.IntEnum):
     NO_AUTHORITY = 4
 
 
+class CircuitBreakerState(enum.IntEnum):
+    """Circuit breaker state enums."""
+
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+
+
 class FannedOutCommandStatus(enum.IntEnum):
     """Fanned out command status enums."""
 
@@ -1,9 +1,11 @@
 """State transition computation."""
 
-from typing import Optional
+import logging
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
 from ska_control_model import CommunicationStatus, HealthState
 
+from ska_mid_dish_manager.models.decision_tables import decision_table_for, enum_label
 from ska_mid_dish_manager.models.dish_enums import (
     Band,
     CapabilityStates,
@@ -37,7 +39,53 @@ from ska_mid_dish_manager.models.transition_rules import (
 
 
 class StateTransition:
-    """Computes the next state from rules based on component updates."""
+    """Computes the next state from rules based on component updates.
+
+    The rule sets are evaluated through decision tables precompiled from the rules (see
+    :mod:`ska_mid_dish_manager.models.decision_tables`). Component states which cannot be
+    tabulated fall back to evaluating the rules directly.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, check_parity: bool = False):
+        """:param logger: Logger used to report decision table mismatches
+        :type logger: Optional[logging.Logger]
+        :param check_parity: Also evaluate the rules directly on every computation and report
+            any mismatch with the decision table result. The rule result is returned on mismatch.
+        :type check_parity: bool
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.check_parity = check_parity
+
+    def _match_rule(
+        self,
+        rules: dict,  # type: ignore
+        component_states: Dict[str, Optional[dict]],
+        stringify: Callable = str,
+    ) -> Optional[str]:
+        """Return the name of the first rule in `rules` matching the component states.
+
+        :param rules: The rule set to evaluate
+        :param component_states: Component state dicts keyed by DS, SPF, SPFRX and DM
+        :param stringify: How the rules expect enum values to be rendered
+        :return: the matching rule name or None
+        """
+        table = decision_table_for(rules, stringify)
+        try:
+            match = table.lookup(component_states)
+        except KeyError:
+            return table.evaluate(self._project(component_states, table.fields, stringify))
+
+        if self.check_parity:
+            expected = table.evaluate(self._project(component_states, table.fields, stringify))
+            if expected != match:
+                self.logger.error(
+                    "Decision table mismatch for %s: table [%s], rules [%s]",
+                    component_states,
+                    match,
+                    expected,
+                )
+                return expected
+        return match
 
     def compute_dish_mode(
         self,
@@ -55,10 +103,6 @@ class StateTransition:
         :return: the calculated dishMode
         :rtype: DishMode.
         """
-        dish_manager_states = self._collapse(
-            ds_component_state, spfrx_component_state, spf_component_state
-        )
-
         rules_to_use = dish_mode_rules_ds_only
         if spfrx_component_state and spf_component_state:
             rules_to_use = dish_mode_rules_all_devices
@@ -67,9 +111,12 @@ class StateTransition:
         elif spfrx_component_state:
             rules_to_use = dish_mode_rules_spf_ignored
 
-        for mode, rule in rules_to_use.items():
-            if rule.matches(dish_manager_states):
-                return DishMode[mode]
+        mode = self._match_rule(
+            rules_to_use,
+            {"DS": ds_component_state, "SPFRX": spfrx_component_state, "SPF": spf_component_state},
+        )
+        if mode is not None:
+            return DishMode[mode]
         return DishMode.UNKNOWN
 
     def _monitored_subdevice_disconnected(
@@ -188,35 +235,26 @@ class StateTransition:
         ):
             return HealthState.FAILED
 
-        dish_manager_states = self._collapse(
-            ds_component_state, spfrx_component_state, spf_component_state
-        )
-
-        # Get the current healthState enum
-        if ds_component_state:
-            dish_manager_states["DS"]["healthstate"] = ds_component_state.get(
-                "healthstate", HealthState.UNKNOWN
-            )
+        # Get the current healthState enums
+        health_states = {
+            "DS": {
+                "healthstate": HealthState(
+                    ds_component_state.get("healthstate", HealthState.UNKNOWN)
+                )
+            }
+        }
         if spfrx_component_state:
-            dish_manager_states["SPFRX"]["healthstate"] = spfrx_component_state.get(
-                "healthstate", HealthState.UNKNOWN
-            )
+            health_states["SPFRX"] = {
+                "healthstate": HealthState(
+                    spfrx_component_state.get("healthstate", HealthState.UNKNOWN)
+                )
+            }
         if spf_component_state:
-            dish_manager_states["SPF"]["healthstate"] = spf_component_state.get(
-                "healthstate", SPFHealthState.UNKNOWN
-            )
-
-        # Build the names used in the transition rules
-        # --------------------------------------------
-        ds_healthstate_name = HealthState(dish_manager_states["DS"]["healthstate"]).name
-        dish_manager_states["DS"]["healthstate"] = f"HealthState.{ds_healthstate_name}"
-
-        if "SPFRX" in dish_manager_states:
-            spfrx_healthstate_name = HealthState(dish_manager_states["SPFRX"]["healthstate"]).name
-            dish_manager_states["SPFRX"]["healthstate"] = f"HealthState.{spfrx_healthstate_name}"
-        if "SPF" in dish_manager_states:
-            spf_healthstate_name = SPFHealthState(dish_manager_states["SPF"]["healthstate"]).name
-            dish_manager_states["SPF"]["healthstate"] = f"SPFHealthState.{spf_healthstate_name}"
+            health_states["SPF"] = {
+                "healthstate": SPFHealthState(
+                    spf_component_state.get("healthstate", SPFHealthState.UNKNOWN)
+                )
+            }
 
         rules_to_use = health_state_rules_ds_only
         if spfrx_component_state and spf_component_state:
@@ -226,9 +264,14 @@ class StateTransition:
         elif spfrx_component_state:
             rules_to_use = health_state_rules_spf_ignored
 
-        for healthstate, rule in rules_to_use.items():
-            if rule.matches(dish_manager_states):
-                return HealthState[healthstate]
+        # The health rules use the names of the enums, e.g. HealthState.OK
+        healthstate = self._match_rule(
+            rules_to_use,
+            health_states,
+            enum_label,
+        )
+        if healthstate is not None:
+            return HealthState[healthstate]
 
         return HealthState.UNKNOWN
 
@@ -270,12 +313,6 @@ class StateTransition:
             cap_state = spfrx_component_state.get(f"{band}capabilitystate", None)
             spfrx_component_state["capabilitystate"] = cap_state
 
-        dish_manager_states = self._collapse(
-            ds_component_state,
-            spfrx_component_state,
-            spf_component_state,
-            dish_manager_component_state,
-        )
         rules_to_use = cap_state_rules_ds_only
         if spfrx_component_state and spf_component_state:
             rules_to_use = cap_state_rules_all_devices
@@ -284,14 +321,22 @@ class StateTransition:
         elif spfrx_component_state:
             rules_to_use = cap_state_rules_spf_ignored
 
+        capability_state = self._match_rule(
+            rules_to_use,
+            {
+                "DS": ds_component_state,
+                "SPFRX": spfrx_component_state,
+                "SPF": spf_component_state,
+                "DM": dish_manager_component_state,
+            },
+        )
+
         new_cap_state = CapabilityStates.UNKNOWN
-        for capability_state, rule in rules_to_use.items():
-            if rule.matches(dish_manager_states):
-                if capability_state.startswith("STANDBY"):
-                    new_cap_state = CapabilityStates["STANDBY"]
-                else:
-                    new_cap_state = CapabilityStates[capability_state]
-                break
+        if capability_state is not None:
+            if capability_state.startswith("STANDBY"):
+                new_cap_state = CapabilityStates["STANDBY"]
+            else:
+                new_cap_state = CapabilityStates[capability_state]
 
         # Clean up state dicts
         for state_dict in [
@@ -321,9 +366,6 @@ class StateTransition:
         :return: the calculated configuredband
         :rtype: Band
         """
-        dish_manager_states = self._collapse(
-            ds_component_state, spfrx_component_state, spf_component_state
-        )
         rules_to_use = config_rules_ds_only
         if spfrx_component_state and spf_component_state:
             rules_to_use = config_rules_all_devices
@@ -332,9 +374,12 @@ class StateTransition:
         elif spfrx_component_state:
             rules_to_use = config_rules_spf_ignored
 
-        for band_number, rule in rules_to_use.items():
-            if rule.matches(dish_manager_states):
-                return Band[band_number]
+        band_number = self._match_rule(
+            rules_to_use,
+            {"DS": ds_component_state, "SPFRX": spfrx_component_state, "SPF": spf_component_state},
+        )
+        if band_number is not None:
+            return Band[band_number]
         return Band.UNKNOWN
 
     def compute_spf_band_in_focus(
@@ -351,14 +396,16 @@ class StateTransition:
         :return: the calculated bandinfocus
         :rtype: SPFBandInFocus
         """
-        dish_manager_states = self._collapse(ds_component_state, spfrx_component_state)
         rules_to_use = band_focus_rules_all_devices
         if not spfrx_component_state:
             rules_to_use = band_focus_rules_spfrx_ignored
 
-        for band_number, rule in rules_to_use.items():
-            if rule.matches(dish_manager_states):
-                return SPFBandInFocus[band_number]
+        band_number = self._match_rule(
+            rules_to_use,
+            {"DS": ds_component_state, "SPFRX": spfrx_component_state},
+        )
+        if band_number is not None:
+            return SPFBandInFocus[band_number]
         return SPFBandInFocus.UNKNOWN
 
     def compute_power_state(
@@ -375,48 +422,44 @@ class StateTransition:
         :return: the calculated powerstate
         :rtype: PowerState
         """
-        dish_manager_states = self._collapse(
-            ds_component_state, spf_component_state=spf_component_state
-        )
         rules_to_use = power_state_rules_all_devices
         if not spf_component_state:
             rules_to_use = power_state_rules_spf_ignored
 
-        for power_state, rule in rules_to_use.items():
-            if rule.matches(dish_manager_states):
-                if power_state.startswith("UPS"):
-                    return PowerState[power_state]
-                _power_state = power_state.split("_")[0]  # pylint: disable=use-maxsplit-arg
-                return PowerState[_power_state]
+        power_state = self._match_rule(
+            rules_to_use,
+            {"DS": ds_component_state, "SPF": spf_component_state},
+        )
+        if power_state is not None:
+            if power_state.startswith("UPS"):
+                return PowerState[power_state]
+            _power_state = power_state.split("_")[0]  # pylint: disable=use-maxsplit-arg
+            return PowerState[_power_state]
         return PowerState.LOW
 
-    @classmethod
-    def _collapse(
-        cls,
-        ds_component_state: dict,  # type: ignore
-        spfrx_component_state: Optional[dict] = None,
-        spf_component_state: Optional[dict] = None,  # type: ignore
-        dish_manager_component_state: Optional[dict] = None,  # type: ignore
+    @staticmethod
+    def _project(
+        component_states: Dict[str, Optional[dict]],
+        fields: Iterable[Tuple[str, str]],
+        stringify: Callable = str,
     ) -> dict:  # type: ignore
-        """Collapse multiple state dicts into one."""
-        dish_manager_states = {"DS": {}}  # type: ignore
-
-        for key, val in ds_component_state.items():
-            dish_manager_states["DS"][key] = str(val)
+        """Collapse the fields a rule set reads from multiple state dicts into one.
 
-        if spfrx_component_state:
-            dish_manager_states["SPFRX"] = {}
-            for key, val in spfrx_component_state.items():
-                dish_manager_states["SPFRX"][key] = str(val)
-
-        if spf_component_state:
-            dish_manager_states["SPF"] = {}
-            for key, val in spf_component_state.items():
-                dish_manager_states["SPF"][key] = str(val)
-
-        if dish_manager_component_state:
-            dish_manager_states["DM"] = {}
-            for key, val in dish_manager_component_state.items():
-                dish_manager_states["DM"][key] = str(val)
+        Only the referenced fields are extracted and stringified, the rest of the component
+        state (pointing model parameters, achieved pointing, health info, etc.) is not touched.
 
+        :param component_states: Component state dicts keyed by DS, SPF, SPFRX and DM
+        :param fields: The (device, attribute) pairs referenced by the rule set
+        :param stringify: How the rules expect enum values to be rendered
+        :return: the stringified states the rules are evaluated against
+        """
+        dish_manager_states: Dict[str, dict] = {
+            device: {}
+            for device, component_state in component_states.items()
+            if component_state or device == "DS"
+        }
+        for device, attr in fields:
+            component_state = component_states.get(device)
+            if component_state and attr in component_state:
+                dish_manager_states[device][attr] = stringify(component_state[attr])
         return dish_manager_states
@@ -4,7 +4,8 @@ import enum
 import json
 import logging
 import time
-from typing import Any, Callable, Optional
+from concurrent.futures import Future
+from typing import Any, Callable, Optional, Tuple
 
 from ska_control_model import ResultCode, TaskStatus
 
@@ -17,6 +18,7 @@ from ska_mid_dish_manager.utils.action_helpers import (
     report_awaited_attributes,
     report_task_progress,
 )
+from ska_mid_dish_manager.utils.state_updates import ComponentStateView
 
 
 class FannedOutCommand:
@@ -110,36 +112,73 @@ class FannedOutCommand:
         self.logger.info(msg, extra=OPERATOR_TAG)
         report_task_progress(msg, self._progress_callback)
 
-    def execute(self, task_callback: Callable) -> None:
-        """Execute the fanned out command."""
+    def _start(self) -> bool:
+        """Mark the command as in progress, unless it is skipped as already satisfied.
+
+        :return: whether the command should be executed
+        :rtype: bool
+        """
         if self.skip_if_already_satisfied and self.already_satisfied:
             self._report_already_satisfied()
             self._status = FannedOutCommandStatus.IGNORED
             self._task_finish_reported = True
             self.awaited_update_reports = {attr: True for attr in self.awaited_update_reports}
-            return
+            return False
 
         self.logger.debug(f"Executing {self.command_name} with arg {self.command_argument}")
         self._status = FannedOutCommandStatus.IN_PROGRESS
         self.start_time = time.time()
+        return True
 
-        try:
-            res = self.command()
-            assert len(res) == 2, (
-                f"FannedOutCommand 'command' Callable expects a response of len 2, but got '{res}'"
+    def _handle_response(self, res: Tuple[Any, Any]) -> None:
+        """Record the response of the executed command and report what is awaited."""
+        assert len(res) == 2, (
+            f"FannedOutCommand 'command' Callable expects a response of len 2, but got '{res}'"
+        )
+        self.executed_cmd_response, self.executed_cmd_message = res
+
+        if self.awaited_component_state is not None:
+            awaited_attributes = list(self.awaited_component_state.keys())
+            awaited_values = list(self.awaited_component_state.values())
+            report_awaited_attributes(
+                self._progress_callback, awaited_attributes, awaited_values, self.device
             )
-            self.executed_cmd_response, self.executed_cmd_message = res
 
-            if self.awaited_component_state is not None:
-                awaited_attributes = list(self.awaited_component_state.keys())
-                awaited_values = list(self.awaited_component_state.values())
-                report_awaited_attributes(
-                    self._progress_callback, awaited_attributes, awaited_values, self.device
-                )
+    def _handle_failure(self, e: RuntimeError) -> None:
+        """Record the command as failed."""
+        self.logger.error(f"FannedOutCommand '{self.command_name}' failed to execute: {e}")
+        self._status = FannedOutCommandStatus.FAILED
+        self.executed_cmd_response = f"{e.args[0]}"
+
+    def execute(self, task_callback: Callable) -> None:
+        """Execute the fanned out command."""
+        if not self._start():
+            return
+
+        try:
+            self._handle_response(self.command())
         except RuntimeError as e:
-            self.logger.error(f"FannedOutCommand '{self.command_name}' failed to execute: {e}")
-            self._status = FannedOutCommandStatus.FAILED
-            self.executed_cmd_response = f"{e.args[0]}"
+            self._handle_failure(e)
+
+    def execute_async(self, task_callback: Callable) -> Future:
+        """Execute the fanned out command, returning a future which is done once it is sent.
+
+        The command is executed before returning, subclasses which can send their command
+        without blocking return while it is still in flight.
+
+        :param task_callback: Callback function used for reporting.
+        :type task_callback: Callable
+        :return: A future which resolves once the command has been sent
+        :rtype: Future
+        """
+        sent: Future = Future()
+        try:
+            self.execute(task_callback)
+        except Exception as err:  # pylint:disable=broad-except
+            sent.set_exception(err)
+        else:
+            sent.set_result(None)
+        return sent
 
     @property
     def status(self) -> FannedOutCommandStatus:
@@ -275,10 +314,9 @@ class FannedOutTangoCommand(FannedOutCommand):
             device=device,
             command_name=f"{command_name}",
             command=self._execute_tango_command,
-            # use device_component_manager._component_state to pass the dict by reference
-            # device_component_manager.component_state will use the tango base property which will
-            # do a deep copy
-            component_state=self.device_component_manager._component_state,
+            # view the component state the device component manager currently publishes,
+            # device_component_manager.component_state would return a copy
+            component_state=ComponentStateView(self.device_component_manager),
             command_argument=command_argument,
             awaited_component_state=awaited_component_state,
             timeout_s=timeout_s,
@@ -296,13 +334,54 @@ class FannedOutTangoCommand(FannedOutCommand):
             self._status = FannedOutCommandStatus.IGNORED
             return None, None
 
-        task_status, msg = self.device_component_manager.execute_command(
-            self.command_name, self.command_argument
+        return self._check_task_status(
+            *self.device_component_manager.execute_command(
+                self.command_name, self.command_argument
+            )
         )
+
+    def _check_task_status(self, task_status: TaskStatus, msg: Any) -> tuple:
+        """Raise a RuntimeError if the device did not accept the command."""
         if task_status in [TaskStatus.FAILED, TaskStatus.REJECTED, TaskStatus.ABORTED]:
             raise RuntimeError(msg)
         return task_status, msg
 
+    def execute_async(self, task_callback: Callable) -> Future:
+        """Send the command to the device without waiting for its reply.
+
+        :param task_callback: Callback function used for reporting.
+        :type task_callback: Callable
+        :return: A future which resolves once the device has replied to the command
+        :rtype: Future
+        """
+        if self.is_device_ignored:
+            return super().execute_async(task_callback)
+
+        sent: Future = Future()
+        if not self._start():
+            sent.set_result(None)
+            return sent
+
+        def _command_replied(reply: Future) -> None:
+            try:
+                self._handle_response(self._check_task_status(*reply.result()))
+            except RuntimeError as e:
+                self._handle_failure(e)
+            except Exception as err:  # pylint:disable=broad-except
+                sent.set_exception(err)
+                return
+            sent.set_result(None)
+
+        try:
+            reply = self.device_component_manager.execute_command_async(
+                self.command_name, self.command_argument
+            )
+        except Exception as err:  # pylint:disable=broad-except
+            sent.set_exception(err)
+            return sent
+        reply.add_done_callback(_command_replied)
+        return sent
+
 
 class FannedOutTangoLongRunningCommand(FannedOutTangoCommand):
     def __init__(
@@ -355,9 +434,9 @@ class FannedOutTangoLongRunningCommand(FannedOutTangoCommand):
             skip_if_already_satisfied=skip_if_already_satisfied,
         )
 
-    def _execute_tango_command(self) -> tuple:
-        """Fan out the respective command to the device and handle task status response."""
-        task_status, msg = super()._execute_tango_command()
+    def _check_task_status(self, task_status: TaskStatus, msg: Any) -> tuple:
+        """Handle the task status response of the device to the command."""
+        task_status, msg = super()._check_task_status(task_status, msg)
 
         # If the command completed immediately then it won't appear in the LRC attributes. Mark
         # the lrc as complete, the component state check will be used to complete the command.
@@ -366,8 +445,19 @@ class FannedOutTangoLongRunningCommand(FannedOutTangoCommand):
 
         return task_status, msg
 
+    def _tracked_lrcs(self, attr_name: str) -> Optional[dict]:
+        """Get the tracked entries of an LRC attribute by uid, None if it is not tracked."""
+        lrc_tracker = self.device_component_manager.lrc_tracker
+        if lrc_tracker is None:
+            return None
+        return lrc_tracker.table(attr_name)
+
     def _is_command_in_lrc_queued(self) -> bool:
         """Check if the long running command is in the lrcQueue attribute."""
+        tracked_lrcs = self._tracked_lrcs("lrcqueue")
+        if tracked_lrcs is not None:
+            return self.executed_cmd_message in tracked_lrcs
+
         lrc_queue = self.device_component_manager.read_attribute_value("lrcqueue", log_read=False)
         if not isinstance(lrc_queue, tuple):
             self.logger.error(
@@ -388,6 +478,10 @@ class FannedOutTangoLongRunningCommand(FannedOutTangoCommand):
 
     def _is_command_in_lrc_executing(self) -> bool:
         """Check if the long running command is in the lrcExecuting attribute."""
+        tracked_lrcs = self._tracked_lrcs("lrcexecuting")
+        if tracked_lrcs is not None:
+            return self.executed_cmd_message in tracked_lrcs
+
         lrc_executing = self.device_component_manager.read_attribute_value(
             "lrcexecuting", log_read=False
         )
@@ -410,6 +504,10 @@ class FannedOutTangoLongRunningCommand(FannedOutTangoCommand):
 
     def _get_command_lrc_finished_dict(self) -> Optional[dict]:
         """Get the lrcFinished dict for the long running command."""
+        tracked_lrcs = self._tracked_lrcs("lrcfinished")
+        if tracked_lrcs is not None:
+            return tracked_lrcs.get(self.executed_cmd_message)
+
         lrc_finished = self.device_component_manager.read_attribute_value(
             "lrcfinished", log_read=False
         )
@@ -0,0 +1,82 @@
+"""Resync the component states of the sub-devices from reads of their monitored attributes."""
+
+import logging
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, Iterable, List, Optional, Tuple
+
+from ska_mid_dish_manager.models.constants import RESYNC_TIMEOUT_S
+
+
+class ResyncCoordinator:
+    """Reads the monitored attributes of several sub-devices at once.
+
+    Each sub-device is read with one asynchronous multi-attribute read and all the reads are
+    in flight together, so a resync takes about as long as the slowest device rather than
+    the sum of all of them. Once every device has replied, or the timeout has passed, the
+    values read are applied to the component states inside a single batch, the
+    `batch_update` context, so the updates they cause can be published together.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        batch_update: Callable[[], ContextManager] = nullcontext,
+        timeout_s: float = RESYNC_TIMEOUT_S,
+    ):
+        """:param logger: Logger instance
+        :type logger: logging.Logger
+        :param batch_update: Returns the context the read values are applied in, e.g. a
+            transaction publishing the resulting dish manager updates together
+        :type batch_update: Callable[[], ContextManager]
+        :param timeout_s: The maximum time (in seconds) to wait for the devices to reply
+        :type timeout_s: float
+        """
+        self.logger = logger
+        self._batch_update = batch_update
+        self._timeout_s = timeout_s
+
+    def resync(
+        self,
+        component_managers: Iterable[Any],
+        monitored_attributes: Optional[Dict[Any, Tuple[str, ...]]] = None,
+    ) -> None:
+        """Read the monitored attributes of the sub-devices and apply the values read.
+
+        :param component_managers: The component managers of the sub-devices to resync
+        :type component_managers: Iterable[Any]
+        :param monitored_attributes: The attributes to read per component manager, all of
+            its monitored attributes for the component managers not listed
+        :type monitored_attributes: Optional[Dict[Any, Tuple[str, ...]]]
+        """
+        monitored_attributes = monitored_attributes or {}
+        reads = []
+        for component_manager in component_managers:
+            try:
+                future = component_manager.read_monitored_attributes_async(
+                    monitored_attributes.get(component_manager)
+                )
+            except Exception:  # pylint:disable=broad-except
+                self.logger.exception(
+                    "Failed to read the monitored attributes of %s",
+                    type(component_manager).__name__,
+                )
+                continue
+            reads.append((component_manager, future))
+
+        deadline = time.monotonic() + self._timeout_s
+        results: List[Tuple[Any, Dict[str, Any]]] = []
+        for component_manager, future in reads:
+            try:
+                values = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except Exception:  # pylint:disable=broad-except
+                self.logger.exception(
+                    "Failed to read the monitored attributes of %s",
+                    type(component_manager).__name__,
+                )
+                continue
+            results.append((component_manager, values))
+
+        with self._batch_update():
+            for component_manager, values in results:
+                component_manager.apply_monitored_attribute_values(values)
@@ -0,0 +1,50 @@
+"""Read-only array values for spectrum attributes held in the component states."""
+
+from typing import Any
+
+import numpy as np
+
+
+def read_only_array(value: Any) -> np.ndarray:
+    """Return a read-only view of an array without copying it.
+
+    Events deliver spectrum attributes as numpy arrays. Keeping a read-only view holds on
+    to the event buffer instead of copying it into a list, and as the view cannot be
+    modified, copies of the component state can share it. The view is a plain ndarray so
+    comparisons stay element-wise, use `values_equal` to compare values for change
+    detection.
+
+    :param value: The array received from the device
+    :type value: Any
+    :return: the read-only view
+    :rtype: np.ndarray
+    """
+    if isinstance(value, np.ndarray) and not value.flags.writeable:
+        return value
+    array = np.asarray(value).view()
+    array.setflags(write=False)
+    return array
+
+
+def values_equal(current: Any, value: Any) -> bool:
+    """Return True if a component state value is unchanged by an update.
+
+    Arrays are equal when they have the same shape and values, NaN equal to NaN, so they
+    can be change detected like any other value. Other values are compared with `==`.
+
+    :param current: The value held in the component state
+    :type current: Any
+    :param value: The updated value
+    :type value: Any
+    :return: whether the value is unchanged
+    :rtype: bool
+    """
+    if current is value:
+        return True
+    if isinstance(current, np.ndarray) or isinstance(value, np.ndarray):
+        try:
+            return bool(np.array_equal(current, value, equal_nan=True))
+        except TypeError:
+            # equal_nan is not supported for non numeric values
+            return bool(np.array_equal(current, value))
+    return not current != value
@@ -0,0 +1,123 @@
+"""Fail fast on calls to a sub-device which cannot be reached."""
+
+import threading
+import time
+from typing import Callable, Optional
+
+from ska_mid_dish_manager.models.constants import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RESET_TIMEOUT_S,
+)
+from ska_mid_dish_manager.models.dish_enums import CircuitBreakerState
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of calling a device while its circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Per-device circuit breaker.
+
+    The breaker is CLOSED while the device responds and opens after consecutive failures
+    to reach it. While OPEN, calls fail fast instead of each waiting out the proxy timeout.
+    Once the reset timeout has passed the breaker is HALF_OPEN and lets a single trial call
+    through: it closes if the trial succeeds and opens again if it fails. A trial whose
+    outcome is never recorded is given up after the reset timeout. Any sign of life from the
+    device, e.g. a valid event, closes the breaker.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout_s: float = CIRCUIT_BREAKER_RESET_TIMEOUT_S,
+        state_callback: Optional[Callable[[CircuitBreakerState], None]] = None,
+    ):
+        """:param failure_threshold: Consecutive failures after which the breaker opens
+        :type failure_threshold: int
+        :param reset_timeout_s: Time (in seconds) the breaker stays open before a trial call
+        :type reset_timeout_s: float
+        :param state_callback: Called with the new state when the breaker changes state
+        :type state_callback: Optional[Callable[[CircuitBreakerState], None]]
+        """
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_s = reset_timeout_s
+        self._state_callback = state_callback
+        self._lock = threading.Lock()
+        self._state = CircuitBreakerState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_started_at: Optional[float] = None
+
+    @property
+    def state(self) -> CircuitBreakerState:
+        """The current state of the breaker."""
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Check if a call to the device should be made.
+
+        :return: False while the breaker is open or a half-open trial call is in progress
+        :rtype: bool
+        """
+        new_state = None
+        with self._lock:
+            if self._state == CircuitBreakerState.CLOSED:
+                return True
+            now = time.monotonic()
+            if self._state == CircuitBreakerState.OPEN:
+                if now - self._opened_at < self._reset_timeout_s:
+                    return False
+                new_state = self._state = CircuitBreakerState.HALF_OPEN
+            elif (
+                self._trial_started_at is not None
+                and now - self._trial_started_at < self._reset_timeout_s
+            ):
+                return False
+            self._trial_started_at = now
+        if new_state is not None:
+            self._notify(new_state)
+        return True
+
+    def record_success(self) -> None:
+        """Record that the device responded, closing the breaker."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Close the breaker and forget the failures recorded so far."""
+        with self._lock:
+            self._failures = 0
+            self._trial_started_at = None
+            if self._state == CircuitBreakerState.CLOSED:
+                return
+            self._state = CircuitBreakerState.CLOSED
+        self._notify(CircuitBreakerState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a failure to reach the device, opening the breaker past the threshold."""
+        with self._lock:
+            self._failures += 1
+            self._trial_started_at = None
+            if self._state == CircuitBreakerState.OPEN or (
+                self._state == CircuitBreakerState.CLOSED
+                and self._failures < self._failure_threshold
+            ):
+                return
+            self._open()
+        self._notify(CircuitBreakerState.OPEN)
+
+    def trip(self) -> None:
+        """Open the breaker straight away, e.g. when the device heartbeat is lost."""
+        with self._lock:
+            self._trial_started_at = None
+            if self._state == CircuitBreakerState.OPEN:
+                return
+            self._open()
+        self._notify(CircuitBreakerState.OPEN)
+
+    def _open(self) -> None:
+        self._state = CircuitBreakerState.OPEN
+        self._opened_at = time.monotonic()
+
+    def _notify(self, state: CircuitBreakerState) -> None:
+        if self._state_callback is not None:
+            self._state_callback(state)
@@ -8,6 +8,7 @@ from typing import Any, Callable
 from ska_control_model import CommunicationStatus, ResultCode, TaskStatus
 
 from ska_mid_dish_manager.models.constants import OPERATOR_TAG
+from ska_mid_dish_manager.utils.circuit_breaker import CircuitOpenError
 
 SLOW_WRITE_WARN_THRESHOLD_SECONDS = 0.5
 
@@ -118,6 +119,51 @@ def check_communicating(func: Any) -> Any:
     return _wrapper
 
 
+def check_circuit_breaker(func: Any) -> Any:
+    """Return a function that fails fast while the circuit breaker of the device is open.
+
+    Calls to a device which cannot be reached would otherwise each wait out the device
+    proxy timeout and the reconnection attempts before failing.
+
+    This function is intended to be used as a decorator:
+
+    .. code-block:: python
+
+        @check_circuit_breaker
+        def read_attribute_value(self, attribute_name): ...
+
+    :param func: the wrapped function
+
+    :return: the wrapped function
+    """
+
+    @functools.wraps(func)
+    def _wrapper(
+        component_manager: Any,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Check the circuit breaker of the device before calling the function.
+
+        :param component_manager: the component manager to check
+        :param args: positional arguments to the wrapped function
+        :param kwargs: keyword arguments to the wrapped function
+
+        :raises CircuitOpenError: if the circuit breaker of the device is open
+
+        :return: whatever the wrapped function returns
+        """
+        if not component_manager.circuit_breaker.allow_request():
+            raise CircuitOpenError(
+                f"{component_manager._tango_device_fqdn} is unreachable, "
+                f"'{func.__name__}' was not attempted while its circuit breaker is "
+                f"{component_manager.circuit_breaker.state.name}"
+            )
+        return func(component_manager, *args, **kwargs)
+
+    return _wrapper
+
+
 def requires_component_manager(func: Any) -> Any:
     """Decorator that checks if component_manager is available."""
 
@@ -0,0 +1,82 @@
+"""Track the long running commands of a sub-device from its LRC attribute events."""
+
+import json
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+# The attributes reporting the long running commands of a device, as JSON entries with a uid
+LRC_ATTRIBUTES = ("lrcqueue", "lrcexecuting", "lrcfinished")
+
+
+class LrcTracker:
+    """Uid indexed tables of the queued, executing and finished long running commands.
+
+    The tables are built once per change event of the LRC attributes so that the fanned
+    out commands look up their uid instead of reading and parsing the attributes on every
+    poll. Each event publishes a new table, lookups do not take the lock.
+
+    An attribute is only tracked once a valid event has been received for it and stops
+    being tracked on an error event. While it is not tracked `table` returns None and the
+    attribute has to be read instead.
+    """
+
+    def __init__(self, logger: logging.Logger, update_callback: Optional[Callable] = None):
+        """:param logger: Logger instance
+        :type logger: logging.Logger
+        :param update_callback: Called without arguments after a table is updated
+        :type update_callback: Optional[Callable]
+        """
+        self.logger = logger
+        self._update_callback = update_callback
+        self._tables: Dict[str, Dict[str, dict]] = {}
+        self._lock = threading.Lock()
+
+    def table(self, attr_name: str) -> Optional[Dict[str, dict]]:
+        """Return the entries of an LRC attribute by uid.
+
+        :param attr_name: The lowercase name of the LRC attribute
+        :type attr_name: str
+        :return: the entries by uid or None if the attribute is not tracked
+        :rtype: Optional[Dict[str, dict]]
+        """
+        return self._tables.get(attr_name)
+
+    def update(self, attr_name: str, value: Any) -> None:
+        """Replace the table of an LRC attribute with the entries of its latest value.
+
+        :param attr_name: The lowercase name of the LRC attribute
+        :type attr_name: str
+        :param value: The JSON entries reported by the attribute
+        :type value: Any
+        """
+        table = {}
+        for entry in value or ():
+            try:
+                entry_dict = json.loads(entry)
+            except (json.JSONDecodeError, TypeError):
+                self.logger.exception("Invalid json value for %s", attr_name)
+                continue
+            if isinstance(entry_dict, dict) and "uid" in entry_dict:
+                table[entry_dict["uid"]] = entry_dict
+
+        with self._lock:
+            self._tables = {**self._tables, attr_name: table}
+        if self._update_callback is not None:
+            self._update_callback()
+
+    def forget(self, attr_name: str) -> None:
+        """Stop tracking an LRC attribute until its next valid event.
+
+        :param attr_name: The lowercase name of the LRC attribute
+        :type attr_name: str
+        """
+        with self._lock:
+            self._tables = {
+                name: table for name, table in self._tables.items() if name != attr_name
+            }
+
+    def reset(self) -> None:
+        """Stop tracking all the LRC attributes."""
+        with self._lock:
+            self._tables = {}
@@ -1,25 +1,182 @@
 """This module provides functionality related to scheduling and managing of tasks."""
 
+import enum
+import heapq
+import itertools
+import logging
+import queue
 import threading
-from typing import Callable
+import time
+from functools import partial
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
+
+import tango
 
 DEFAULT_WATCHDOG_TIMEOUT = 10.0  # seconds
 
 
+class EventPriority(enum.IntEnum):
+    """Dispatch priority of a callback, lower values are dispatched first."""
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+# Sorts after every priority so that shutdown waits for the queued callbacks
+_STOP_PRIORITY = max(EventPriority) + 1
+
+
+class TimerHandle:
+    """A callback scheduled on the timer service, which can be cancelled until it runs."""
+
+    __slots__ = ("deadline", "callback", "cancelled")
+
+    def __init__(self, deadline: float, callback: Callable[[], None]):
+        self.deadline = deadline
+        self.callback = callback
+        # Set once the callback is cancelled or has run
+        self.cancelled = False
+
+
+class TimerService:
+    """Run callbacks at their deadline from a single thread.
+
+    The deadlines are taken on the monotonic clock and kept in a heap, so scheduling and
+    cancelling a callback does not start or stop a thread. Cancelled callbacks are left in
+    the heap until they come up or until they make up most of it, when it is rebuilt.
+
+    The callbacks run one after the other on the timer thread, they should return quickly
+    and hand anything which can block over to another thread.
+    """
+
+    _instance: ClassVar[Optional["TimerService"]] = None
+    _instance_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, logger: Optional[logging.Logger] = None, name: str = "timer_service"):
+        """:param logger: Logger used to report callbacks raising an exception
+        :type logger: Optional[logging.Logger]
+        :param name: Name of the timer thread
+        :type name: str
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self._name = name
+        self._condition = threading.Condition()
+        self._heap: List[Tuple[float, int, TimerHandle]] = []
+        self._sequence = itertools.count()
+        self._cancelled_count = 0
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def instance(cls) -> "TimerService":
+        """Return the timer service shared by the whole process."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def __len__(self) -> int:
+        """The number of callbacks scheduled and not cancelled."""
+        with self._condition:
+            return len(self._heap) - self._cancelled_count
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> TimerHandle:
+        """Run the callback once the delay has passed.
+
+        :param delay: Time in seconds from now
+        :type delay: float
+        :param callback: Called without arguments on the timer thread
+        :type callback: Callable[[], None]
+        :return: the handle to cancel the callback with
+        :rtype: TimerHandle
+        """
+        handle = TimerHandle(time.monotonic() + delay, callback)
+        with self._condition:
+            heapq.heappush(self._heap, (handle.deadline, next(self._sequence), handle))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run_timers, name=self._name, daemon=True
+                )
+                self._thread.start()
+            if self._heap[0][2] is handle:
+                # Earlier than the deadline the timer thread is waiting for
+                self._condition.notify()
+        return handle
+
+    def cancel(self, handle: TimerHandle) -> None:
+        """Stop a scheduled callback from running.
+
+        :param handle: The handle returned when the callback was scheduled
+        :type handle: TimerHandle
+        """
+        with self._condition:
+            if handle.cancelled:
+                return
+            handle.cancelled = True
+            self._cancelled_count += 1
+            if self._cancelled_count > len(self._heap) // 2:
+                self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+                heapq.heapify(self._heap)
+                self._cancelled_count = 0
+
+    def _run_timers(self) -> None:
+        """Run the callbacks as their deadlines pass."""
+        with tango.EnsureOmniThread():
+            while True:
+                with self._condition:
+                    handle = self._next_due()
+                if handle is None:
+                    continue
+                try:
+                    handle.callback()
+                except Exception:  # pylint:disable=broad-except
+                    self.logger.exception("Error occurred running timer callback")
+
+    def _next_due(self) -> Optional[TimerHandle]:
+        """Wait for the earliest deadline and pop its callback, called with the lock held.
+
+        :return: the callback handle, None if it was cancelled or the wait was interrupted
+        """
+        if not self._heap:
+            self._condition.wait()
+            return None
+        deadline, _, handle = self._heap[0]
+        delay = deadline - time.monotonic()
+        if delay > 0 and not handle.cancelled:
+            self._condition.wait(delay)
+            return None
+        heapq.heappop(self._heap)
+        if handle.cancelled:
+            self._cancelled_count -= 1
+            return None
+        # Cancelling the callback from now on has no effect
+        handle.cancelled = True
+        return handle
+
+
 class WatchdogTimerInactiveError(RuntimeError):
     """Exception raised when the watchdog timer is not enabled."""
 
 
 class WatchdogTimer:
     def __init__(
-        self, callback_on_timeout: Callable = None, timeout: float = DEFAULT_WATCHDOG_TIMEOUT
+        self,
+        callback_on_timeout: Callable = None,
+        timeout: float = DEFAULT_WATCHDOG_TIMEOUT,
+        timer_service: Optional[TimerService] = None,
     ):
         """This class implements a watchdog timer that will make a callback
         when the timer expires.
 
+        The deadline is registered on a timer service, so enabling and resetting the
+        watchdog does not start a thread. The callback is made on a thread of its own as
+        it may block.
+
         :param callback_on_timeout: The callback function to be invoked when the timer expires.
         :param timeout: The default time in seconds after which the callback will be
             invoked if not reset, defaults to DEFAULT_WATCHDOG_TIMEOUT
+        :param timer_service: The timer service to register the deadline on, defaults to
+            the one shared by the process
         :raises ValueError: If timeout specified is less than zero.
         """
         if timeout <= 0:
@@ -27,7 +184,10 @@ class WatchdogTimer:
 
         self._timeout = timeout
         self._external_callback = callback_on_timeout
-        self._timer = None
+        self._timer_service = TimerService.instance() if timer_service is None else timer_service
+        self._timer: Optional[TimerHandle] = None
+        # Identifies the latest deadline, an expiry racing with a reset is ignored
+        self._generation = 0
         self._lock = threading.RLock()
         self._enabled = False
 
@@ -57,7 +217,7 @@ class WatchdogTimer:
         with self._lock:
             self._enabled = False
             if self._timer is not None:
-                self._timer.cancel()
+                self._timer_service.cancel(self._timer)
                 self._timer = None
 
     def reset(self):
@@ -72,7 +232,7 @@ class WatchdogTimer:
                 raise WatchdogTimerInactiveError("Watchdog timer is disabled. Call enable first.")
 
             if self._timer is not None:
-                self._timer.cancel()
+                self._timer_service.cancel(self._timer)
                 self._timer = None
 
             self._start_timer()
@@ -84,14 +244,221 @@ class WatchdogTimer:
         This method should be called with the lock held.
         """
         if self._timer is None and self._enabled:
-            self._timer = threading.Timer(self._timeout, self._callback_on_timeout_and_disable)
-            self._timer.start()
+            self._generation += 1
+            self._timer = self._timer_service.call_later(
+                self._timeout, partial(self._callback_on_timeout_and_disable, self._generation)
+            )
 
-    def _callback_on_timeout_and_disable(self):
+    def _callback_on_timeout_and_disable(self, generation: int):
         """Wrapper for the callback to disable the timer after timeout."""
         # Clear the timer reference and disable the watchdog
         with self._lock:
+            if generation != self._generation or not self._enabled:
+                return
             self._timer = None
             self._enabled = False
         if self._external_callback:
-            self._external_callback()
+            # Expiries are rare, keep the timer thread free while the callback runs
+            threading.Thread(
+                target=self._external_callback, name="watchdog_timer_expiry", daemon=True
+            ).start()
+
+
+# Marks an empty slot of the latest value writer, None is a value which can be written
+_NO_VALUE = object()
+
+
+class LatestValueWriter:
+    """Write values on a dedicated thread, the latest submitted value wins.
+
+    Submitting never blocks on the write. A value submitted while another one is still
+    waiting to be written replaces it, and a value equal to the one waiting or being
+    written is dropped, so a burst of updates results in at most one write in flight and
+    one write of the final value.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[Any], None],
+        logger: Optional[logging.Logger] = None,
+        name: str = "writer",
+    ):
+        """:param write: Writes a value, it is called on the writer thread
+        :type write: Callable[[Any], None]
+        :param logger: Logger used to report writes raising an exception
+        :type logger: Optional[logging.Logger]
+        :param name: Name of the writer thread
+        :type name: str
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self._write = write
+        self._name = name
+        self._condition = threading.Condition()
+        self._pending: Any = _NO_VALUE
+        self._in_flight: Any = _NO_VALUE
+        self._coalesced_count = 0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def coalesced_count(self) -> int:
+        """Number of submitted values which were replaced or dropped without being written."""
+        return self._coalesced_count
+
+    def submit(self, value: Any) -> bool:
+        """Queue the value to be written, replacing any value still waiting.
+
+        :param value: The value to write
+        :type value: Any
+        :return: False if the value is already waiting or being written
+        :rtype: bool
+        """
+        with self._condition:
+            latest = self._in_flight if self._pending is _NO_VALUE else self._pending
+            if latest is not _NO_VALUE and latest == value:
+                self._coalesced_count += 1
+                return False
+            if self._pending is not _NO_VALUE:
+                self._coalesced_count += 1
+            self._pending = value
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._process_writes, name=self._name, daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        return True
+
+    def wait_until_idle(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted value has been written.
+
+        :param timeout: The maximum time (in seconds) to wait
+        :type timeout: Optional[float]
+        :return: False if the writes were still in progress after the timeout
+        :rtype: bool
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._pending is _NO_VALUE and self._in_flight is _NO_VALUE, timeout
+            )
+
+    def _process_writes(self) -> None:
+        """Write the latest submitted value whenever there is one."""
+        with tango.EnsureOmniThread():
+            while True:
+                with self._condition:
+                    self._condition.wait_for(lambda: self._pending is not _NO_VALUE)
+                    value, self._pending = self._pending, _NO_VALUE
+                    self._in_flight = value
+                try:
+                    self._write(value)
+                except Exception:  # pylint:disable=broad-except
+                    self.logger.exception("Error occurred writing %s", value)
+                finally:
+                    with self._condition:
+                        self._in_flight = _NO_VALUE
+                        self._condition.notify_all()
+
+
+class ShardedDispatcher:
+    """Run callbacks on a fixed set of threads, keeping callbacks with the same key in order.
+
+    Each key is pinned to one worker thread (shard) the first time it is submitted and every
+    shard processes its callbacks first in, first out. Callbacks sharing a key therefore run
+    strictly in submission order while callbacks with keys on other shards run concurrently.
+    Keys are spread over the shards in the order they are first seen, so as long as there are
+    at least as many shards as keys every key gets a thread of its own.
+
+    Callbacks can be submitted with a priority. A shard always runs its queued higher
+    priority callbacks before lower priority ones, and in submission order within a
+    priority. Callbacks which must stay in order relative to each other should therefore
+    be submitted with the same priority.
+    """
+
+    def __init__(
+        self,
+        shard_count: int,
+        logger: Optional[logging.Logger] = None,
+        name: str = "dispatcher",
+    ):
+        """:param shard_count: The number of worker threads
+        :type shard_count: int
+        :param logger: Logger used to report callbacks raising an exception
+        :type logger: Optional[logging.Logger]
+        :param name: Prefix of the worker thread names
+        :type name: str
+        :raises ValueError: If the shard count is less than one
+        """
+        if shard_count < 1:
+            raise ValueError("Shard count must be at least 1.")
+
+        self.logger = logger or logging.getLogger(__name__)
+        self._queues: List[queue.PriorityQueue] = [
+            queue.PriorityQueue() for _ in range(shard_count)
+        ]
+        self._sequence = itertools.count()
+        self._shards: Dict[Any, int] = {}
+        self._lock = threading.Lock()
+        self._shutdown = False
+        self._threads = [
+            threading.Thread(
+                target=self._process_queue,
+                args=(shard_queue,),
+                name=f"{name}_{index}",
+                daemon=True,
+            )
+            for index, shard_queue in enumerate(self._queues)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def shard_for(self, key: Any) -> int:
+        """Return the index of the shard the key is pinned to."""
+        shard = self._shards.get(key)
+        if shard is None:
+            with self._lock:
+                shard = self._shards.setdefault(key, len(self._shards) % len(self._queues))
+        return shard
+
+    def submit(
+        self,
+        key: Any,
+        callback: Callable,
+        *args: Any,
+        priority: EventPriority = EventPriority.NORMAL,
+    ) -> None:
+        """Queue the callback on the shard of the key.
+
+        Callbacks submitted after shutdown are dropped.
+        """
+        if self._shutdown:
+            return
+        self._queues[self.shard_for(key)].put((priority, next(self._sequence), callback, args))
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Stop the worker threads once the callbacks queued so far have run.
+
+        :param timeout: Time in seconds to wait for each worker thread to finish
+        :type timeout: Optional[float]
+        """
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+        for shard_queue in self._queues:
+            shard_queue.put((_STOP_PRIORITY, next(self._sequence), None, ()))
+        for thread in self._threads:
+            # a callback may shut the dispatcher down from one of its own threads
+            if thread is not threading.current_thread():
+                thread.join(timeout)
+
+    def _process_queue(self, shard_queue: queue.PriorityQueue) -> None:
+        """Run the callbacks queued on a shard until shutdown."""
+        with tango.EnsureOmniThread():
+            while True:
+                priority, _, callback, args = shard_queue.get()
+                if priority == _STOP_PRIORITY:
+                    return
+                try:
+                    callback(*args)
+                except Exception:  # pylint:disable=broad-except
+                    self.logger.exception("Error occurred running dispatched callback")
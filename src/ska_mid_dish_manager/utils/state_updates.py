@@ -0,0 +1,105 @@
+"""Helpers for component state updates."""
+
+import threading
+from typing import Any, Dict, Iterator, Mapping
+
+from ska_mid_dish_manager.utils.arrays import values_equal
+
+_MISSING = object()
+
+
+def discard_unchanged(
+    component_state: Dict[str, Any], updates: Dict[str, Any], skipped_counts: Dict[str, int]
+) -> Dict[str, Any]:
+    """Return the updates whose value differs from the value held in the component state.
+
+    This runs before the component state lock is taken: each value is read with a single
+    dict lookup, which is atomic, and an update is only discarded if its value is equal to
+    the value held, as compared by `values_equal`. Keys missing from the component state
+    are passed on so the base class still rejects them.
+
+    A discarded update does not wait for the updates of the same key in flight: with X
+    held, an update to Y waiting for the lock and a later update back to X, the latter is
+    discarded and Y is kept. Only use it where the updates of a key come from a single
+    thread, e.g. the events of an attribute, which are dispatched in order on one thread.
+    Updates from other threads, such as the values applied by a resync, must be compared
+    under the lock only.
+
+    :param component_state: The live component state dict
+    :type component_state: Dict[str, Any]
+    :param updates: The requested updates
+    :type updates: Dict[str, Any]
+    :param skipped_counts: Count of discarded updates per key, incremented in place
+        without a lock, so the counts are approximate when called from several threads
+    :type skipped_counts: Dict[str, int]
+    :return: the updates which still need to go through the locked update
+    :rtype: Dict[str, Any]
+    """
+    changed = {}
+    for key, value in updates.items():
+        current = component_state.get(key, _MISSING)
+        if current is not _MISSING and values_equal(current, value):
+            skipped_counts[key] = skipped_counts.get(key, 0) + 1
+        else:
+            changed[key] = value
+    return changed
+
+
+class ComponentStateView(Mapping):
+    """A read-only view of the component state a component manager currently publishes.
+
+    Sub-device component managers publish each update as a new dict, so holding on to
+    their `_component_state` would go stale. The view looks it up on every access.
+    """
+
+    def __init__(self, component_manager: Any):
+        """:param component_manager: The component manager whose state is viewed
+        :type component_manager: Any
+        """
+        self._component_manager = component_manager
+
+    def __getitem__(self, key: str) -> Any:
+        return self._component_manager._component_state[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._component_manager._component_state)
+
+    def __len__(self) -> int:
+        return len(self._component_manager._component_state)
+
+
+class StateChangeNotifier:
+    """Wakes the threads waiting for a component state to change.
+
+    Waiters note the generation before checking the state they wait for and pass it to
+    `wait`, so a change notified between the check and the wait is not missed.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """The number of changes notified so far."""
+        return self._generation
+
+    def notify(self) -> None:
+        """Wake all the waiting threads."""
+        with self._condition:
+            self._generation += 1
+            self._condition.notify_all()
+
+    def wait(self, generation: int, timeout: float) -> int:
+        """Wait until a change is notified after the generation was noted.
+
+        :param generation: The generation noted before checking the component state
+        :type generation: int
+        :param timeout: The maximum time (in seconds) to wait
+        :type timeout: float
+        :return: the current generation
+        :rtype: int
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._generation != generation, timeout)
+            return self._generation
@@ -0,0 +1,124 @@
+"""Ring file of timestamped wind speed readings kept on local disk across restarts."""
+
+import fcntl
+import math
+import mmap
+import os
+import struct
+import threading
+from typing import Iterable, List, Optional, Sequence
+
+_MAGIC = b"WNDH"
+_VERSION = 1
+# magic, version, capacity, index of the next record written, number of records held
+_HEADER = struct.Struct("<4sHxxIII")
+# timestamp, wind speed (NaN when it could not be read)
+_RECORD = struct.Struct("<dd")
+
+
+class WindHistoryFile:
+    """A fixed size ring of [timestamp, wind speed] records in a memory-mapped file.
+
+    Appending a reading writes its record in place and then updates the header, so the
+    file always holds the latest `capacity` readings without being rewritten. The pages
+    are written back to disk by the OS, a restart of the process does not lose any reading.
+    A file whose layout or capacity does not match is started afresh.
+
+    The file is locked while it is open, so a second process opening it fails rather
+    than interleaving its readings.
+    """
+
+    def __init__(self, path: str, capacity: int):
+        """:param path: The path of the file, created if needed
+        :type path: str
+        :param capacity: The number of readings kept
+        :type capacity: int
+        """
+        self.path = path
+        self.capacity = max(1, capacity)
+        self._lock = threading.Lock()
+        size = _HEADER.size + self.capacity * _RECORD.size
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            try:
+                fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError as err:
+                raise OSError(
+                    err.errno, "The wind history file is in use by another process", path
+                ) from err
+            if os.fstat(self._fd).st_size != size:
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, size)
+            self._map = mmap.mmap(self._fd, size)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+        magic, version, capacity, next_index, count = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC or version != _VERSION or capacity != self.capacity:
+            next_index, count = 0, 0
+            _HEADER.pack_into(self._map, 0, _MAGIC, _VERSION, self.capacity, 0, 0)
+        self._next_index = next_index % self.capacity
+        self._count = min(count, self.capacity)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, readings: Iterable[Sequence]) -> None:
+        """Write readings after the latest ones, overwriting the oldest once full.
+
+        :param readings: The [timestamp, wind speed] readings in timestamp order
+        :type readings: Iterable[Sequence]
+        """
+        with self._lock:
+            for timestamp, wind_speed in readings:
+                _RECORD.pack_into(
+                    self._map,
+                    _HEADER.size + self._next_index * _RECORD.size,
+                    timestamp,
+                    math.nan if wind_speed is None else wind_speed,
+                )
+                self._next_index = (self._next_index + 1) % self.capacity
+                self._count = min(self._count + 1, self.capacity)
+            _HEADER.pack_into(
+                self._map, 0, _MAGIC, _VERSION, self.capacity, self._next_index, self._count
+            )
+
+    def readings(self, since: Optional[float] = None) -> List[List[Optional[float]]]:
+        """Return the readings held, oldest first.
+
+        :param since: Only return the readings with a timestamp at or after it
+        :type since: Optional[float]
+        :return: the [timestamp, wind speed] readings, the wind speed is None if unread
+        :rtype: List[List[Optional[float]]]
+        """
+        with self._lock:
+            first_index = (self._next_index - self._count) % self.capacity
+            readings = []
+            for offset in range(self._count):
+                index = (first_index + offset) % self.capacity
+                timestamp, wind_speed = _RECORD.unpack_from(
+                    self._map, _HEADER.size + index * _RECORD.size
+                )
+                if since is not None and timestamp < since:
+                    continue
+                readings.append([timestamp, None if math.isnan(wind_speed) else wind_speed])
+        return readings
+
+    def clear(self) -> None:
+        """Forget all the readings."""
+        with self._lock:
+            self._next_index, self._count = 0, 0
+            _HEADER.pack_into(self._map, 0, _MAGIC, _VERSION, self.capacity, 0, 0)
+
+    def close(self) -> None:
+        """Write the pages back to disk, unmap the file and release its lock."""
+        with self._lock:
+            if not self._map.closed:
+                self._map.flush()
+                self._map.close()
+                os.close(self._fd)
@@ -0,0 +1,156 @@
+"""Statistics over a sliding time window of timestamped samples.
+
+Samples are appended in timestamp order and the ones older than the window are pruned
+from the front, so each sample is added and removed once and reading the statistic does
+not rescan the window.
+"""
+
+from collections import deque
+from typing import Deque, Iterable, Optional, Sequence, Tuple
+
+# A [timestamp, value] pair, the value is None when it could not be read
+Sample = Sequence
+
+
+class RunningMean:
+    """Mean of the sample values in a time window, kept as a running sum and count.
+
+    Samples without a value are held for the pruning but do not contribute to the mean.
+    The running sum is recomputed from the buffered values once every `maxlen` evictions
+    so that the rounding errors of the subtractions do not accumulate.
+    """
+
+    def __init__(self, window_s: float, maxlen: int):
+        """:param window_s: The time window (in seconds) the mean is computed over
+        :type window_s: float
+        :param maxlen: The maximum number of samples held, the oldest are dropped first
+        :type maxlen: int
+        """
+        self.window_s = window_s
+        self.maxlen = maxlen
+        self._samples: Deque[Tuple[float, Optional[float]]] = deque()
+        self._sum = 0.0
+        self._count = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    @property
+    def value(self) -> float:
+        """The mean of the samples in the window, 0.0 if there are none."""
+        if not self._count:
+            return 0.0
+        return self._sum / self._count
+
+    def extend(self, samples: Iterable[Sample]) -> None:
+        """Add samples to the end of the window.
+
+        :param samples: The [timestamp, value] samples, in timestamp order
+        :type samples: Iterable[Sample]
+        """
+        for timestamp, value in samples:
+            if len(self._samples) >= self.maxlen:
+                self._evict()
+            self._samples.append((timestamp, value))
+            if value is not None:
+                self._sum += value
+                self._count += 1
+
+    def prune(self, current_time: float) -> None:
+        """Remove the samples older than the window.
+
+        :param current_time: The timestamp the window ends at
+        :type current_time: float
+        """
+        expiry_time = current_time - self.window_s
+        while self._samples and self._samples[0][0] < expiry_time:
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all the samples."""
+        self._samples.clear()
+        self._sum = 0.0
+        self._count = 0
+        self._evictions = 0
+
+    def _evict(self) -> None:
+        _, value = self._samples.popleft()
+        if value is not None:
+            self._sum -= value
+            self._count -= 1
+        self._evictions += 1
+        if self._evictions >= self.maxlen:
+            self._evictions = 0
+            self._sum = float(sum(value for _, value in self._samples if value is not None))
+
+
+class WindowedMax:
+    """Maximum of the sample values in a time window, kept in a monotonic deque.
+
+    Next to the samples, a deque holds the samples which can still become the maximum,
+    in decreasing order of value: a sample is dropped from it as soon as a later sample
+    with a value at least as high is added, since it will be pruned first.
+    """
+
+    def __init__(self, window_s: float, maxlen: int):
+        """:param window_s: The time window (in seconds) the maximum is computed over
+        :type window_s: float
+        :param maxlen: The maximum number of samples held, the oldest are dropped first
+        :type maxlen: int
+        """
+        self.window_s = window_s
+        self.maxlen = maxlen
+        # (sequence number, timestamp) of the samples in the window
+        self._samples: Deque[Tuple[int, float]] = deque()
+        # (sequence number, value) of the candidate maximums, values decreasing
+        self._candidates: Deque[Tuple[int, float]] = deque()
+        self._next_sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    @property
+    def value(self) -> Optional[float]:
+        """The maximum of the samples in the window, None if there are none."""
+        if not self._candidates:
+            return None
+        return self._candidates[0][1]
+
+    def append(self, sample: Sample) -> None:
+        """Add a sample to the end of the window.
+
+        :param sample: The [timestamp, value] sample, newer than the samples held
+        :type sample: Sample
+        """
+        timestamp, value = sample
+        if len(self._samples) >= self.maxlen:
+            self._evict()
+        sequence = self._next_sequence
+        self._next_sequence += 1
+        self._samples.append((sequence, timestamp))
+        if value is None:
+            return
+        while self._candidates and self._candidates[-1][1] <= value:
+            self._candidates.pop()
+        self._candidates.append((sequence, value))
+
+    def prune(self, current_time: float) -> None:
+        """Remove the samples older than the window.
+
+        :param current_time: The timestamp the window ends at
+        :type current_time: float
+        """
+        expiry_time = current_time - self.window_s
+        while self._samples and self._samples[0][1] < expiry_time:
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all the samples."""
+        self._samples.clear()
+        self._candidates.clear()
+
+    def _evict(self) -> None:
+        sequence, _ = self._samples.popleft()
+        if self._candidates and self._candidates[0][0] == sequence:
+            self._candidates.popleft()
@@ -0,0 +1,89 @@
+"""Benchmark how long an action takes to complete after its awaited state arrives.
+
+Compares polling the fanned out commands every second with waking the action handler on
+component state change notifications.
+
+Run with: pytest -m benchmark tests/benchmarks -s
+"""
+
+import logging
+import random
+import statistics
+import threading
+import time
+
+import pytest
+
+from ska_mid_dish_manager.models.action_handlers import ActionHandler
+from ska_mid_dish_manager.models.fanned_out_command import FannedOutCommand
+from ska_mid_dish_manager.utils.state_updates import StateChangeNotifier
+
+LOGGER = logging.getLogger(__name__)
+
+SAMPLES = 20
+
+
+def _completion_latencies(state_changes):
+    """Run the action repeatedly, returning the delays between the state update and success."""
+    latencies = []
+    for sample in range(SAMPLES):
+        component_state = {"attr": False}
+        updated_at = {}
+
+        def _update_state_later(delay):
+            time.sleep(delay)
+            component_state["attr"] = True
+            updated_at["time"] = time.perf_counter()
+            if state_changes is not None:
+                state_changes.notify()
+
+        def _command(delay=random.Random(sample).uniform(0.05, 0.5)):
+            threading.Thread(target=_update_state_later, args=(delay,), daemon=True).start()
+            return "OK", "fanned out command msg"
+
+        completed_at = {}
+
+        def _task_callback(**kwargs):
+            if "result" in kwargs:
+                completed_at["time"] = time.perf_counter()
+
+        fanned_out_command = FannedOutCommand(
+            LOGGER,
+            device="DeviceX",
+            command_name="CommandX",
+            command=_command,
+            component_state=component_state,
+            awaited_component_state={"attr": True},
+        )
+        handler = ActionHandler(
+            LOGGER,
+            "HandlerX",
+            [fanned_out_command],
+            component_state=component_state,
+            awaited_component_state={"attr": True},
+            timeout_s=10,
+            state_changes=state_changes,
+        )
+        handler.execute(_task_callback, threading.Event())
+        latencies.append(completed_at["time"] - updated_at["time"])
+    return latencies
+
+
+def _percentile(values, percentile):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))]
+
+
+@pytest.mark.benchmark
+def test_action_completion_latency():
+    """Report the median and p99 completion latency with polling and with notifications."""
+    polled = _completion_latencies(state_changes=None)
+    notified = _completion_latencies(state_changes=StateChangeNotifier())
+
+    for name, latencies in (("polling", polled), ("notified", notified)):
+        print(
+            f"\n{name:9}: median {statistics.median(latencies) * 1000:7.1f} ms"
+            f"  p99 {_percentile(latencies, 99) * 1000:7.1f} ms"
+        )
+    assert statistics.median(notified) < statistics.median(polled)
+    assert _percentile(notified, 99) < 0.1
@@ -0,0 +1,109 @@
+"""Benchmark component state updates and reads under contention.
+
+Compares the snapshot publication of the sub-device component managers (per device locks,
+lock free reads) with in place updates under one lock shared by all the devices, which is
+how the sub-device component states used to be held.
+
+Run with: pytest -m benchmark tests/benchmarks -s
+"""
+
+import copy
+import logging
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from ska_tango_base.base import BaseComponentManager
+
+from ska_mid_dish_manager.component_managers.tango_device_cm import TangoDeviceComponentManager
+
+LOGGER = logging.getLogger(__name__)
+
+DEVICES = ("DS", "SPF", "SPFRX", "B5DC")
+ATTRIBUTES = tuple(f"attr{index}" for index in range(40))
+UPDATES_PER_DEVICE = 2000
+READER_THREADS = 2
+
+
+class _SharedLockComponentManager(TangoDeviceComponentManager):
+    """Component state updated in place and deep copied on read, as in the base class."""
+
+    @property
+    def component_state(self):
+        return copy.deepcopy(self._component_state)
+
+    _update_component_state = BaseComponentManager._update_component_state
+
+
+def _run(component_manager_class, shared_lock):
+    """Update every device from its own thread while readers copy the states.
+
+    The component state callback reads the state of every device, as the dish manager
+    aggregation does.
+    """
+    component_managers = {}
+
+    def _aggregate(**_):
+        for component_manager in component_managers.values():
+            component_manager.component_state  # pylint: disable=pointless-statement
+
+    lock = threading.Lock()
+    for device in DEVICES:
+        component_manager = component_manager_class(
+            f"mid-dish/{device.lower()}/SKA001",
+            LOGGER,
+            ATTRIBUTES,
+            component_state_callback=_aggregate,
+        )
+        if shared_lock:
+            component_manager._component_state_lock = lock
+        component_managers[device] = component_manager
+
+    stop_reading = threading.Event()
+    reads = [0] * READER_THREADS
+
+    def _read(index):
+        while not stop_reading.is_set():
+            for component_manager in component_managers.values():
+                component_manager.component_state  # pylint: disable=pointless-statement
+                reads[index] += 1
+
+    def _write(component_manager):
+        for update in range(UPDATES_PER_DEVICE):
+            component_manager._update_component_state(
+                **{ATTRIBUTES[update % len(ATTRIBUTES)]: update}
+            )
+
+    readers = [threading.Thread(target=_read, args=(index,)) for index in range(READER_THREADS)]
+    writers = [
+        threading.Thread(target=_write, args=(component_manager,))
+        for component_manager in component_managers.values()
+    ]
+    for reader in readers:
+        reader.start()
+    start = time.perf_counter()
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+    duration = time.perf_counter() - start
+    stop_reading.set()
+    for reader in readers:
+        reader.join()
+
+    return len(DEVICES) * UPDATES_PER_DEVICE / duration, sum(reads) / duration
+
+
+@pytest.mark.benchmark
+@patch("ska_mid_dish_manager.component_managers.device_proxy_factory.tango")
+def test_snapshot_publication_under_contention(patched_tango):
+    """Report update and read throughput of both component state schemes."""
+    shared_updates, shared_reads = _run(_SharedLockComponentManager, shared_lock=True)
+    snapshot_updates, snapshot_reads = _run(TangoDeviceComponentManager, shared_lock=False)
+
+    print(
+        f"\nshared lock: {shared_updates:10.0f} updates/s {shared_reads:10.0f} reads/s"
+        f"\nsnapshots:   {snapshot_updates:10.0f} updates/s {snapshot_reads:10.0f} reads/s"
+    )
+    assert snapshot_updates > shared_updates
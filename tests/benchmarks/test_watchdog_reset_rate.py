@@ -0,0 +1,103 @@
+"""Benchmark resetting the watchdog timer at a high rate.
+
+Compares starting a threading.Timer on every reset, as the watchdog timer used to, with
+rescheduling its deadline on the timer service. Reports the reset rate, the threads
+started and how late the watchdog expires after the last reset.
+
+Run with: pytest -m benchmark tests/benchmarks -s
+"""
+
+import statistics
+import threading
+import time
+
+import pytest
+
+from ska_mid_dish_manager.utils.schedulers import TimerService, WatchdogTimer
+
+RESETS = 5000
+TIMEOUT = 0.2
+SAMPLES = 10
+
+
+class _ThreadTimerWatchdog:
+    """Watchdog restarting a threading.Timer on every reset."""
+
+    def __init__(self, callback_on_timeout, timeout):
+        self._callback = callback_on_timeout
+        self._timeout = timeout
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def enable(self):
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self._timeout, self._callback)
+            self._timer.start()
+
+    def disable(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+
+def _run(create_watchdog):
+    """Reset the watchdog repeatedly, returning the reset rate, threads and expiry lateness."""
+    started_threads = []
+    original_start = threading.Thread.start
+
+    def _counting_start(thread):
+        started_threads.append(thread)
+        original_start(thread)
+
+    lateness = []
+    reset_rates = []
+    for _ in range(SAMPLES):
+        expired_at = {}
+        expired = threading.Event()
+
+        def _expired(expired_at=expired_at, expired=expired):
+            expired_at["time"] = time.monotonic()
+            expired.set()
+
+        watchdog = create_watchdog(_expired)
+        threading.Thread.start = _counting_start
+        try:
+            start = time.perf_counter()
+            watchdog.enable()
+            for _ in range(RESETS):
+                watchdog.reset()
+            reset_rates.append(RESETS / (time.perf_counter() - start))
+            last_reset = time.monotonic()
+        finally:
+            threading.Thread.start = original_start
+        assert expired.wait(timeout=5)
+        lateness.append(expired_at["time"] - last_reset - TIMEOUT)
+        watchdog.disable()
+    return statistics.median(reset_rates), len(started_threads) / SAMPLES, lateness
+
+
+@pytest.mark.benchmark
+def test_watchdog_reset_rate():
+    """Report reset throughput, thread churn and expiry accuracy of both watchdogs."""
+    thread_timer = _run(lambda callback: _ThreadTimerWatchdog(callback, TIMEOUT))
+    timer_service = TimerService(name="benchmark_timer_service")
+    service = _run(lambda callback: WatchdogTimer(callback, TIMEOUT, timer_service=timer_service))
+
+    for name, (reset_rate, threads, lateness) in (
+        ("threading.Timer", thread_timer),
+        ("timer service", service),
+    ):
+        print(
+            f"\n{name:15}: {reset_rate:10.0f} resets/s {threads:7.0f} threads/run"
+            f"  expiry late by median {statistics.median(lateness) * 1000:6.2f} ms"
+            f" max {max(lateness) * 1000:6.2f} ms"
+        )
+    assert service[0] > thread_timer[0]
+    # only the expiry callback runs on a thread of its own
+    assert service[1] <= 1
@@ -0,0 +1,84 @@
+"""Benchmark the cost of a WMS poll as the number of buffered wind speed samples grows.
+
+Compares rescanning the buffered samples on every poll, as the WMS component manager used
+to, with the running sum and monotonic deque kept by the window statistics.
+
+Run with: pytest -m benchmark tests/benchmarks -s
+"""
+
+import logging
+import random
+import time
+from collections import deque
+
+import pytest
+
+from ska_mid_dish_manager.utils.window_statistics import RunningMean, WindowedMax
+
+LOGGER = logging.getLogger(__name__)
+
+MEAN_WIND_SPEED_PERIOD = 600.0
+WIND_GUST_PERIOD = 3.0
+POLLS = 3000
+STATION_COUNTS = (1, 8, 32)
+
+
+def _rescanned_polls(polls, window_length, gust_length):
+    """Buffer the samples in deques and rescan them for the mean and maximum."""
+    wind_speeds = deque(maxlen=window_length)
+    wind_gusts = deque(maxlen=gust_length)
+    start = time.perf_counter()
+    for current_time, poll in polls:
+        wind_speeds.extend(poll)
+        while wind_speeds and wind_speeds[0][0] < current_time - MEAN_WIND_SPEED_PERIOD:
+            wind_speeds.popleft()
+        valid_wind_speeds = [ws[1] for ws in wind_speeds if ws[1] is not None]
+        sum(valid_wind_speeds) / len(valid_wind_speeds)  # pylint: disable=expression-not-assigned
+
+        wind_gusts.append(max(poll, key=lambda ws: ws[1]))
+        while wind_gusts and wind_gusts[0][0] < current_time - WIND_GUST_PERIOD:
+            wind_gusts.popleft()
+        max(ws[1] for ws in wind_gusts)
+    return (time.perf_counter() - start) / len(polls)
+
+
+def _windowed_polls(polls, window_length, gust_length):
+    """Keep the mean and maximum up to date as the samples enter and leave the windows."""
+    wind_speeds = RunningMean(MEAN_WIND_SPEED_PERIOD, window_length)
+    wind_gusts = WindowedMax(WIND_GUST_PERIOD, gust_length)
+    start = time.perf_counter()
+    for current_time, poll in polls:
+        wind_speeds.extend(poll)
+        wind_speeds.prune(current_time)
+        wind_speeds.value  # pylint: disable=pointless-statement
+
+        wind_gusts.append(max(poll, key=lambda ws: ws[1]))
+        wind_gusts.prune(current_time)
+        wind_gusts.value  # pylint: disable=pointless-statement
+    return (time.perf_counter() - start) / len(polls)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("polling_period", [1.0, 0.25])
+def test_wms_poll_cost(polling_period):
+    """Report the time per poll with the window full, for growing numbers of stations."""
+    rng = random.Random(0)
+    for station_count in STATION_COUNTS:
+        window_length = int(station_count * MEAN_WIND_SPEED_PERIOD / polling_period)
+        gust_length = int(WIND_GUST_PERIOD / polling_period) + 1
+        polls = [
+            (
+                index * polling_period,
+                [[index * polling_period, rng.uniform(0, 40)] for _ in range(station_count)],
+            )
+            for index in range(POLLS + window_length // station_count)
+        ]
+
+        rescanned = _rescanned_polls(polls, window_length, gust_length)
+        windowed = _windowed_polls(polls, window_length, gust_length)
+        print(
+            f"\n{station_count:3} stations every {polling_period} s ({window_length:6} samples):"
+            f" rescan {rescanned * 1e6:9.1f} us/poll  windowed {windowed * 1e6:7.1f} us/poll"
+        )
+        if window_length >= 1000:
+            assert windowed < rescanned
@@ -3,12 +3,20 @@
 import logging
 import threading
 import time
+from concurrent.futures import Future
+from functools import partial
 from threading import Event
+from unittest.mock import MagicMock
 
 import pytest
+from ska_control_model import TaskStatus
 
 from ska_mid_dish_manager.models.command_actions import ActionHandler
-from ska_mid_dish_manager.models.fanned_out_command import FannedOutCommand
+from ska_mid_dish_manager.models.fanned_out_command import (
+    FannedOutCommand,
+    FannedOutTangoCommand,
+)
+from ska_mid_dish_manager.utils.state_updates import StateChangeNotifier
 from tests.utils import MethodCallsStore
 
 LOGGER = logging.getLogger(__name__)
@@ -336,3 +344,151 @@ class TestActionHandler:
         assert self.component_state["attr"] is False  # command completed execution
         progress_callback.wait_for_args(("Awaiting attr change to True",))
         progress_callback.wait_for_args(("HandlerX aborted",))
+
+    @pytest.mark.unit
+    def test_action_completes_on_state_change_notification(self):
+        self.reset_task_callbacks()
+        self.component_state["attr"] = False
+        progress_callback = MethodCallsStore()
+        state_changes = StateChangeNotifier()
+
+        def update_state_later(delay: float):
+            time.sleep(delay)
+            self.component_state["attr"] = True
+            state_changes.notify()
+
+        def mock_command():
+            threading.Thread(target=update_state_later, args=(0.2,), daemon=True).start()
+            return "OK", "fanned out command msg"
+
+        fanned_out = FannedOutCommand(
+            LOGGER,
+            device="DeviceX",
+            command_name="CommandX",
+            command=mock_command,
+            component_state=self.component_state,
+            awaited_component_state={"attr": True},
+            progress_callback=progress_callback,
+        )
+
+        handler = ActionHandler(
+            LOGGER,
+            "HandlerX",
+            [fanned_out],
+            component_state=self.component_state,
+            awaited_component_state={"attr": True},
+            progress_callback=progress_callback,
+            timeout_s=10,
+            state_changes=state_changes,
+        )
+
+        start = time.time()
+        handler.execute(self.my_task_callback, Event())
+
+        # woken by the notification rather than the one second fallback
+        assert time.time() - start < 0.8
+        assert self.status_calls[-1] == TaskStatus.COMPLETED
+        progress_callback.wait_for_args(("HandlerX completed.",))
+
+    @pytest.mark.unit
+    def test_concurrent_fan_out(self):
+        self.reset_task_callbacks()
+        dispatched = []
+
+        def slow_command(name: str):
+            def _command():
+                time.sleep(0.3)
+                dispatched.append(name)
+                return "OK", f"{name} msg"
+
+            return _command
+
+        fanned_out_commands = [
+            FannedOutCommand(
+                LOGGER,
+                device=device,
+                command_name=command_name,
+                command=slow_command(f"{device}.{command_name}"),
+                component_state=self.component_state,
+            )
+            for device, command_name in (
+                ("DeviceX", "CommandA"),
+                ("DeviceX", "CommandB"),
+                ("DeviceY", "CommandC"),
+                ("DeviceZ", "CommandD"),
+            )
+        ]
+
+        handler = ActionHandler(
+            LOGGER,
+            "HandlerX",
+            fanned_out_commands,
+            component_state=self.component_state,
+            awaited_component_state=None,
+            timeout_s=5,
+            concurrent_fan_out=True,
+        )
+
+        start = time.time()
+        handler.execute(self.my_task_callback, Event())
+
+        # the devices were dispatched to concurrently, DeviceX commands in order
+        assert time.time() - start < 0.9
+        assert len(dispatched) == 4
+        assert dispatched.index("DeviceX.CommandA") < dispatched.index("DeviceX.CommandB")
+        assert self.status_calls[-1] == TaskStatus.COMPLETED
+
+    @pytest.mark.unit
+    def test_asynchronous_fan_out(self):
+        self.reset_task_callbacks()
+        dispatched = []
+
+        def execute_command_async(device: str, command_name: str, command_argument):
+            future = Future()
+
+            def _reply():
+                dispatched.append(f"{device}.{command_name}")
+                future.set_result((TaskStatus.IN_PROGRESS, f"{command_name} msg"))
+
+            threading.Timer(0.3, _reply).start()
+            return future
+
+        device_component_managers = {
+            device: MagicMock(
+                _component_state={},
+                execute_command_async=partial(execute_command_async, device),
+            )
+            for device in ("DeviceX", "DeviceY")
+        }
+        fanned_out_commands = [
+            FannedOutTangoCommand(
+                LOGGER,
+                device=device,
+                command_name=command_name,
+                device_component_manager=device_component_managers[device],
+            )
+            for device, command_name in (
+                ("DeviceX", "CommandA"),
+                ("DeviceX", "CommandB"),
+                ("DeviceY", "CommandC"),
+            )
+        ]
+
+        handler = ActionHandler(
+            LOGGER,
+            "HandlerX",
+            fanned_out_commands,
+            component_state=self.component_state,
+            awaited_component_state=None,
+            timeout_s=5,
+            asynchronous_fan_out=True,
+        )
+
+        start = time.time()
+        handler.execute(self.my_task_callback, Event())
+
+        # each DeviceX command was sent once the previous one was replied to
+        assert 0.6 <= time.time() - start < 0.9
+        assert dispatched[-1] == "DeviceX.CommandB"
+        assert sorted(dispatched[:2]) == ["DeviceX.CommandA", "DeviceY.CommandC"]
+        assert self.status_calls[-1] == TaskStatus.COMPLETED
@@ -23,6 +23,7 @@ from ska_mid_dish_manager.models.dish_enums import (
     SPFOperatingMode,
     SPFRxOperatingMode,
 )
+from ska_mid_dish_manager.utils.state_updates import StateChangeNotifier
 from tests.utils import MethodCallsStore
 
 LOGGER = logging.getLogger(__name__)
@@ -46,6 +47,7 @@ class TestCommandActions:
                     "actstaticoffsetvaluexel": 1,
                 },
                 execute_command=mock.MagicMock(return_value=(None, "command_id_123")),
+                lrc_tracker=None,
                 read_attribute_value=mock.MagicMock(
                     return_value=(
                         json.dumps(
@@ -79,6 +81,7 @@ class TestCommandActions:
                 "actstaticoffsetvalueel": 1,
                 "actstaticoffsetvaluexel": 1,
             },
+            component_state_changes=StateChangeNotifier(),
         )
 
         self.progress_callback = MethodCallsStore()
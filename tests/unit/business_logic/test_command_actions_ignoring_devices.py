@@ -16,6 +16,7 @@ from ska_mid_dish_manager.models.dish_enums import (
     SPFOperatingMode,
     SPFRxOperatingMode,
 )
+from ska_mid_dish_manager.utils.state_updates import StateChangeNotifier
 from tests.utils import MethodCallsStore
 
 LOGGER = logging.getLogger(__name__)
@@ -34,6 +35,7 @@ class TestCommandActionsIgnoringDevices:
                     "powerstate": DSPowerState.LOW_POWER,
                 },
                 execute_command=mock.MagicMock(return_value=(None, "command_id_123")),
+                lrc_tracker=None,
                 read_attribute_value=mock.MagicMock(
                     return_value=(
                         json.dumps(
@@ -60,7 +62,8 @@ class TestCommandActionsIgnoringDevices:
         }
 
         self.dish_manager_cm_mock = mock.MagicMock(
-            _component_state={"dishmode": DishMode.STANDBY_LP}
+            _component_state={"dishmode": DishMode.STANDBY_LP},
+            component_state_changes=StateChangeNotifier(),
         )
         self.dish_manager_cm_mock.sub_component_managers = sub_component_managers_mock
 
@@ -0,0 +1,137 @@
+"""Unit tests verifying the decision tables compiled from the transition rules."""
+
+import logging
+import random
+import tracemalloc
+
+import pytest
+
+from ska_mid_dish_manager.models import transition_rules
+from ska_mid_dish_manager.models.decision_tables import DecisionTable, enum_label
+from ska_mid_dish_manager.models.dish_enums import (
+    DishMode,
+    DSOperatingMode,
+    DSPowerState,
+    IndexerPosition,
+    SPFOperatingMode,
+    SPFRxOperatingMode,
+)
+from ska_mid_dish_manager.models.dish_state_transition import StateTransition
+
+# Number of table entries cross checked against the rules per rule set
+SAMPLE_SIZE = 200
+
+
+def _stringify_for(rule_set_name):
+    return enum_label if rule_set_name.startswith("health") else str
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("rule_set_name", transition_rules.__all__)
+def test_decision_table_matches_rules(rule_set_name):
+    """The compiled table gives the same outcome as evaluating the rules directly."""
+    stringify = _stringify_for(rule_set_name)
+    table = DecisionTable(getattr(transition_rules, rule_set_name), stringify)
+
+    keys = list(table.table)
+    for key in random.Random(rule_set_name).sample(keys, min(SAMPLE_SIZE, len(keys))):
+        collapsed_states = {}
+        component_states = {}
+        for (device, attr), value in zip(table.fields, key):
+            collapsed_states.setdefault(device, {})[attr] = stringify(value)
+            component_states.setdefault(device, {})[attr] = value
+        assert table.lookup(component_states) == table.evaluate(collapsed_states), key
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("value", [None, 0])
+def test_untabulated_values_fall_back_to_rules(value):
+    """Values which are not of the expected enum are evaluated by the rules."""
+    table = DecisionTable(transition_rules.dish_mode_rules_ds_only)
+    component_states = {
+        "DS": {
+            "operatingmode": value,
+            "indexerposition": IndexerPosition.UNKNOWN,
+            "powerstate": DSPowerState.LOW_POWER,
+        }
+    }
+    with pytest.raises(KeyError):
+        table.lookup(component_states)
+
+    state_transition = StateTransition()
+    expected_mode = table.evaluate(
+        {"DS": {key: str(val) for key, val in component_states["DS"].items()}}
+    )
+    assert state_transition.compute_dish_mode(component_states["DS"]) == (
+        DishMode[expected_mode] if expected_mode else DishMode.UNKNOWN
+    )
+
+
+@pytest.mark.unit
+def test_parity_check_reports_mismatch(caplog):
+    """In parity mode a table disagreeing with the rules is logged and the rule result used."""
+    ds_component_state = dict(
+        operatingmode=DSOperatingMode.STANDBY,
+        indexerposition=IndexerPosition.UNKNOWN,
+        powerstate=DSPowerState.LOW_POWER,
+    )
+    spf_component_state = dict(operatingmode=SPFOperatingMode.STARTUP)
+    spfrx_component_state = dict(operatingmode=SPFRxOperatingMode.STANDBY)
+    args = (ds_component_state, spfrx_component_state, spf_component_state)
+    expected_dish_mode = StateTransition().compute_dish_mode(*args)
+
+    table = DecisionTable(transition_rules.dish_mode_rules_all_devices)
+    key = table.key(
+        {"DS": ds_component_state, "SPF": spf_component_state, "SPFRX": spfrx_component_state}
+    )
+    table.table[key] = "MAINTENANCE" if expected_dish_mode != DishMode.MAINTENANCE else "STOW"
+
+    state_transition = StateTransition(check_parity=True)
+    table_for = "ska_mid_dish_manager.models.dish_state_transition.decision_table_for"
+    with caplog.at_level(logging.ERROR), pytest.MonkeyPatch.context() as patch:
+        patch.setattr(table_for, lambda rules, stringify=str: table)
+        assert state_transition.compute_dish_mode(*args) == expected_dish_mode
+    assert "Decision table mismatch" in caplog.text
+
+
+def _allocations(func, *args):
+    """Return the number of memory blocks still held after calling func."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = func(*args)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del result
+    return sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+
+@pytest.mark.unit
+def test_projection_only_extracts_referenced_fields():
+    """Only the fields a rule set reads are extracted and stringified."""
+    table = DecisionTable(transition_rules.dish_mode_rules_all_devices)
+    component_states = {
+        "DS": dict(
+            operatingmode=DSOperatingMode.STANDBY,
+            indexerposition=IndexerPosition.UNKNOWN,
+            powerstate=DSPowerState.LOW_POWER,
+        ),
+        "SPF": dict(operatingmode=SPFOperatingMode.STARTUP),
+        "SPFRX": dict(operatingmode=SPFRxOperatingMode.STANDBY),
+    }
+    projected = StateTransition._project(component_states, table.fields)
+    assert projected == {
+        device: {attr: str(val) for attr, val in state.items()}
+        for device, state in component_states.items()
+    }
+
+    # Large non rule fields must not add to the work done per evaluation
+    baseline = _allocations(StateTransition._project, component_states, table.fields)
+    component_states["DS"]["achievedpointing"] = [0.0, 1.0, 2.0]
+    component_states["DS"]["healthinfo"] = ["info"] * 10
+    for band in ["b1", "b2", "b3", "b4", "b5a", "b5b"]:
+        component_states["DS"][f"band{band}pointingmodelparams"] = [float(i) for i in range(18)]
+    with_extras = _allocations(StateTransition._project, component_states, table.fields)
+    assert with_extras == baseline
+    assert "achievedpointing" not in StateTransition._project(component_states, table.fields)["DS"]
@@ -0,0 +1,149 @@
+"""Unit tests for the derived attribute dependency graph."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ska_mid_dish_manager.models.derived_attributes import DerivedAttribute, DerivedAttributeGraph
+from ska_mid_dish_manager.models.dish_enums import DishMode, DSOperatingMode, IndexerPosition
+
+
+@pytest.fixture
+def updates():
+    """Mocked update functions of the derived attributes."""
+    return {
+        "dishmode": MagicMock(),
+        "configuredband": MagicMock(),
+        "b1capabilitystate": MagicMock(),
+    }
+
+
+@pytest.fixture
+def graph(updates):
+    """Dependency graph with a dish mode, configured band and capability state."""
+    return DerivedAttributeGraph(
+        [
+            DerivedAttribute(
+                name="dishmode",
+                triggers=frozenset({"operatingmode", "indexerposition"}),
+                inputs=(("DS", "operatingmode"), ("DS", "indexerposition")),
+                update=updates["dishmode"],
+            ),
+            DerivedAttribute(
+                name="configuredband",
+                triggers=frozenset({"indexerposition"}),
+                inputs=(("DS", "indexerposition"),),
+                update=updates["configuredband"],
+            ),
+            DerivedAttribute(
+                name="b1capabilitystate",
+                triggers=frozenset({"operatingmode", "b1capabilitystate"}),
+                inputs=(("DM", "dishmode"), ("DS", "operatingmode")),
+                update=updates["b1capabilitystate"],
+            ),
+        ]
+    )
+
+
+@pytest.fixture
+def component_states():
+    """Component states keyed by device."""
+    return {
+        "DS": {
+            "operatingmode": DSOperatingMode.STANDBY,
+            "indexerposition": IndexerPosition.B1,
+        },
+        "DM": {"dishmode": DishMode.STANDBY_LP},
+    }
+
+
+@pytest.mark.unit
+def test_only_triggered_attributes_are_recomputed(graph, updates, component_states):
+    """Only the attributes depending on the reported keys are recomputed, in order."""
+    assert graph.recompute(["operatingmode"], component_states) == [
+        "dishmode",
+        "b1capabilitystate",
+    ]
+    updates["configuredband"].assert_not_called()
+
+    assert graph.recompute(["indexerposition", "kvalue"], component_states) == ["configuredband"]
+    assert graph.recompute(["kvalue"], component_states) == []
+
+
+@pytest.mark.unit
+def test_unchanged_inputs_are_not_recomputed(graph, updates, component_states):
+    """A trigger whose inputs are the same as the last computation is skipped."""
+    graph.recompute(["operatingmode"], component_states)
+    assert graph.recompute(["operatingmode", "b1capabilitystate"], component_states) == []
+    assert updates["dishmode"].call_count == 1
+
+    component_states["DM"]["dishmode"] = DishMode.STANDBY_FP
+    assert graph.recompute(["operatingmode"], component_states) == ["b1capabilitystate"]
+
+    component_states["DS"]["operatingmode"] = DSOperatingMode.STOW
+    assert graph.recompute(["operatingmode"], component_states) == [
+        "dishmode",
+        "b1capabilitystate",
+    ]
+
+
+@pytest.mark.unit
+def test_raw_int_is_not_mistaken_for_enum(graph, component_states):
+    """Clearing an attribute to its raw int value triggers a recompute once it is reloaded."""
+    graph.recompute(["indexerposition"], component_states)
+    component_states["DS"]["indexerposition"] = int(IndexerPosition.B1)
+    assert graph.recompute(["indexerposition"], component_states) == [
+        "dishmode",
+        "configuredband",
+    ]
+    component_states["DS"]["indexerposition"] = IndexerPosition.B1
+    assert graph.recompute(["indexerposition"], component_states) == [
+        "dishmode",
+        "configuredband",
+    ]
+
+
+@pytest.mark.unit
+def test_unpublished_update_is_retried(graph, updates, component_states):
+    """An update returning False is recomputed on the next trigger."""
+    updates["configuredband"].return_value = False
+    graph.recompute(["indexerposition"], component_states)
+    assert graph.recompute(["indexerposition"], component_states) == ["configuredband"]
+
+    updates["configuredband"].return_value = None
+    graph.recompute(["indexerposition"], component_states)
+    assert graph.recompute(["indexerposition"], component_states) == []
+
+
+@pytest.mark.unit
+def test_invalidate_forces_recompute(graph, component_states):
+    """Invalidated attributes are recomputed even if their inputs did not change."""
+    graph.recompute(["operatingmode", "indexerposition"], component_states)
+    graph.invalidate("configuredband")
+    assert graph.recompute(["operatingmode", "indexerposition"], component_states) == [
+        "configuredband"
+    ]
+    graph.invalidate()
+    assert graph.recompute(["indexerposition"], component_states) == [
+        "dishmode",
+        "configuredband",
+    ]
+
+
+@pytest.mark.unit
+def test_recompute_all_after_invalidate_recomputes_each_attribute_once(
+    graph, updates, component_states
+):
+    """Attributes recomputed by events since the invalidation are not recomputed again."""
+    graph.recompute(["operatingmode", "indexerposition"], component_states)
+    graph.invalidate()
+    assert graph.recompute(["indexerposition"], component_states) == [
+        "dishmode",
+        "configuredband",
+    ]
+    for update in updates.values():
+        update.reset_mock()
+    assert graph.recompute_all(component_states) == ["b1capabilitystate"]
+    updates["dishmode"].assert_not_called()
+    updates["b1capabilitystate"].assert_called_once()
+    assert graph.recompute_all(component_states) == []
@@ -7,7 +7,10 @@ from unittest import mock
 import pytest
 import tango
 
-from ska_mid_dish_manager.component_managers.device_proxy_factory import DeviceProxyManager
+from ska_mid_dish_manager.component_managers.device_proxy_factory import (
+    DeviceProxyManager,
+    DeviceProxyPool,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -87,3 +90,52 @@ class TestDeviceProxyManager:
 
         mock_dp_ping.assert_called_once()
         mock_dp_reconnect.assert_called_with(True)
+
+    def test_device_known_to_be_alive_is_not_pinged(self, patch_dp):
+        """Test the device is only pinged when its liveness is unknown."""
+        mock_dp = mock.Mock(name="the mock")
+        patch_dp.return_value = mock_dp
+
+        trl = "some/device/address"
+        self.dev_factory(trl)
+        self.dev_factory(trl)
+        mock_dp.ping.assert_called_once()
+        assert self.dev_factory.is_known_alive(trl)
+
+        self.dev_factory.mark_unknown(trl)
+        self.dev_factory(trl)
+        assert mock_dp.ping.call_count == 2
+
+        # the liveness expires after the TTL
+        with mock.patch(
+            "ska_mid_dish_manager.component_managers.device_proxy_factory.time.monotonic",
+            return_value=1e12,
+        ):
+            assert not self.dev_factory.is_known_alive(trl)
+            self.dev_factory(trl)
+        assert mock_dp.ping.call_count == 3
+
+    def test_device_proxies_are_shared_through_the_pool(self, patch_dp):
+        """Test managers sharing a pool share one proxy and its liveness per device."""
+        pool = DeviceProxyPool()
+        dev_factory = DeviceProxyManager(LOGGER, self.signal, proxy_pool=pool)
+        other_dev_factory = DeviceProxyManager(LOGGER, Event(), proxy_pool=pool)
+
+        trl = "some/device/address"
+        dp = dev_factory(trl)
+        assert other_dev_factory("SOME/device/address") is dp
+        patch_dp.assert_called_once_with(trl)
+        # the second manager did not ping the device the first one found alive
+        dp.ping.assert_called_once()
+        assert pool.ref_count(trl) == 2
+
+        # the proxy stays in the pool until its last user releases it
+        dev_factory.factory_reset()
+        assert pool.ref_count(trl) == 1
+        assert pool.is_known_alive(trl)
+        other_dev_factory.factory_reset()
+        assert pool.ref_count(trl) == 0
+        assert not pool.is_known_alive(trl)
+
+        dev_factory(trl)
+        assert patch_dp.call_count == 2
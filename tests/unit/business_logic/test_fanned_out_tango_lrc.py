@@ -11,6 +11,7 @@ from ska_mid_dish_manager.models.fanned_out_command import (
     FannedOutCommandStatus,
     FannedOutTangoLongRunningCommand,
 )
+from ska_mid_dish_manager.utils.lrc_tracker import LrcTracker
 
 LOGGER = logging.getLogger(__name__)
 LOGGER.setLevel(logging.DEBUG)
@@ -25,6 +26,7 @@ class TestFannedOutTangoLongRunningCommand:
         """Set up context."""
         self.device_component_manager = mock.MagicMock(
             _component_state={},
+            lrc_tracker=None,
         )
 
         self.command = FannedOutTangoLongRunningCommand(
@@ -293,3 +295,35 @@ class TestFannedOutTangoLongRunningCommand:
             self.command._update_status(mock.MagicMock())
 
         assert self.command._status == FannedOutCommandStatus.TIMED_OUT
+
+    @pytest.mark.unit
+    def test_update_status_uses_tracked_lrcs_without_reading(self):
+        """Test the tracked LRC entries are used instead of reading the LRC attributes."""
+        lrc_tracker = LrcTracker(LOGGER)
+        self.device_component_manager.lrc_tracker = lrc_tracker
+        self.command._status = FannedOutCommandStatus.IN_PROGRESS
+        self.command.awaited_component_state = {}
+
+        lrc_tracker.update("lrcqueue", (json.dumps({"uid": "command_id_123"}),))
+        lrc_tracker.update("lrcexecuting", ())
+        lrc_tracker.update("lrcfinished", ())
+        self.command._update_status(mock.MagicMock())
+        assert self.command._status == FannedOutCommandStatus.QUEUED
+
+        lrc_tracker.update(
+            "lrcfinished",
+            (
+                json.dumps(
+                    {
+                        "uid": "command_id_123",
+                        "result": "some result",
+                        "status": TaskStatus.COMPLETED.name,
+                    }
+                ),
+            ),
+        )
+        self.command._update_status(mock.MagicMock())
+        assert self.command._status == FannedOutCommandStatus.COMPLETED
+        assert self.command.executed_cmd_response == "some result"
+
+        self.device_component_manager.read_attribute_value.assert_not_called()
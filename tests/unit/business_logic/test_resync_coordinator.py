@@ -0,0 +1,79 @@
+"""Unit tests for the resync coordinator."""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+import pytest
+
+from ska_mid_dish_manager.models.resync_coordinator import ResyncCoordinator
+
+LOGGER = logging.getLogger(__name__)
+
+
+class _SlowDevice:
+    """Component manager stand-in whose monitored attribute reads take a while."""
+
+    def __init__(self, name, read_time_s, events):
+        self.name = name
+        self._read_time_s = read_time_s
+        self._events = events
+        self.read_attributes = None
+
+    def read_monitored_attributes_async(self, monitored_attributes=None):
+        self.read_attributes = monitored_attributes
+        future = Future()
+
+        def _reply():
+            time.sleep(self._read_time_s)
+            future.set_result({f"{self.name}_attr": self.name})
+
+        threading.Thread(target=_reply, daemon=True).start()
+        return future
+
+    def apply_monitored_attribute_values(self, values):
+        self._events.append(("apply", values))
+
+
+@pytest.mark.unit
+def test_devices_are_read_concurrently_and_applied_in_one_batch():
+    """A resync takes about as long as the slowest device and applies the values together."""
+    events = []
+
+    @contextmanager
+    def _batch_update():
+        events.append("batch_start")
+        yield
+        events.append("batch_end")
+
+    devices = [_SlowDevice(name, 0.3, events) for name in ("ds", "spf", "spfrx")]
+    coordinator = ResyncCoordinator(LOGGER, batch_update=_batch_update)
+
+    start = time.monotonic()
+    coordinator.resync(devices, {devices[0]: ("ds_attr",)})
+    assert time.monotonic() - start < 0.6
+
+    assert devices[0].read_attributes == ("ds_attr",)
+    assert devices[1].read_attributes is None
+    assert events == [
+        "batch_start",
+        ("apply", {"ds_attr": "ds"}),
+        ("apply", {"spf_attr": "spf"}),
+        ("apply", {"spfrx_attr": "spfrx"}),
+        "batch_end",
+    ]
+
+
+@pytest.mark.unit
+def test_devices_not_replying_in_time_are_skipped():
+    """Devices which have not replied by the timeout do not hold up the others."""
+    events = []
+    devices = [_SlowDevice("ds", 0.0, events), _SlowDevice("spf", 2.0, events)]
+    coordinator = ResyncCoordinator(LOGGER, timeout_s=0.5)
+
+    start = time.monotonic()
+    coordinator.resync(devices)
+    assert time.monotonic() - start < 1.5
+    assert events == [("apply", {"ds_attr": "ds"})]
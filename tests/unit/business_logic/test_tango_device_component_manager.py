@@ -8,9 +8,13 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 import tango
-from ska_control_model import CommunicationStatus
+from ska_control_model import CommunicationStatus, TaskStatus
 
 from ska_mid_dish_manager.component_managers.tango_device_cm import TangoDeviceComponentManager
+from ska_mid_dish_manager.models.constants import CIRCUIT_BREAKER_FAILURE_THRESHOLD
+from ska_mid_dish_manager.models.dish_enums import CircuitBreakerState
+from ska_mid_dish_manager.utils.circuit_breaker import CircuitOpenError
+from ska_mid_dish_manager.utils.state_updates import ComponentStateView
 
 LOGGER = logging.getLogger(__name__)
 
@@ -179,3 +183,268 @@ def test_device_goes_away(patch_cache_proxy, caplog):
     # wait a bit for the state to change
     communication_state_changed.wait(timeout=1)
     assert tc_manager.communication_state == CommunicationStatus.ESTABLISHED
+
+
+@pytest.mark.unit
+@patch("ska_mid_dish_manager.component_managers.tango_device_cm.CallbackScheduler")
+def test_events_are_dispatched_per_event_group(patched_callback_scheduler):
+    """Events are handed to the thread of their attribute's event group."""
+    tc_manager = TangoDeviceComponentManager(
+        "a/b/c",
+        LOGGER,
+        ("fast_Attr", "some_attr"),
+        event_groups={"fast_Attr": "fast"},
+    )
+    dispatched = {}
+    all_dispatched = Event()
+
+    def _dispatch_event(event):
+        dispatched[event.attr_name] = threading.current_thread().name
+        if len(dispatched) == 2:
+            all_dispatched.set()
+
+    tc_manager.dispatch_event = _dispatch_event
+    tc_manager._initialize_events_monitor()
+    register_event_callback = patched_callback_scheduler.return_value.register_event_callback
+    assert {call.args[-1] for call in register_event_callback.call_args_list} == {
+        tc_manager._route_event
+    }
+
+    for attr_name in ("fast_attr", "some_attr"):
+        event_data = construct_mock_valid_event_data(attr_name)
+        event_data.attr_name = f"tango://1.2.3.4:10000/a/b/c/{attr_name}"
+        tc_manager._route_event(event_data)
+
+    assert all_dispatched.wait(timeout=1)
+    assert len(set(dispatched.values())) == 2
+    tc_manager._stop_event_monitoring()
+    assert tc_manager._event_dispatcher is None
+
+
+@pytest.mark.unit
+@patch("ska_mid_dish_manager.component_managers.tango_device_cm.CallbackScheduler")
+def test_coalesced_attribute_delivers_latest_value(patched_callback_scheduler):
+    """Superseded events of a coalesced attribute are dropped and counted."""
+    tc_manager = TangoDeviceComponentManager(
+        "a/b/c",
+        LOGGER,
+        ("fast_attr", "some_attr"),
+        coalesced_attributes=("fast_Attr",),
+    )
+    consumer_blocked = Event()
+    release_consumer = Event()
+    dispatched = []
+    all_dispatched = Event()
+
+    def _dispatch_event(event):
+        dispatched.append(event.attr_value.value)
+        if event.attr_value.value == "block":
+            consumer_blocked.set()
+            release_consumer.wait(timeout=2)
+        if len(dispatched) == 4:
+            all_dispatched.set()
+
+    def _event(attr_name, value):
+        event_data = construct_mock_valid_event_data(attr_name)
+        event_data.attr_name = f"tango://1.2.3.4:10000/a/b/c/{attr_name}"
+        event_data.attr_value.value = value
+        return event_data
+
+    tc_manager.dispatch_event = _dispatch_event
+    tc_manager._initialize_events_monitor()
+
+    # hold up the single event thread while the events arrive
+    tc_manager._route_event(_event("some_attr", "block"))
+    assert consumer_blocked.wait(timeout=1)
+    for value in range(10):
+        tc_manager._route_event(_event("fast_attr", value))
+    tc_manager._route_event(_event("some_attr", "first"))
+    tc_manager._route_event(_event("some_attr", "second"))
+    release_consumer.set()
+
+    assert all_dispatched.wait(timeout=1)
+    # only the newest fast_attr value is processed, other attributes are unaffected
+    assert dispatched == ["block", 9, "first", "second"]
+    assert tc_manager.dropped_event_counts == {"fast_attr": 9}
+    tc_manager._stop_event_monitoring()
+
+
+@pytest.mark.unit
+@patch("ska_mid_dish_manager.component_managers.device_proxy_factory.tango")
+def test_unchanged_values_are_discarded_before_the_lock(patched_tango):
+    """Updates repeating the held value never take the lock or reach the callback."""
+    component_state_callback = MagicMock()
+    tc_manager = TangoDeviceComponentManager(
+        "a/b/c",
+        LOGGER,
+        ("some_attr", "other_attr"),
+        component_state_callback=component_state_callback,
+    )
+    tc_manager._component_state_lock = MagicMock(wraps=threading.Lock())
+
+    tc_manager._update_component_state(some_attr=1)
+    tc_manager._update_component_state(some_attr=1)
+    tc_manager._update_component_state(some_attr=1, other_attr=None)
+
+    component_state_callback.assert_called_once_with(some_attr=1)
+    assert tc_manager._component_state_lock.__enter__.call_count == 1
+    assert tc_manager.skipped_update_counts == {"some_attr": 2, "other_attr": 1}
+
+    # changed values in the same update still go through
+    tc_manager._update_component_state(some_attr=1, other_attr=2)
+    component_state_callback.assert_called_with(other_attr=2)
+    # unknown attributes are still rejected by the base component manager
+    with pytest.raises(KeyError):
+        tc_manager._update_component_state(unknown_attr=1)
+
+
+@pytest.mark.unit
+@patch("ska_mid_dish_manager.component_managers.device_proxy_factory.tango")
+def test_resync_values_are_only_compared_under_the_lock(patched_tango):
+    """Values applied by a resync are not discarded before taking the lock."""
+    component_state_callback = MagicMock()
+    tc_manager = TangoDeviceComponentManager(
+        "a/b/c",
+        LOGGER,
+        ("some_attr", "other_attr"),
+        component_state_callback=component_state_callback,
+    )
+    tc_manager._update_component_state(some_attr=1)
+    tc_manager._component_state_lock = MagicMock(wraps=threading.Lock())
+
+    tc_manager.apply_monitored_attribute_values({"some_attr": 1, "other_attr": 2})
+
+    assert tc_manager._component_state_lock.__enter__.call_count == 1
+    assert tc_manager.skipped_update_counts == {}
+    component_state_callback.assert_called_with(other_attr=2)
+
+    # events are still discarded before the lock afterwards
+    tc_manager._update_component_state(other_attr=2)
+    assert tc_manager._component_state_lock.__enter__.call_count == 1
+    assert tc_manager.skipped_update_counts == {"other_attr": 1}
+
+
+@pytest.mark.unit
+@patch("ska_mid_dish_manager.component_managers.device_proxy_factory.tango")
+def test_component_state_updates_publish_new_snapshots(patched_tango):
+    """Updates replace the published component state and never modify it."""
+    tc_manager = TangoDeviceComponentManager("a/b/c", LOGGER, ("some_attr", "other_attr"))
+    published = tc_manager._component_state
+
+    tc_manager._update_component_state(some_attr=1)
+    assert published["some_attr"] is None
+    assert tc_manager.component_state["some_attr"] == 1
+
+    published = tc_manager._component_state
+    tc_manager._update_component_state(some_attr=0, other_attr=0)
+    assert published["some_attr"] == 1
+    assert tc_manager.component_state == {"some_attr": 0, "other_attr": 0, "buildstate": ""}
+
+    # readers get their own copy
+    tc_manager.component_state["some_attr"] = 2
+    assert tc_manager.component_state["some_attr"] == 0
+
+
+@pytest.mark.unit
+@patch("ska_mid_dish_manager.component_managers.device_proxy_factory.tango")
+def test_component_state_view_follows_published_snapshots(patched_tango):
+    """A view of the component state sees every snapshot published after it was created."""
+    tc_manager = TangoDeviceComponentManager("a/b/c", LOGGER, ("some_attr",))
+    component_state_view = ComponentStateView(tc_manager)
+
+    tc_manager._update_component_state(some_attr=1)
+    assert component_state_view["some_attr"] == 1
+    tc_manager._update_component_state(some_attr=2)
+    assert dict(component_state_view) == {"some_attr": 2, "buildstate": ""}
+
+
+@pytest.mark.unit
+@patch("ska_mid_dish_manager.component_managers.device_proxy_factory.tango")
+def test_execute_command_async_returns_a_future(patched_tango):
+    """The command is invoked asynchronously and its reply resolves the returned future."""
+    tc_manager = TangoDeviceComponentManager("a/b/c", LOGGER, ("some_attr",))
+    tc_manager._update_communication_state(CommunicationStatus.ESTABLISHED)
+    device_proxy = patched_tango.DeviceProxy.return_value
+    callbacks = []
+    device_proxy.command_inout_asynch.side_effect = (
+        lambda command_name, command_arg, callback: callbacks.append(callback)
+    )
+
+    future = tc_manager.execute_command_async("Stow", None)
+    device_proxy.command_inout_asynch.assert_called_once()
+    assert not future.done()
+
+    callbacks[0](MagicMock(err=False, argout="1234_Stow"))
+    assert future.result(timeout=1) == (TaskStatus.IN_PROGRESS, "1234_Stow")
+
+    future = tc_manager.execute_command_async("Stow", None)
+    callbacks[1](MagicMock(err=True, errors=[MagicMock(desc="Command timed out")]))
+    assert future.result(timeout=1) == (TaskStatus.FAILED, "Command timed out")
+
+
+@pytest.mark.unit
+@patch("ska_mid_dish_manager.component_managers.device_proxy_factory.tango")
+def test_calls_fail_fast_while_the_circuit_breaker_is_open(patched_tango):
+    """Calls are not attempted on a device which could not be reached until it responds."""
+    circuit_breaker_callback = MagicMock()
+    tc_manager = TangoDeviceComponentManager(
+        "a/b/c",
+        LOGGER,
+        ("some_attr",),
+        circuit_breaker_callback=circuit_breaker_callback,
+    )
+    tc_manager._update_communication_state(CommunicationStatus.ESTABLISHED)
+    device_proxy = patched_tango.DeviceProxy.return_value
+    dev_error = tango.DevError()
+    dev_error.reason = "API_DeviceTimedOut"
+    dev_error.desc = "Timeout (5000 mS) exceeded on device a/b/c"
+    device_proxy.command_inout.side_effect = tango.DevFailed(dev_error)
+
+    for _ in range(CIRCUIT_BREAKER_FAILURE_THRESHOLD):
+        task_status, _ = tc_manager.execute_command("Stow", None)
+        assert task_status == TaskStatus.FAILED
+    assert tc_manager.circuit_breaker.state == CircuitBreakerState.OPEN
+    circuit_breaker_callback.assert_called_once_with(CircuitBreakerState.OPEN)
+
+    with pytest.raises(CircuitOpenError):
+        tc_manager.execute_command("Stow", None)
+    with pytest.raises(CircuitOpenError):
+        tc_manager.read_attribute_value("some_attr")
+    assert device_proxy.command_inout.call_count == CIRCUIT_BREAKER_FAILURE_THRESHOLD
+    device_proxy.read_attribute.assert_not_called()
+
+    # a valid event shows the device is back
+    tc_manager.dispatch_event(construct_mock_valid_event_data("some_attr"))
+    assert tc_manager.circuit_breaker.state == CircuitBreakerState.CLOSED
+    tc_manager.read_attribute_value("some_attr")
+    device_proxy.read_attribute.assert_called_once()
+
+
+@pytest.mark.unit
+@patch("ska_mid_dish_manager.component_managers.device_proxy_factory.tango")
+def test_read_monitored_attributes_async_returns_a_future(patched_tango):
+    """The monitored attributes are read in one asynchronous request resolving the future."""
+    tc_manager = TangoDeviceComponentManager("a/b/c", LOGGER, ("some_attr", "other_attr"))
+    device_proxy = patched_tango.DeviceProxy.return_value
+    callbacks = []
+    device_proxy.read_attributes_asynch.side_effect = lambda attr_names, callback: (
+        callbacks.append(callback)
+    )
+
+    future = tc_manager.read_monitored_attributes_async()
+    device_proxy.read_attributes_asynch.assert_called_once()
+    assert device_proxy.read_attributes_asynch.call_args.args[0] == ["some_attr", "other_attr"]
+    assert not future.done()
+
+    attr_value = MagicMock(value=1)
+    attr_value.name = "some_attr"
+    callbacks[0](MagicMock(err=False, argout=[attr_value]))
+    assert future.result(timeout=1) == {"some_attr": 1}
+    # reading does not update the component state until the values are applied
+    assert tc_manager.component_state["some_attr"] is None
+    tc_manager.apply_monitored_attribute_values(future.result())
+    assert tc_manager.component_state["some_attr"] == 1
+
+    future = tc_manager.read_monitored_attributes_async(("other_attr",))
+    callbacks[1](MagicMock(err=True, errors=[MagicMock(desc="Read timed out")]))
+    assert future.result(timeout=1) == {}
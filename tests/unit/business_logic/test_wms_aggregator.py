@@ -0,0 +1,86 @@
+"""Unit tests checking the shared WMS aggregator behaviour."""
+
+import logging
+from unittest import mock
+from unittest.mock import MagicMock
+
+import pytest
+from ska_control_model import CommunicationStatus
+
+from ska_mid_dish_manager.component_managers.wms_aggregator import WMSAggregator
+from ska_mid_dish_manager.component_managers.wms_cm import WMSComponentManager
+
+LOGGER = logging.getLogger(__name__)
+WMS_DEVICE_NAMES = ["ska-mid/weather-monitoring/1", "ska-mid/weather-monitoring/2"]
+
+
+def _subscriber(aggregator, wind_speed_moving_average_period=10.0, wind_gust_period=3.0):
+    """Return a WMS component manager subscribing to the aggregator."""
+    component_state = {}
+
+    def component_state_callback(**incoming_comp_state_change):
+        component_state.update(incoming_comp_state_change)
+
+    wms = WMSComponentManager(
+        WMS_DEVICE_NAMES,
+        logger=LOGGER,
+        aggregator=aggregator,
+        component_state_callback=component_state_callback,
+        wind_speed_moving_average_period=wind_speed_moving_average_period,
+        wind_gust_period=wind_gust_period,
+        meanwindspeed=-1,
+        windgust=-1,
+    )
+    return wms, component_state
+
+
+@mock.patch("ska_mid_dish_manager.component_managers.wms_cm.tango.Group")
+@pytest.mark.unit
+def test_wms_aggregator_polls_once_for_all_subscribers(mock_tango_group):
+    """Validate the stations are polled once and each profile gets its own windows."""
+    aggregator = WMSAggregator(WMS_DEVICE_NAMES, LOGGER)
+    aggregator._poller = MagicMock()
+    dish_1, dish_1_state = _subscriber(aggregator)
+    dish_2, dish_2_state = _subscriber(aggregator)
+    dish_3, dish_3_state = _subscriber(aggregator, wind_speed_moving_average_period=1.0)
+    # only the poller of the aggregator builds a device group and a polling executor
+    mock_tango_group.assert_called_once()
+    assert dish_1._wms_device_group is None and dish_1.executor is None
+
+    for wms in (dish_1, dish_2, dish_3):
+        wms.start_communicating()
+    aggregator._poller.start_communicating.assert_called_once()
+    assert aggregator.subscriber_count == 3
+
+    aggregator._publish([[100.0, 10], [100.0, 20]], 100.0)
+    aggregator._publish([[102.0, 30], [102.0, 30]], 102.0)
+
+    assert dish_1_state == dish_2_state == {"meanwindspeed": 22.5, "windgust": 30}
+    # the readings of the first cycle are outside of the shorter mean wind speed window
+    assert dish_3_state == {"meanwindspeed": 30.0, "windgust": 30}
+
+    aggregator._poller_communication_state_changed(CommunicationStatus.ESTABLISHED)
+    assert dish_2.communication_state == CommunicationStatus.ESTABLISHED
+
+    for wms in (dish_1, dish_2):
+        wms.stop_communicating()
+    aggregator._poller.stop_communicating.assert_not_called()
+    assert dish_1.communication_state == CommunicationStatus.DISABLED
+    dish_3.stop_communicating()
+    aggregator._poller.stop_communicating.assert_called_once()
+    assert aggregator.subscriber_count == 0
+
+
+@mock.patch("ska_mid_dish_manager.component_managers.wms_cm.tango.Group")
+@pytest.mark.unit
+def test_wms_aggregator_is_shared_per_set_of_stations(mock_tango_group, caplog):
+    """Validate dishes monitoring the same stations share one aggregator."""
+    aggregator = WMSAggregator.instance(WMS_DEVICE_NAMES, LOGGER)
+    assert WMSAggregator.instance(list(reversed(WMS_DEVICE_NAMES))) is aggregator
+    assert WMSAggregator.instance(WMS_DEVICE_NAMES[:1]) is not aggregator
+
+    # the settings of the first call are kept, a different polling period is warned about
+    with caplog.at_level(logging.WARNING):
+        assert WMSAggregator.instance(WMS_DEVICE_NAMES, wms_polling_period=2.0) is aggregator
+    assert aggregator._wms_polling_period == 1.0
+    assert "ignoring the requested polling period of 2.0s" in caplog.text
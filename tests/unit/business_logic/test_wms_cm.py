@@ -4,7 +4,6 @@ import logging
 import random
 import threading
 import time
-from collections import deque
 from functools import partial
 from unittest import mock
 from unittest.mock import MagicMock, Mock
@@ -12,7 +11,10 @@ from unittest.mock import MagicMock, Mock
 import pytest
 from ska_control_model import AdminMode, CommunicationStatus
 
-from ska_mid_dish_manager.component_managers.wms_cm import WMSComponentManager
+from ska_mid_dish_manager.component_managers.wms_cm import (
+    MAX_CONSECUTIVE_MISSED_REPLIES,
+    WMSComponentManager,
+)
 
 WMS_POLLING_PERIOD = 1.0
 WIND_GUST_PERIOD = 3.0
@@ -179,30 +181,180 @@ def test_wms_cm_flushes_expired_wind_speed_readings():
     )
 
     test_start_time = time.time()
-    sample_windspeed_buffer = deque()
 
     # Create a buffer of 10 valid and 10 invalid windspeed values.
     # Store the valid windspeeds in a separate list to validate
     # later that invalid windspeeds were removed from the buffer
     total_windspeed_sample_count = 20
+    sample_windspeeds = []
     expected_valid_windspeeds = []
-    for time_decrement in range(total_windspeed_sample_count):
+    for time_decrement in reversed(range(total_windspeed_sample_count)):
         ws_timestamp = test_start_time - time_decrement
         sample_windspeed = random.uniform(10, 40)
-        # Append left (opposite to wms_cm normal operation)
-        # as we are populating the buffer with the oldest values first
-        sample_windspeed_buffer.appendleft([ws_timestamp, sample_windspeed])
+        # Oldest values first, as in wms_cm normal operation
+        sample_windspeeds.append([ws_timestamp, sample_windspeed])
         if time_decrement <= MEAN_WIND_SPEED_PERIOD:
             expected_valid_windspeeds.append(sample_windspeed)
 
-    wms._prune_stale_windspeed_data(
-        test_start_time,
-        MEAN_WIND_SPEED_PERIOD,
-        sample_windspeed_buffer,
-    )
+    mean_wind_speed = wms._compute_mean_wind_speed(sample_windspeeds, test_start_time)
 
     # Validate that only valid windspeed values remain in the buffer
-    assert len(sample_windspeed_buffer) == len(expected_valid_windspeeds)
-    expected_valid_windspeeds.reverse()
-    for index, ws in enumerate(expected_valid_windspeeds):
-        assert sample_windspeed_buffer[index][1] == ws
+    assert len(wms._wind_speed_buffer) == len(expected_valid_windspeeds)
+    assert mean_wind_speed == pytest.approx(
+        sum(expected_valid_windspeeds) / len(expected_valid_windspeeds)
+    )
+
+
+def _group_reply(device_name, timestamp=None, value=None, error_reason=None):
+    """Mock a reply of a tango group attribute read, failed if an error reason is given."""
+    reply = MagicMock()
+    reply.has_failed.return_value = error_reason is not None
+    reply.get_err_stack.return_value = [MagicMock(reason=error_reason)]
+    reply.dev_name.return_value = device_name
+    reply.get_data.return_value.time.totime.return_value = timestamp
+    reply.get_data.return_value.value = value
+    return reply
+
+
+@mock.patch("ska_mid_dish_manager.component_managers.wms_cm.tango.Group")
+@pytest.mark.unit
+def test_wms_group_read_uses_the_source_timestamps(mock_tango_group):
+    """Validate each windspeed is stamped by its station and repeated values are dropped."""
+    wms = WMSComponentManager(
+        ["ska-mid/weather-monitoring/1", "ska-mid/weather-monitoring/2"],
+        logger=LOGGER,
+        wms_polling_period=WMS_POLLING_PERIOD,
+    )
+    group = mock_tango_group.return_value
+    group.read_attribute_reply.return_value = [
+        _group_reply("ska-mid/weather-monitoring/1", 101.0, 10),
+        _group_reply("ska-mid/weather-monitoring/2", 100.5, 20),
+    ]
+
+    assert wms.read_wms_group_attribute_value("windSpeed", timeout_ms=500) == [
+        [100.5, 20],
+        [101.0, 10],
+    ]
+    group.read_attribute_asynch.assert_called_once_with("windSpeed")
+    group.read_attribute_reply.assert_called_once_with(
+        group.read_attribute_asynch.return_value, 500
+    )
+
+    # station 1 has not updated its windspeed and station 2 failed to read it
+    group.read_attribute_reply.return_value = [
+        _group_reply("ska-mid/weather-monitoring/1", 101.0, 10),
+        _group_reply("ska-mid/weather-monitoring/2", error_reason="API_AttrNotAllowed"),
+    ]
+    assert wms.read_wms_group_attribute_value("windSpeed") == []
+    assert wms.communication_state == CommunicationStatus.NOT_ESTABLISHED
+
+
+@mock.patch("ska_mid_dish_manager.component_managers.wms_cm.tango.Group")
+@pytest.mark.unit
+def test_wms_group_read_skips_a_station_replying_late(mock_tango_group):
+    """Validate a late reply is skipped until the station misses several in a row."""
+    wms = WMSComponentManager(
+        ["ska-mid/weather-monitoring/1", "ska-mid/weather-monitoring/2"],
+        logger=LOGGER,
+        wms_polling_period=WMS_POLLING_PERIOD,
+    )
+    group = mock_tango_group.return_value
+
+    for cycle in range(MAX_CONSECUTIVE_MISSED_REPLIES - 1):
+        group.read_attribute_reply.return_value = [
+            _group_reply("ska-mid/weather-monitoring/1", 100.0 + cycle, 10),
+            _group_reply("ska-mid/weather-monitoring/2", error_reason="API_AsynReplyNotArrived"),
+        ]
+        assert wms.read_wms_group_attribute_value("windSpeed") == [[100.0 + cycle, 10]]
+        assert wms.communication_state == CommunicationStatus.ESTABLISHED
+
+    # a reply in time resets the count of missed replies
+    group.read_attribute_reply.return_value = [
+        _group_reply("ska-mid/weather-monitoring/2", 110.0, 20),
+    ]
+    assert wms.read_wms_group_attribute_value("windSpeed") == [[110.0, 20]]
+
+    group.read_attribute_reply.return_value = [
+        _group_reply("ska-mid/weather-monitoring/2", error_reason="API_AsynReplyNotArrived"),
+    ]
+    for _ in range(MAX_CONSECUTIVE_MISSED_REPLIES - 1):
+        wms.read_wms_group_attribute_value("windSpeed")
+        assert wms.communication_state == CommunicationStatus.ESTABLISHED
+    wms.read_wms_group_attribute_value("windSpeed")
+    assert wms.communication_state == CommunicationStatus.NOT_ESTABLISHED
+
+
+@pytest.mark.unit
+def test_wms_polling_keeps_its_cadence_with_a_slow_read():
+    """Validate a slow group read does not delay the following polling cycles."""
+    wms = WMSComponentManager(
+        ["ska-mid/weather-monitoring/1"],
+        logger=LOGGER,
+        component_state_callback=MagicMock(),
+        wms_polling_period=0.5,
+        meanwindspeed=-1,
+        windgust=-1,
+    )
+    clock = [100.0]
+    waits = []
+    read_durations = iter([0.4, 1.2, 0.4, 0.1])
+
+    def _read(*args, **kwargs):
+        clock[0] += next(read_durations)
+        return [[clock[0], 10]]
+
+    def _wait(timeout):
+        waits.append(timeout)
+        clock[0] += timeout
+        return False
+
+    wms.read_wms_group_attribute_value = Mock(side_effect=_read)
+    wms._stop_monitoring_flag = Mock()
+    wms._stop_monitoring_flag.is_set.side_effect = lambda: len(waits) >= 4
+    wms._stop_monitoring_flag.wait.side_effect = _wait
+    with mock.patch("ska_mid_dish_manager.component_managers.wms_cm.time") as mock_time:
+        mock_time.monotonic.side_effect = lambda: clock[0]
+        mock_time.time.side_effect = time.time
+        wms._run_wms_group_polling()
+
+    # cycles start every 0.5 s rather than 0.5 s after the previous read, and the cycle
+    # missed by the read taking longer than the polling period is skipped
+    assert waits == pytest.approx([0.1, 0.0, 0.1, 0.4])
+
+
+@mock.patch("ska_mid_dish_manager.component_managers.wms_cm.tango.Group")
+@pytest.mark.unit
+def test_wms_cm_refills_the_mean_wind_speed_from_the_wind_history(mock_tango_group, tmp_path):
+    """Validate the wind speeds polled before a restart are used for the mean wind speed."""
+    wind_history_path = str(tmp_path / "wind_history.bin")
+    wms = WMSComponentManager(
+        ["ska-mid/weather-monitoring/1"],
+        logger=LOGGER,
+        wms_polling_period=WMS_POLLING_PERIOD,
+        wind_speed_moving_average_period=MEAN_WIND_SPEED_PERIOD,
+        wind_history_path=wind_history_path,
+    )
+    now = time.time()
+    # the first reading is older than the mean wind speed window
+    wms._record_wind_history([[now - MEAN_WIND_SPEED_PERIOD - 5, 50]])
+    wms._record_wind_history([[now - 2, 10]])
+    wms._record_wind_history([[now - 1, 20]])
+    # stopping closes the file, releasing it for the restarted component manager
+    wms.stop_communicating()
+    assert wms._wind_history is None
+
+    restarted_wms = WMSComponentManager(
+        ["ska-mid/weather-monitoring/1"],
+        logger=LOGGER,
+        wms_polling_period=WMS_POLLING_PERIOD,
+        wind_speed_moving_average_period=MEAN_WIND_SPEED_PERIOD,
+        wind_history_path=wind_history_path,
+    )
+    restarted_wms.write_wms_group_attribute_value = Mock()
+    restarted_wms._run_wms_group_polling = Mock()
+    restarted_wms.start_communicating()
+
+    assert len(restarted_wms._wind_speed_buffer) == 2
+    assert restarted_wms._compute_mean_wind_speed([[now, 30]], now) == 20
+    restarted_wms.stop_communicating()
+    assert restarted_wms._wind_history is None
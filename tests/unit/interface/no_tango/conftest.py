@@ -7,7 +7,7 @@ import pytest
 from ska_control_model import CommunicationStatus, TaskStatus
 
 from ska_mid_dish_manager.component_managers.dish_manager_cm import DishManagerComponentManager
-from tests.utils import ComponentStateStore, MethodCallsStore
+from tests.utils import ComponentStateStore, MethodCallsStore, resolved_future
 
 LOGGER = logging.getLogger(__name__)
 
@@ -53,6 +53,7 @@ def component_manager(mock_command_tracker: MagicMock, callbacks: dict) -> Gener
             "ska_mid_dish_manager.component_managers.tango_device_cm.TangoDeviceComponentManager",
             write_attribute_value=MagicMock(),
             update_state_from_monitored_attributes=MagicMock(),
+            read_monitored_attributes_async=MagicMock(return_value=resolved_future({})),
             execute_command=MagicMock(side_effect=execute_command_side_effect),
             read_attribute_value=MagicMock(
                 return_value=(
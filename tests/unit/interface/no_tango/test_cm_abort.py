@@ -3,7 +3,7 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
-from ska_control_model import ResultCode, TaskStatus
+from ska_control_model import CommunicationStatus, ResultCode, TaskStatus
 
 from ska_mid_dish_manager.component_managers.dish_manager_cm import DishManagerComponentManager
 from ska_mid_dish_manager.models.dish_enums import DishMode
@@ -109,3 +109,26 @@ def test_abort_handler(
     # check that the component state reports the requested command
     component_manager._update_component_state(dishmode=DishMode.STANDBY_FP)
     component_state_cb.wait_for_value("dishmode", DishMode.STANDBY_FP)
+
+
+@pytest.mark.unit
+def test_abort_tasks_runs_with_communication_disabled(
+    component_manager: DishManagerComponentManager,
+) -> None:
+    """Verify tasks can be aborted internally while communication is disabled.
+
+    The stow and abort sequences abort the tasks whatever the communication state, only
+    the client abort commands check it.
+
+    :param component_manager: the component manager under test
+    """
+    component_manager.stop_communicating()
+    assert component_manager.communication_state == CommunicationStatus.DISABLED
+
+    generation = component_manager.component_state_changes.generation
+    component_manager.abort_tasks()
+    # the actions waiting on component state changes are woken up
+    assert component_manager.component_state_changes.generation > generation
+
+    with pytest.raises(ConnectionError, match="Commmunication with sub-components is disabled"):
+        component_manager.abort_commands()
@@ -0,0 +1,220 @@
+"""Tests dish manager component manager batching of derived component state updates."""
+
+import itertools
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from ska_mid_dish_manager.component_managers.dish_manager_cm import DishManagerComponentManager
+from ska_mid_dish_manager.models.dish_enums import (
+    DishMode,
+    DSOperatingMode,
+    DSPowerState,
+    IndexerPosition,
+    SPFOperatingMode,
+    SPFPowerState,
+    SPFRxOperatingMode,
+)
+from tests.utils import resolved_future
+
+
+@pytest.mark.unit
+def test_sub_device_event_publishes_one_component_state_update(
+    component_manager: DishManagerComponentManager, callbacks: dict
+) -> None:
+    """Verify all the updates derived from one sub-device event are published together.
+
+    :param component_manager: the component manager under test
+    :param callbacks: a dictionary of mocks, passed as callbacks to the command tracker under test
+    """
+    component_state_cb = callbacks["comp_state_cb"]
+    component_manager.sub_component_managers["SPF"]._update_component_state(
+        operatingmode=SPFOperatingMode.STANDBY_LP, powerstate=SPFPowerState.LOW_POWER
+    )
+    component_manager.sub_component_managers["SPFRX"]._update_component_state(
+        operatingmode=SPFRxOperatingMode.STANDBY
+    )
+    component_state_cb.get_queue_values(timeout=1)
+
+    commit_component_state = DishManagerComponentManager._commit_component_state
+    with patch.object(
+        DishManagerComponentManager,
+        "_commit_component_state",
+        autospec=True,
+        side_effect=commit_component_state,
+    ) as base_update:
+        component_manager.sub_component_managers["DS"]._update_component_state(
+            operatingmode=DSOperatingMode.STANDBY,
+            indexerposition=IndexerPosition.B1,
+            powerstate=DSPowerState.LOW_POWER,
+        )
+    dish_manager_updates = [
+        call for call in base_update.call_args_list if call.args[0] is component_manager
+    ]
+    assert len(dish_manager_updates) == 1
+    assert {"powerstate", "dishmode", "configuredband"} <= set(dish_manager_updates[0].kwargs)
+
+    # only the values which changed are reported, in a single callback
+    updates = component_state_cb.get_queue_values(timeout=1)
+    assert len(updates) == 1
+    assert "dishmode" in updates[0]
+    assert updates[0]["dishmode"] == DishMode.STANDBY_LP
+
+
+@pytest.mark.unit
+def test_component_state_transaction_defers_updates(
+    component_manager: DishManagerComponentManager, callbacks: dict
+) -> None:
+    """Verify updates in a transaction are visible through the view but published on exit.
+
+    :param component_manager: the component manager under test
+    :param callbacks: a dictionary of mocks, passed as callbacks to the command tracker under test
+    """
+    component_state_cb = callbacks["comp_state_cb"]
+    component_state_cb.get_queue_values(timeout=1)
+
+    with component_manager._component_state_transaction() as dish_manager_state:
+        component_manager._update_component_state(kvalue=3)
+        with component_manager._component_state_transaction():
+            component_manager._update_component_state(capturing=True)
+        assert dish_manager_state["kvalue"] == 3
+        assert component_manager.component_state["kvalue"] != 3
+        assert component_state_cb.get_queue_values(timeout=0.2) == []
+
+    assert component_state_cb.get_queue_values(timeout=1) == [{"kvalue": 3, "capturing": True}]
+
+
+@pytest.mark.unit
+def test_sync_component_states_only_reports_changed_values(
+    component_manager: DishManagerComponentManager, callbacks: dict
+) -> None:
+    """Verify a resync only publishes changes and recomputes the derived attributes once.
+
+    :param component_manager: the component manager under test
+    :param callbacks: a dictionary of mocks, passed as callbacks to the command tracker under test
+    """
+    component_state_cb = callbacks["comp_state_cb"]
+    ds_cm = component_manager.sub_component_managers["DS"]
+    ds_cm._update_component_state(
+        operatingmode=DSOperatingMode.STANDBY,
+        indexerposition=IndexerPosition.B1,
+        powerstate=DSPowerState.LOW_POWER,
+    )
+    component_state_cb.get_queue_values(timeout=1)
+
+    read_values = {
+        "operatingmode": DSOperatingMode.STANDBY,
+        "indexerposition": IndexerPosition.B1,
+        "powerstate": DSPowerState.LOW_POWER,
+    }
+    with (
+        patch.object(
+            ds_cm, "read_monitored_attributes_async", return_value=resolved_future(read_values)
+        ),
+        patch.object(
+            component_manager._derived_attributes,
+            "recompute_all",
+            wraps=component_manager._derived_attributes.recompute_all,
+        ) as recompute_all,
+    ):
+        component_manager.sync_component_states()
+
+    # nothing changed on DS so no sub-device value is cleared or republished
+    assert ds_cm.component_state["operatingmode"] == DSOperatingMode.STANDBY
+    assert component_state_cb.get_queue_values(timeout=0.2) == []
+    recompute_all.assert_called_once()
+
+
+@pytest.mark.unit
+def test_sync_component_states_publishes_one_dish_manager_update(
+    component_manager: DishManagerComponentManager, callbacks: dict
+) -> None:
+    """Verify the changes read from several sub-devices are published together.
+
+    :param component_manager: the component manager under test
+    :param callbacks: a dictionary of mocks, passed as callbacks to the command tracker under test
+    """
+    component_state_cb = callbacks["comp_state_cb"]
+    component_state_cb.get_queue_values(timeout=1)
+    ds_cm = component_manager.sub_component_managers["DS"]
+    spf_cm = component_manager.sub_component_managers["SPF"]
+
+    commit_component_state = DishManagerComponentManager._commit_component_state
+    with (
+        patch.object(
+            ds_cm,
+            "read_monitored_attributes_async",
+            return_value=resolved_future(
+                {
+                    "operatingmode": DSOperatingMode.STANDBY,
+                    "indexerposition": IndexerPosition.B1,
+                    "powerstate": DSPowerState.LOW_POWER,
+                }
+            ),
+        ),
+        patch.object(
+            spf_cm,
+            "read_monitored_attributes_async",
+            return_value=resolved_future(
+                {
+                    "operatingmode": SPFOperatingMode.STANDBY_LP,
+                    "powerstate": SPFPowerState.LOW_POWER,
+                }
+            ),
+        ),
+        patch.object(
+            DishManagerComponentManager,
+            "_commit_component_state",
+            autospec=True,
+            side_effect=commit_component_state,
+        ) as commit,
+    ):
+        component_manager.sync_component_states()
+
+    dish_manager_commits = [
+        call for call in commit.call_args_list if call.args[0] is component_manager
+    ]
+    assert len(dish_manager_commits) == 1
+    assert len(component_state_cb.get_queue_values(timeout=1)) == 1
+
+
+@pytest.mark.unit
+def test_sync_component_states_while_events_are_delivered(
+    component_manager: DishManagerComponentManager,
+) -> None:
+    """Verify a resync applying values does not deadlock with the events of the device.
+
+    The event thread holds the component state lock of the device while the dish manager
+    aggregates the update, the resync thread takes it to apply the values read.
+
+    :param component_manager: the component manager under test
+    """
+    spf_cm = component_manager.sub_component_managers["SPF"]
+    event_modes = itertools.cycle([SPFOperatingMode.STANDBY_LP, SPFOperatingMode.OPERATE])
+    read_modes = itertools.cycle([SPFOperatingMode.OPERATE, SPFOperatingMode.STANDBY_LP])
+    stop_events = threading.Event()
+
+    def _deliver_events():
+        while not stop_events.is_set():
+            spf_cm._update_component_state(operatingmode=next(event_modes))
+
+    def _resync():
+        for _ in range(50):
+            component_manager.sync_component_states()
+
+    with patch.object(
+        spf_cm,
+        "read_monitored_attributes_async",
+        side_effect=lambda *_: resolved_future({"operatingmode": next(read_modes)}),
+    ):
+        event_thread = threading.Thread(target=_deliver_events, daemon=True)
+        resync_thread = threading.Thread(target=_resync, daemon=True)
+        event_thread.start()
+        resync_thread.start()
+        resync_thread.join(timeout=10)
+        stop_events.set()
+        event_thread.join(timeout=10)
+
+    assert not resync_thread.is_alive()
+    assert not event_thread.is_alive()
@@ -15,6 +15,7 @@ from ska_mid_dish_manager.models.dish_enums import (
     SPFOperatingMode,
     SPFRxOperatingMode,
 )
+from tests.utils import resolved_future
 
 
 @pytest.fixture
@@ -45,6 +46,7 @@ def dish_manager_resources():
         # set up mocks for methods creating a device proxy to the sub component
         candidate_stub_methods = [
             "update_state_from_monitored_attributes",
+            "read_monitored_attributes_async",
             "write_attribute_value",
             "read_attribute_value",
             "execute_command",
@@ -52,6 +54,8 @@ def dish_manager_resources():
         for method_name in candidate_stub_methods:
             if method_name == "execute_command":
                 mock_method = Mock(return_value=(TaskStatus.IN_PROGRESS, "12345"))
+            elif method_name == "read_monitored_attributes_async":
+                mock_method = Mock(return_value=resolved_future({}))
             elif method_name == "read_attribute_value":
                 mock_method = Mock(
                     return_value=(
@@ -122,6 +126,7 @@ def dish_manager_resources_with_b5dc_monitoring():
         # set up mocks for methods creating a device proxy to the sub component
         candidate_stub_methods = [
             "update_state_from_monitored_attributes",
+            "read_monitored_attributes_async",
             "write_attribute_value",
             "read_attribute_value",
             "execute_command",
@@ -129,6 +134,8 @@ def dish_manager_resources_with_b5dc_monitoring():
         for method_name in candidate_stub_methods:
             if method_name == "execute_command":
                 mock_method = Mock(return_value=(TaskStatus.IN_PROGRESS, "some string"))
+            elif method_name == "read_monitored_attributes_async":
+                mock_method = Mock(return_value=resolved_future({}))
             else:
                 mock_method = Mock()
             setattr(ds_cm, method_name, mock_method)
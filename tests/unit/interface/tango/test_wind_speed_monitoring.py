@@ -2,7 +2,6 @@
 
 import threading
 import time
-from collections import deque
 from unittest import mock
 
 import pytest
@@ -15,6 +14,7 @@ from ska_mid_dish_manager.models.constants import (
     MEAN_WIND_SPEED_THRESHOLD_MPS,
     WIND_GUST_THRESHOLD_MPS,
 )
+from ska_mid_dish_manager.utils.window_statistics import RunningMean, WindowedMax
 
 
 @pytest.fixture
@@ -73,8 +73,8 @@ def configure_mocks_for_dish_manager():
 
         wms_cm._wind_speed_buffer_length = int(devices_count * (mean_avg_period / polling_period))
         wms_cm._wind_gust_buffer_length = int(gust_avg_period / polling_period)
-        wms_cm._wind_speed_buffer = deque(maxlen=wms_cm._wind_speed_buffer_length)
-        wms_cm._wind_gust_buffer = deque(maxlen=wms_cm._wind_gust_buffer_length)
+        wms_cm._wind_speed_buffer = RunningMean(mean_avg_period, wms_cm._wind_speed_buffer_length)
+        wms_cm._wind_gust_buffer = WindowedMax(gust_avg_period, wms_cm._wind_gust_buffer_length)
 
         yield device_proxy, wms_cm
 
@@ -0,0 +1,54 @@
+"""Unit tests for the latest value writer."""
+
+import threading
+
+import pytest
+
+from ska_mid_dish_manager.utils.schedulers import LatestValueWriter
+
+
+@pytest.mark.unit
+def test_latest_value_wins():
+    """Values submitted while a write is in progress are coalesced to the latest one."""
+    write_started = threading.Event()
+    release_write = threading.Event()
+    written = []
+
+    def _write(value):
+        write_started.set()
+        release_write.wait(timeout=2)
+        written.append(value)
+
+    writer = LatestValueWriter(_write, name="test_writer")
+    assert writer.submit(1)
+    assert write_started.wait(timeout=2)
+
+    # equal to the value being written
+    assert not writer.submit(1)
+    assert writer.submit(2)
+    assert writer.submit(3)
+    # equal to the value waiting to be written
+    assert not writer.submit(3)
+
+    release_write.set()
+    assert writer.wait_until_idle(timeout=2)
+    assert written == [1, 3]
+    assert writer.coalesced_count == 3
+
+
+@pytest.mark.unit
+def test_failed_write_does_not_stop_the_writer():
+    """A write raising an exception is logged and later values are still written."""
+    written = []
+
+    def _write(value):
+        if value == "fail":
+            raise RuntimeError("write failed")
+        written.append(value)
+
+    writer = LatestValueWriter(_write, name="test_writer")
+    writer.submit("fail")
+    assert writer.wait_until_idle(timeout=2)
+    writer.submit("ok")
+    assert writer.wait_until_idle(timeout=2)
+    assert written == ["ok"]
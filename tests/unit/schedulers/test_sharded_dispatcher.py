@@ -0,0 +1,101 @@
+"""Unit tests for the sharded dispatcher."""
+
+import threading
+import time
+
+import pytest
+
+from ska_mid_dish_manager.utils.schedulers import EventPriority, ShardedDispatcher
+
+
+@pytest.fixture
+def dispatcher():
+    """Dispatcher with a thread for each of two keys."""
+    sharded_dispatcher = ShardedDispatcher(2, name="test_dispatcher")
+    yield sharded_dispatcher
+    sharded_dispatcher.shutdown(timeout=2)
+
+
+@pytest.mark.unit
+def test_shard_count_must_be_positive():
+    """A dispatcher needs at least one thread."""
+    with pytest.raises(ValueError):
+        ShardedDispatcher(0)
+
+
+@pytest.mark.unit
+def test_keys_are_pinned_to_shards(dispatcher):
+    """Keys are spread over the shards in the order they are first seen."""
+    assert dispatcher.shard_for("operatingmode") == 0
+    assert dispatcher.shard_for("achievedpointing") == 1
+    assert dispatcher.shard_for("operatingmode") == 0
+    assert dispatcher.shard_for("healthstate") == 0
+
+
+@pytest.mark.unit
+def test_callbacks_with_the_same_key_run_in_order(dispatcher):
+    """Callbacks submitted with the same key run in submission order."""
+    results = {"a": [], "b": []}
+    for index in range(100):
+        dispatcher.submit("a", results["a"].append, index)
+        dispatcher.submit("b", results["b"].append, index)
+    dispatcher.shutdown(timeout=2)
+
+    assert results["a"] == list(range(100))
+    assert results["b"] == list(range(100))
+
+
+@pytest.mark.unit
+def test_slow_key_does_not_delay_other_keys(dispatcher):
+    """A backlog on one key does not hold up callbacks with a key on another shard."""
+    release = threading.Event()
+    processed = threading.Event()
+    for _ in range(10):
+        dispatcher.submit("achievedpointing", release.wait, 2)
+    dispatcher.submit("operatingmode", processed.set)
+
+    start = time.monotonic()
+    assert processed.wait(timeout=1)
+    assert time.monotonic() - start < 1
+    release.set()
+
+
+@pytest.mark.unit
+def test_failing_callback_does_not_stop_the_shard(dispatcher, caplog):
+    """An exception in a callback is logged and later callbacks still run."""
+    processed = threading.Event()
+
+    def _raise():
+        raise RuntimeError("callback failed")
+
+    dispatcher.submit("a", _raise)
+    dispatcher.submit("a", processed.set)
+    assert processed.wait(timeout=1)
+    assert "Error occurred running dispatched callback" in caplog.text
+
+
+@pytest.mark.unit
+def test_callbacks_after_shutdown_are_dropped(dispatcher):
+    """Nothing runs once the dispatcher is shut down."""
+    processed = threading.Event()
+    dispatcher.shutdown(timeout=2)
+    dispatcher.submit("a", processed.set)
+    assert not processed.wait(timeout=0.2)
+
+
+@pytest.mark.unit
+def test_high_priority_callbacks_overtake_queued_low_priority_ones():
+    """Queued high priority callbacks run before low priority ones, in order per priority."""
+    dispatcher = ShardedDispatcher(1, name="test_priority_dispatcher")
+    release = threading.Event()
+    results = []
+    dispatcher.submit("default", release.wait, 2)
+    for index in range(5):
+        dispatcher.submit("default", results.append, f"low_{index}", priority=EventPriority.LOW)
+    dispatcher.submit("default", results.append, "normal")
+    for index in range(2):
+        dispatcher.submit("default", results.append, f"high_{index}", priority=EventPriority.HIGH)
+    release.set()
+    dispatcher.shutdown(timeout=2)
+
+    assert results == ["high_0", "high_1", "normal"] + [f"low_{index}" for index in range(5)]
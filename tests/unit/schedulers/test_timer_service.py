@@ -0,0 +1,51 @@
+"""Unit tests for the timer service."""
+
+import threading
+import time
+
+import pytest
+
+from ska_mid_dish_manager.utils.schedulers import TimerService, WatchdogTimer
+
+
+@pytest.mark.unit
+def test_callbacks_run_in_deadline_order_unless_cancelled():
+    """Callbacks run once their deadline passes, earliest first, and cancelled ones do not."""
+    timer_service = TimerService(name="test_timer_service")
+    calls = []
+    done = threading.Event()
+
+    timer_service.call_later(0.3, lambda: (calls.append("last"), done.set()))
+    timer_service.call_later(0.1, lambda: calls.append("first"))
+    cancelled = timer_service.call_later(0.2, lambda: calls.append("cancelled"))
+    timer_service.cancel(cancelled)
+    assert len(timer_service) == 2
+
+    assert done.wait(timeout=2)
+    assert calls == ["first", "last"]
+    assert len(timer_service) == 0
+
+
+@pytest.mark.unit
+def test_watchdog_resets_do_not_start_threads():
+    """Resetting the watchdog reschedules its deadline without starting a thread."""
+    timer_service = TimerService(name="test_timer_service")
+    expired = threading.Event()
+    watchdog_timer = WatchdogTimer(
+        callback_on_timeout=expired.set, timeout=0.5, timer_service=timer_service
+    )
+    watchdog_timer.enable()
+    thread_count = threading.active_count()
+
+    for _ in range(1000):
+        watchdog_timer.reset()
+    assert threading.active_count() == thread_count
+    # the cancelled deadlines do not pile up
+    assert len(timer_service._heap) < 1000
+    assert len(timer_service) == 1
+
+    reset_time = time.monotonic()
+    watchdog_timer.reset()
+    assert expired.wait(timeout=2)
+    assert time.monotonic() - reset_time >= 0.5
+    assert not watchdog_timer.is_enabled()
@@ -0,0 +1,106 @@
+"""Unit tests for the read-only array values of spectrum attributes."""
+
+import logging
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+import tango
+
+from ska_mid_dish_manager.component_managers.tango_device_cm import TangoDeviceComponentManager
+from ska_mid_dish_manager.utils.arrays import read_only_array, values_equal
+
+LOGGER = logging.getLogger(__name__)
+
+
+@pytest.mark.unit
+def test_read_only_array_is_a_view():
+    """The event buffer is kept without copying and cannot be modified."""
+    buffer = np.array([1.0, 2.0, 3.0])
+    value = read_only_array(buffer)
+
+    assert type(value) is np.ndarray
+    assert np.shares_memory(value, buffer)
+    assert buffer.flags.writeable
+    assert read_only_array(value) is value
+    with pytest.raises(ValueError):
+        value[0] = 0.0
+
+
+@pytest.mark.unit
+def test_read_only_array_keeps_element_wise_semantics():
+    """Comparisons and slices of the view behave as for any other array."""
+    value = read_only_array(np.array([1.0, 2.0, 3.0]))
+
+    assert not bool((value > 5).any())
+    assert (value[:2] == [1.0, 2.0]).tolist() == [True, True]
+    with pytest.raises(ValueError):
+        bool(value == [1.0, 2.0, 3.0])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "other, expected",
+    [
+        ([1.0, 2.0, 3.0], True),
+        (np.array([1, 2, 3]), True),
+        ([1.0, 2.0], False),
+        ([1.0, 2.0, 4.0], False),
+        ([[1.0, 2.0, 3.0]], False),
+        (None, False),
+        (0, False),
+    ],
+)
+def test_values_equal_compares_arrays_by_value(other, expected):
+    """Arrays are change detected by shape and values."""
+    value = read_only_array(np.array([1.0, 2.0, 3.0]))
+
+    assert values_equal(value, other) is expected
+    assert values_equal(other, value) is expected
+
+
+@pytest.mark.unit
+def test_values_equal_nan_and_other_values():
+    """NaN values compare equal and other values are compared as usual."""
+    assert values_equal(np.array([np.nan, 1.0]), [np.nan, 1.0])
+    assert values_equal(np.array(["a", "b"]), ["a", "b"])
+    assert not values_equal(np.array(["a", "b"]), ["a", "c"])
+    assert values_equal(1.0, 1)
+    assert not values_equal("a", "b")
+
+
+@pytest.mark.unit
+@patch("ska_mid_dish_manager.component_managers.device_proxy_factory.tango")
+def test_unchanged_array_events_are_not_pushed(patched_tango):
+    """Array events only update the component state when the values change."""
+    component_state_callback = MagicMock()
+    tc_manager = TangoDeviceComponentManager(
+        "a/b/c",
+        LOGGER,
+        ("achievedPointing",),
+        component_state_callback=component_state_callback,
+    )
+
+    def _event(value):
+        attr_value = MagicMock()
+        attr_value.name = "achievedPointing"
+        attr_value.quality = tango.AttrQuality.ATTR_VALID
+        attr_value.value = value
+        event_data = tango.EventData()
+        event_data.attr_value = attr_value
+        event_data.err = False
+        return event_data
+
+    buffer = np.array([1.0, 2.0, 3.0])
+    tc_manager._update_state_from_event(_event(buffer))
+    tc_manager._update_state_from_event(_event(np.array([1.0, 2.0, 3.0])))
+    tc_manager._update_state_from_event(_event(np.array([1.0, 2.0, 4.0])))
+
+    pushed = [
+        call.kwargs["achievedpointing"]
+        for call in component_state_callback.call_args_list
+        if "achievedpointing" in call.kwargs
+    ]
+    assert len(pushed) == 2
+    assert np.shares_memory(pushed[0], buffer)
+    assert np.array_equal(pushed[1], [1.0, 2.0, 4.0])
@@ -0,0 +1,69 @@
+"""Unit tests for the sub-device circuit breaker."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ska_mid_dish_manager.models.dish_enums import CircuitBreakerState
+from ska_mid_dish_manager.utils.circuit_breaker import CircuitBreaker
+
+
+@pytest.mark.unit
+@patch("ska_mid_dish_manager.utils.circuit_breaker.time.monotonic")
+def test_circuit_breaker_states(mock_monotonic):
+    """The breaker opens on consecutive failures and lets one trial through after a while."""
+    mock_monotonic.return_value = 100.0
+    state_callback = MagicMock()
+    breaker = CircuitBreaker(
+        failure_threshold=2, reset_timeout_s=10.0, state_callback=state_callback
+    )
+
+    # a success in between resets the failure count
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreakerState.CLOSED
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreakerState.OPEN
+    assert not breaker.allow_request()
+
+    # a single trial is let through once the reset timeout has passed
+    mock_monotonic.return_value = 110.0
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreakerState.HALF_OPEN
+    assert not breaker.allow_request()
+
+    # the failed trial opens the breaker again
+    breaker.record_failure()
+    assert breaker.state == CircuitBreakerState.OPEN
+    assert not breaker.allow_request()
+
+    # a trial whose outcome is never recorded is given up after the reset timeout
+    mock_monotonic.return_value = 120.0
+    assert breaker.allow_request()
+    mock_monotonic.return_value = 130.0
+    assert breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreakerState.CLOSED
+    assert [call.args[0] for call in state_callback.call_args_list] == [
+        CircuitBreakerState.OPEN,
+        CircuitBreakerState.HALF_OPEN,
+        CircuitBreakerState.OPEN,
+        CircuitBreakerState.HALF_OPEN,
+        CircuitBreakerState.CLOSED,
+    ]
+
+
+@pytest.mark.unit
+def test_circuit_breaker_trip_opens_straight_away():
+    """Losing the device heartbeat opens the breaker without waiting for failures."""
+    breaker = CircuitBreaker()
+    breaker.trip()
+    assert breaker.state == CircuitBreakerState.OPEN
+    assert not breaker.allow_request()
+
+    breaker.reset()
+    assert breaker.state == CircuitBreakerState.CLOSED
@@ -0,0 +1,68 @@
+"""Unit tests for tracking long running commands from the LRC attribute events."""
+
+import json
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+import tango
+
+from ska_mid_dish_manager.component_managers.tango_device_cm import TangoDeviceComponentManager
+from ska_mid_dish_manager.utils.lrc_tracker import LRC_ATTRIBUTES, LrcTracker
+
+LOGGER = logging.getLogger(__name__)
+
+
+@pytest.mark.unit
+def test_lrc_tracker_indexes_entries_by_uid():
+    """Each update replaces the table of the attribute and notifies the waiters."""
+    update_callback = MagicMock()
+    lrc_tracker = LrcTracker(LOGGER, update_callback=update_callback)
+    assert lrc_tracker.table("lrcfinished") is None
+
+    finished = {"uid": "123_Stow", "status": "COMPLETED", "result": "done"}
+    lrc_tracker.update("lrcfinished", (json.dumps(finished), "not-json"))
+    assert lrc_tracker.table("lrcfinished") == {"123_Stow": finished}
+    update_callback.assert_called_once_with()
+
+    lrc_tracker.update("lrcfinished", ())
+    assert lrc_tracker.table("lrcfinished") == {}
+
+    lrc_tracker.forget("lrcfinished")
+    assert lrc_tracker.table("lrcfinished") is None
+
+
+@pytest.mark.unit
+@patch("ska_mid_dish_manager.component_managers.tango_device_cm.CallbackScheduler")
+@patch("ska_mid_dish_manager.component_managers.device_proxy_factory.tango")
+def test_lrc_attribute_events_update_the_tracker(patched_tango, patched_callback_scheduler):
+    """The LRC attributes are subscribed to and their events update the tracker."""
+    lrc_update_callback = MagicMock()
+    tc_manager = TangoDeviceComponentManager(
+        "a/b/c",
+        LOGGER,
+        ("operatingMode",),
+        track_lrcs=True,
+        lrc_update_callback=lrc_update_callback,
+    )
+    tc_manager._initialize_events_monitor()
+    register_event_callback = patched_callback_scheduler.return_value.register_event_callback
+    lrc_subscriptions = {
+        call.args[1]: call.args[-1]
+        for call in register_event_callback.call_args_list
+        if call.args[1] in LRC_ATTRIBUTES
+    }
+    assert set(lrc_subscriptions) == set(LRC_ATTRIBUTES)
+    assert "lrcfinished" not in tc_manager.component_state
+
+    event_data = tango.EventData()
+    event_data.attr_name = "tango://localhost:10000/a/b/c/lrcexecuting"
+    event_data.attr_value = MagicMock(value=(json.dumps({"uid": "123_Stow"}),))
+    event_data.err = False
+    lrc_subscriptions["lrcexecuting"](event_data)
+    assert "123_Stow" in tc_manager.lrc_tracker.table("lrcexecuting")
+    lrc_update_callback.assert_called_once_with()
+
+    event_data.err = True
+    lrc_subscriptions["lrcexecuting"](event_data)
+    assert tc_manager.lrc_tracker.table("lrcexecuting") is None
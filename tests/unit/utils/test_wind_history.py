@@ -0,0 +1,38 @@
+"""Unit tests for the wind history ring file."""
+
+import pytest
+
+from ska_mid_dish_manager.utils.wind_history import WindHistoryFile
+
+
+@pytest.mark.unit
+def test_wind_history_keeps_the_latest_readings_across_reopening(tmp_path):
+    """The ring keeps the latest readings in order, and they survive reopening the file."""
+    path = str(tmp_path / "wms" / "wind_history.bin")
+    wind_history = WindHistoryFile(path, capacity=4)
+    wind_history.append([[100.0, 10.0], [101.0, None], [102.0, 12.0]])
+    wind_history.append([[103.0, 13.0], [104.0, 14.0]])
+    wind_history.close()
+
+    wind_history = WindHistoryFile(path, capacity=4)
+    assert len(wind_history) == 4
+    assert wind_history.readings() == [[101.0, None], [102.0, 12.0], [103.0, 13.0], [104.0, 14.0]]
+    assert wind_history.readings(since=103.0) == [[103.0, 13.0], [104.0, 14.0]]
+    wind_history.close()
+
+    # a file written with another capacity is started afresh
+    wind_history = WindHistoryFile(path, capacity=8)
+    assert wind_history.readings() == []
+    wind_history.close()
+
+
+@pytest.mark.unit
+def test_wind_history_is_locked_while_open(tmp_path):
+    """A second opening of the file fails until the first one is closed."""
+    path = str(tmp_path / "wind_history.bin")
+    wind_history = WindHistoryFile(path, capacity=4)
+    with pytest.raises(OSError, match="in use by another process"):
+        WindHistoryFile(path, capacity=4)
+
+    wind_history.close()
+    WindHistoryFile(path, capacity=4).close()
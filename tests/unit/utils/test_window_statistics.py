@@ -0,0 +1,50 @@
+"""Unit tests for the sliding time window statistics."""
+
+import random
+
+import pytest
+
+from ska_mid_dish_manager.utils.window_statistics import RunningMean, WindowedMax
+
+
+@pytest.mark.unit
+def test_running_mean_matches_the_mean_of_the_window():
+    """The running mean equals the mean recomputed from the samples left in the window."""
+    rng = random.Random(0)
+    running_mean = RunningMean(window_s=10.0, maxlen=25)
+    samples = []
+    for timestamp in range(100):
+        poll = [[timestamp, rng.choice([None, rng.uniform(0, 40)])] for _ in range(3)]
+        samples = (samples + poll)[-25:]
+        samples = [sample for sample in samples if sample[0] >= timestamp - 10.0]
+        running_mean.extend(poll)
+        running_mean.prune(timestamp)
+
+        valid = [value for _, value in samples if value is not None]
+        assert len(running_mean) == len(samples)
+        assert running_mean.value == pytest.approx(sum(valid) / len(valid) if valid else 0.0)
+
+    running_mean.clear()
+    assert len(running_mean) == 0
+    assert running_mean.value == 0.0
+
+
+@pytest.mark.unit
+def test_windowed_max_matches_the_max_of_the_window():
+    """The windowed maximum equals the maximum of the samples left in the window."""
+    rng = random.Random(0)
+    windowed_max = WindowedMax(window_s=3.0, maxlen=4)
+    samples = []
+    for timestamp in range(100):
+        sample = [timestamp, rng.choice([None, rng.uniform(0, 40), 20.0])]
+        samples = (samples + [sample])[-4:]
+        samples = [sample for sample in samples if sample[0] >= timestamp - 3.0]
+        windowed_max.append(sample)
+        windowed_max.prune(timestamp)
+
+        valid = [value for _, value in samples if value is not None]
+        assert len(windowed_max) == len(samples)
+        assert windowed_max.value == (max(valid) if valid else None)
+
+    windowed_max.clear()
+    assert windowed_max.value is None
@@ -6,6 +6,7 @@ import queue
 import random
 import string
 import time
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Tuple
 
@@ -708,6 +709,13 @@ def set_ignored_devices(device_proxy, ignore_spf, ignore_spfrx, ignore_b5dc):
         device_proxy.unsubscribe_event(b5dc_sub_id)
 
 
+def resolved_future(result: Any) -> Future:
+    """Return a future which is already resolved to the result."""
+    future: Future = Future()
+    future.set_result(result)
+    return future
+
+
 def generate_random_text(length=10):
     """Generate a random string."""
     letters = string.ascii_letters